@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN201, ANN001, B011, E402
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+import warnings
+from importlib.metadata import EntryPoint
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+import jgdv.cli
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.arg_parser_model import DootArgParserModel
+from doot.control.main import DootMain
+from doot.control.runner.parallel_runner import DootParallelRunner
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from .. import run_cmd as run_mod
+from .._interface import Command_p
+from ..run_cmd import RunCmd
+
+# # End of Imports.
+
+logging = logmod.root
+
+##--|
+PLUGINS = ChainGuard({
+    "tracker" : [EntryPoint(name="default",  group="doot.plugins.tracker", value="doot.control.tracker:NaiveTracker")],
+    "runner"  : [EntryPoint(name="default",  group="doot.plugins.runner",  value="doot.control.runner:DootParallelRunner")],
+})
+
+def parse_cli(cmd:RunCmd, *args:str) -> ChainGuard:
+    """ Parse cli args for a run cmd the way the cli does, into the shape of doot.args """
+    parser = jgdv.cli.ParseMachine(DootArgParserModel())
+    report = parser(["doot", "run", *args], prog=DootMain(), cmds=[cmd], subs=[], implicits={})
+    return ChainGuard(report.to_dict())
+
+##--|
+
+class TestRunCmd:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_initial(self):
+        obj = RunCmd()
+        assert(isinstance(obj, Command_p))
+
+    def test_cli_jobs_sets_runner_jobs(self, mocker):
+        obj        = RunCmd()
+        obj._name  = "run"
+        mocker.patch("doot.args", new=parse_cli(obj, "--jobs", "8"))
+        _, runner = obj._create_tracker_and_runner(0, PLUGINS)
+        assert(isinstance(runner, DootParallelRunner))
+        assert(runner.jobs == 8)
+
+    def test_cli_without_jobs_keeps_runner_default(self, mocker):
+        obj        = RunCmd()
+        obj._name  = "run"
+        mocker.patch("doot.args", new=parse_cli(obj))
+        default    = DootParallelRunner(tracker=mocker.Mock()).jobs
+        _, runner  = obj._create_tracker_and_runner(0, PLUGINS)
+        assert(runner.jobs == default)
+
+    def test_cli_confirm_shows_plan(self, mocker):
+        obj        = RunCmd()
+        obj._name  = "run"
+        mocker.patch("doot.args", new=parse_cli(obj, "--confirm"))
+        runner     = mocker.Mock()
+        runner.tracker.plan.return_value = []
+        mocker.patch("builtins.input", return_value="n")
+        assert(not obj._confirm_plan(0, runner))
+        runner.tracker.plan.assert_called_once()
+
+    def test_cli_without_confirm_skips_plan(self, mocker):
+        obj        = RunCmd()
+        obj._name  = "run"
+        mocker.patch("doot.args", new=parse_cli(obj))
+        runner     = mocker.Mock()
+        assert(obj._confirm_plan(0, runner))
+        runner.tracker.plan.assert_not_called()
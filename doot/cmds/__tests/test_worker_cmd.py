@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN201, ANN001, B011, E402
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+import warnings
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+import jgdv.cli
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.arg_parser_model import DootArgParserModel
+from doot.control.main import DootMain
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from .._interface import Command_p
+from ..worker_cmd import ADDRESS, WorkerCmd
+
+# # End of Imports.
+
+logging = logmod.root
+
+##--|
+
+def parse_cli(cmd:WorkerCmd, *args:str) -> ChainGuard:
+    """ Parse cli args for a worker cmd the way the cli does, into the shape of doot.args """
+    parser = jgdv.cli.ParseMachine(DootArgParserModel())
+    report = parser(["doot", "worker", *args], prog=DootMain(), cmds=[cmd], subs=[], implicits={})
+    return ChainGuard(report.to_dict())
+
+##--|
+
+class TestWorkerCmd:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_initial(self):
+        obj = WorkerCmd()
+        assert(isinstance(obj, Command_p))
+
+    def test_cli_address(self, mocker):
+        obj    = WorkerCmd(name="worker")
+        serve  = mocker.patch("doot.cmds.worker_cmd.serve", return_value=0)
+        mocker.patch("doot.args", new=parse_cli(obj, "--address=unix:/tmp/doot.sock"))
+        obj(idx=0, tasks=ChainGuard({}), plugins=ChainGuard({}))
+        serve.assert_called_once_with("unix:/tmp/doot.sock")
+
+    def test_cli_default_address(self, mocker):
+        obj    = WorkerCmd(name="worker")
+        serve  = mocker.patch("doot.cmds.worker_cmd.serve", return_value=0)
+        mocker.patch("doot.args", new=parse_cli(obj))
+        obj(idx=0, tasks=ChainGuard({}), plugins=ChainGuard({}))
+        serve.assert_called_once_with(ADDRESS)
@@ -28,7 +28,10 @@ from jgdv.util.plugins.selector import plugin_selector
 
 # ##-- 1st party imports
 import doot
+from doot.control.runner._interface import ParallelRunner_p
+from doot.control.loaders.lazy_specs import LazySpec, LazySpecs
 from doot.control.runner.step_runner import DootStepRunner
+from doot.control.tracker._interface import ExecutionPolicy_e
 from doot.workflow.check_locs import CheckLocsTask
 
 # ##-- end 1st party imports
@@ -75,6 +78,7 @@ runner_target      : Final       = doot.config.on_fail("default", str).settings.
 reporter_target    : Final       = doot.config.on_fail("default", str).settings.commands.run.reporter()
 interrupt_handler  : Final       = doot.config.on_fail("jgdv.debugging:SignalHandler", bool|str).settings.commands.run.interrupt()
 check_locs         : Final       = doot.config.on_fail(False).settings.commands.run.location_check.active()  # noqa: FBT003
+plan_policy        : Final[str]  = doot.config.on_fail("PRIORITY", str).settings.commands.run.policy()
 
 CONFIRM            : Final[str]  = "Y"
 ##--|
@@ -84,7 +88,7 @@ class RunCmd(BaseCommand):
     _name  = "run"
     _help  = tuple(["Will perform the tasks/jobs targeted.",
                    "Can be parameterized in a commands.run block with:",
-                   "tracker(str), runner(str)",
+                   "tracker(str), runner(str), jobs(int)",
                    ])
 
     @override
@@ -95,6 +99,7 @@ class RunCmd(BaseCommand):
             self.build_param(name="--step",      default=False, type=bool, desc="Interrupt between workflow step"),
             self.build_param(name="--dry-run",   default=False, type=bool, desc="Don't perform actions"),
             self.build_param(name="--confirm",   default=False, type=bool, desc="Confirm the expected workflow plan"),
+            self.build_param(name="--jobs",      default=0,     type=int,  desc="Number of tasks to run at once, for parallel runners"),
             ]
 
     def __call__(self, *, idx:int, tasks:ChainGuard, plugins:ChainGuard):
@@ -136,18 +141,24 @@ class RunCmd(BaseCommand):
                 raise TypeError(type(x))
 
         match plugin_selector(runners, target=runner_target):
-            case _ if doot.args.on_fail(False).cmd[self.name][idx].args.step():  # noqa: FBT003
+            case _ if doot.args.on_fail(False).cmds[self.name][idx].args.step():  # noqa: FBT003
                 runner = DootStepRunner(tracker=tracker)
             case type() as x:
                 runner = x(tracker=tracker)
             case x:
                 raise TypeError(type(x))
 
+        match runner, doot.args.on_fail(0).cmds[self.name][idx].args.jobs():
+            case ParallelRunner_p(), int() as jobs if 0 < jobs:
+                runner.jobs = jobs
+            case _:
+                pass
+
         return tracker, runner
 
     def _choose_interrupt_handler(self, idx:int) -> Maybe[bool|type|ContextManager]:
         match interrupt_handler:
-            case _ if not doot.args.on_fail(False).cmd[self.name][idx].args.interrupt():  # noqa: FBT003
+            case _ if not doot.args.on_fail(False).cmds[self.name][idx].args.interrupt():  # noqa: FBT003
                 return None
             case None:
                 return None
@@ -163,9 +174,14 @@ class RunCmd(BaseCommand):
 
 
     def _register_specs(self, idx:int, tracker:WorkflowTracker_p, tasks:ChainGuard) -> None:
-        doot.report.gen.trace("Registering Task Specs: %s", len(tasks))
-        for task in tasks.values():
-            tracker.register(task)
+        match [x for x in tasks.values() if isinstance(x, LazySpec)]:
+            case []:
+                doot.report.gen.trace("Registering Task Specs: %s", len(tasks))
+                tracker.register(*tasks.values())
+            case [*_]:
+                # Specs are only built and registered when the run needs them
+                doot.report.gen.trace("Indexing Lazy Task Specs: %s", len(tasks))
+                tracker.set_spec_source(LazySpecs(tasks.values()))
 
         match CheckLocsTask():
             case x if bool(x.spec.actions) and check_locs:
@@ -189,11 +205,11 @@ class RunCmd(BaseCommand):
 
     def _confirm_plan(self, idx:int, runner:WorkflowRunner_p) -> bool:
         """ Generate and Confirm the plan from the tracker"""
-        if not doot.args.on_fail(False).cmd[self.name][idx].args.confirm():  # noqa: FBT003
+        if not doot.args.on_fail(False).cmds[self.name][idx].args.confirm():  # noqa: FBT003
             return True
 
         tracker  = runner.tracker
-        plan     = tracker.generate_plan()
+        plan     = tracker.plan(policy=ExecutionPolicy_e[plan_policy.upper()])
         for i,(depth,node,_desc) in enumerate(plan):
             doot.report.gen.trace("(D:%s) Step %-4s: %s", depth, i, node)
         else:
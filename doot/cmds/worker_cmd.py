@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+A Command to run as a worker for a 'remote' runner,
+pulling and running batches of tasks until the coordinator stops it.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Proto
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.control.runner.remote_runner import ADDRESS, serve
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from ._base import BaseCommand
+from ._interface import Command_p
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from jgdv.structs.chainguard import ChainGuard
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+@Proto(Command_p)
+class WorkerCmd(BaseCommand):
+    _name  = "worker"
+    _help  = tuple(["Connect to a 'remote' runner, and run the tasks it sends.",
+                    "The token is read from $DOOT_WORKER_TOKEN",
+                    "Defaults to the address in settings.commands.run.workers",
+                    ])
+
+    @override
+    def param_specs(self) -> list:
+        return [
+            *super().param_specs(),
+            self.build_param(name="--address=", default=ADDRESS, type=str, desc="The coordinator to connect to, as 'host:port' or 'unix:path'"),
+            ]
+
+    def __call__(self, *, idx:int, tasks:ChainGuard, plugins:ChainGuard):  # noqa: ARG002
+        address = doot.args.on_fail(ADDRESS, str).cmds[self.name][idx].args.address()
+        doot.report.gen.user("Worker connecting to: %s", address)
+        try:
+            count = serve(address)
+        except OSError as err:
+            raise doot.errors.CommandError("Worker lost its coordinator", address, err) from err
+        else:
+            doot.report.gen.user("Worker finished, after %s batches", count)
@@ -19,6 +19,8 @@ from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
 
 # ##-- 3rd party imports
 import pytest
+from importlib.metadata import EntryPoint
+from jgdv.structs.chainguard import ChainGuard
 
 # ##-- end 3rd party imports
 
@@ -26,6 +28,7 @@ import pytest
 import doot
 import doot._interface as API
 from doot.control.main import DootMain
+from doot.control.loaders.cmd import LazyCommand
 
 # ##-- end 1st party imports
 
@@ -66,6 +69,21 @@ class TestMainCLIArgParsing:
     def test_sanity(self):
         assert(True is not False) # noqa: PLR0133
 
+    def test_only_called_cmds_are_loaded(self, mocker):
+        cmds = {
+            "list" : LazyCommand(EntryPoint(name="list", group="doot.command", value="doot.cmds.list_cmd:ListCmd")),
+            "run"  : LazyCommand(EntryPoint(name="run",  group="doot.command", value="doot.cmds.run_cmd:RunCmd")),
+            "bad"  : LazyCommand(EntryPoint(name="bad",  group="doot.command", value="doot.cmds.bad:badcmd")),
+        }
+        mocker.patch.object(doot, "loaded_cmds", ChainGuard(cmds))
+        dmain   = DootMain()
+        result  = dmain._cli._callable_cmds(["doot", "list", "-v"], {"run": ["run"]})
+        assert(set(result.keys()) == {"list", "run"})
+        assert(cmds["list"].is_loaded)
+        assert(not cmds["bad"].is_loaded)
+        subcmds = dmain._cli._map_subcmd_constraints(result)
+        assert(all(x == ("run",) for x, _ in subcmds))
+
     @pytest.mark.skip("TODO")
     def test_todo(self):
         pass
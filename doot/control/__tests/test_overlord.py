@@ -107,6 +107,45 @@ class TestOverlord_Startup:
         assert(bool(do.config))
         assert(bool(do.locs))
 
+class TestOverlord_ParsedFiles:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_load_toml(self, tmp_path):
+        do    = DootOverlord()
+        path  = tmp_path / "test.toml"
+        path.write_text('[tasks]\nblah = 2\n')
+        match do.load_toml(path):
+            case ChainGuard() as data:
+                assert(data.tasks.blah == 2)
+            case x:
+                assert(False), x
+
+    def test_load_toml_parses_once(self, tmp_path, mocker):
+        do    = DootOverlord()
+        path  = tmp_path / "test.toml"
+        path.write_text('[tasks]\nblah = 2\n')
+        load  = mocker.spy(ChainGuard, "load")
+        first = do.load_toml(path)
+        assert(do.load_toml(str(path)) is first)
+        assert(load.call_count == 1)
+
+    def test_load_toml_reparses_changed(self, tmp_path):
+        do    = DootOverlord()
+        path  = tmp_path / "test.toml"
+        path.write_text('[tasks]\nblah = 2\n')
+        first = do.load_toml(path)
+        path.write_text('[tasks]\nblah = 3\nbloo = 4\n')
+        second = do.load_toml(path)
+        assert(second is not first)
+        assert(second.tasks.blah == 3)
+
+    def test_load_toml_missing(self, tmp_path):
+        do = DootOverlord()
+        with pytest.raises(OSError):
+            do.load_toml(tmp_path / "missing.toml")
+
 class TestOverlord_VersionCheck:
     """
     Test the version checking used for config file and task specs
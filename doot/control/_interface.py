@@ -85,6 +85,8 @@ class Overlord_p(Protocol):
 
     def load(self) -> None: ...
 
+    def load_toml(self, path:str|pl.Path) -> ChainGuard: ...
+
     def load_reporter(self, target:str="default") -> None: ...
 
     def verify_config_version(self, ver:Maybe[str], sources:str|pl.Path, *, override:Maybe[str]=None) -> None: ...
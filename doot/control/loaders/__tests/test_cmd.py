@@ -58,8 +58,36 @@ class TestCmdLoader(unittest.TestCase):
                 EntryPoint(name="bad", group="doot.command", value="doot.cmds.bad:badcmd"),
 
         ]}))
+        result = basic.load()
+        assert("bad" in result)
         with pytest.raises(doot.errors.PluginLoadError):
-            basic.load()
+            result.bad.materialise()
+
+    def test_load_is_lazy(self):
+        basic = cmd.CommandLoader()
+        basic.setup(ChainGuard({
+            "command" : [
+                EntryPoint(name="list", group="doot.command", value="doot.cmds.list_cmd:ListCmd"),
+
+        ]}))
+        result = basic.load()
+        assert(isinstance(result.list, cmd.LazyCommand))
+        assert(result.list.name == "list")
+        assert(not result.list.is_loaded)
+
+    def test_lazy_cmd_loads_once_on_use(self):
+        basic = cmd.CommandLoader()
+        basic.setup(ChainGuard({
+            "command" : [
+                EntryPoint(name="list", group="doot.command", value="doot.cmds.list_cmd:ListCmd"),
+
+        ]}))
+        lazy  = basic.load().list
+        specs = lazy.param_specs()
+        assert(bool(specs))
+        assert(lazy.is_loaded)
+        assert(lazy.materialise() is lazy.materialise())
+        assert(lazy.materialise().name == "list")
 
 
     @pytest.mark.skip
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ERA001, ANN202, ANN001, PLR2004, ARG002
+#
+##-- imports
+from __future__ import annotations
+
+import logging as logmod
+import pathlib as pl
+import warnings
+##-- end imports
+
+import pytest
+import doot
+from doot.workflow import TaskArtifact, TaskSpec, TaskName
+from doot.workflow.factory import TaskFactory
+from doot.control.tracker.naive_tracker import NaiveTracker
+
+from doot.control.loaders import task
+from ..lazy_specs import LazySpec, LazySpecs
+
+logging          = logmod.root
+factory          = TaskFactory()
+##--|
+
+def lazy(raw:dict) -> LazySpec:
+    return LazySpec(raw, build=factory.build)
+
+class TestLazySpec:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_name_without_building(self, mocker):
+        build = mocker.Mock(side_effect=factory.build)
+        spec  = LazySpec({"group": "basic", "name": "test"}, build=build)
+        assert(spec.name == "basic::test")
+        assert(not spec.is_built)
+        build.assert_not_called()
+
+    def test_param_specs_without_building(self, mocker):
+        build = mocker.Mock(side_effect=factory.build)
+        spec  = LazySpec({"name": "basic::test", "cli": [{"name":"--blah", "type":"bool"}]}, build=build)
+        params = spec.param_specs()
+        assert(len(params) == 1)
+        build.assert_not_called()
+
+    def test_attribute_access_builds_once(self, mocker):
+        build = mocker.Mock(side_effect=factory.build)
+        spec  = LazySpec({"name": "basic::test", "a": 2}, build=build)
+        assert(spec.extra.a == 2)
+        assert(spec.is_built)
+        assert(isinstance(spec.materialise(), TaskSpec))
+        build.assert_called_once()
+
+    def test_build_failure(self):
+        spec = LazySpec({"name": "basic::test"}, build=lambda x: ValueError("bad"))
+        with pytest.raises(doot.errors.StructLoadError):
+            spec.materialise()
+
+    def test_blocks(self):
+        spec = lazy({"name": "basic::test", "required_for": ["basic::other", "file::>a.txt", {"task":"basic::more"}]})
+        assert(spec.blocks() == ["basic::other", "basic::more"])
+
+    def test_produces(self):
+        spec = lazy({"name": "basic::test", "required_for": ["basic::other", "file::>a.txt", {"path":"b.txt"}, {"task":"basic::more"}]})
+        assert(spec.produces() == [TaskArtifact("file::>a.txt"), TaskArtifact("file::>b.txt")])
+
+class TestLazySpecs:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_materialise(self):
+        source = LazySpecs([lazy({"name": "basic::test"}), factory.build({"name": "basic::built"})])
+        assert(source.materialise("basic::test").name == "basic::test")
+        assert(source.materialise(TaskName("basic::built")).name == "basic::built")
+        assert(source.materialise("basic::missing") is None)
+
+    def test_materialise_generated_name(self):
+        source = LazySpecs([lazy({"name": "basic::+.job"})])
+        assert(source.materialise(TaskName("basic::+.job..$head$")).name == "basic::+.job")
+
+    def test_blockers_of(self):
+        source = LazySpecs([lazy({"name": "basic::a", "required_for": ["basic::c"]}),
+                            lazy({"name": "basic::b", "required_for": ["basic::c"]}),
+                            lazy({"name": "basic::c"})])
+        assert(source.blockers_of(TaskName("basic::c")) == ["basic::a", "basic::b"])
+        assert(source.blockers_of(TaskName("basic::a")) == [])
+
+    def test_producers_of(self):
+        source = LazySpecs([lazy({"name": "basic::a", "required_for": ["file::>out.txt"]}),
+                            factory.build({"name": "basic::b", "required_for": ["file::>out.txt"]}),
+                            lazy({"name": "basic::c", "required_for": ["file::>other.txt"]})])
+        assert(source.producers_of(TaskArtifact("file::>out.txt")) == ["basic::a", "basic::b"])
+        assert(source.producers_of(TaskArtifact("file::>missing.txt")) == [])
+
+    def test_producers_of_abstract(self):
+        source = LazySpecs([lazy({"name": "basic::a", "required_for": ["file::>out.txt"]}),
+                            lazy({"name": "basic::b", "required_for": ["file::>out.md"]})])
+        assert(source.producers_of(TaskArtifact("file::>*.txt")) == ["basic::a"])
+
+class TestTracker_LazySpecs:
+
+    @pytest.fixture(scope="function")
+    def source(self):
+        specs = [lazy({"name": "basic::target", "depends_on": ["basic::dep"]}),
+                 lazy({"name": "basic::dep", "depends_on": ["basic::deeper"]}),
+                 lazy({"name": "basic::deeper"}),
+                 lazy({"name": "basic::blocker", "required_for": ["basic::target"]}),
+                 ]
+        specs += [lazy({"name": f"basic::unrelated_{i}"}) for i in range(20)]
+        return specs
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_queue_materialises_cone(self, source):
+        tracker = NaiveTracker()
+        tracker.set_spec_source(LazySpecs(source))
+        assert(not bool(tracker.specs))
+        tracker.queue("basic::target", from_user=True)
+        for name in ["basic::target", "basic::dep", "basic::deeper", "basic::blocker"]:
+            assert(TaskName(name) in tracker.specs)
+        assert(not any(x.is_built for x in source if "unrelated" in x.name))
+        assert("basic::blocker" in tracker.specs["basic::target"].blocked_by)
+
+    def test_lazy_run_matches_eager(self, source):
+        lazy_tracker  = NaiveTracker()
+        lazy_tracker.set_spec_source(LazySpecs(source))
+        lazy_tracker.queue("basic::target", from_user=True)
+        lazy_tracker.build()
+        lazy_tracker.validate()
+
+        eager = NaiveTracker()
+        eager.register(*[x.materialise() for x in source])
+        eager.queue("basic::target", from_user=True)
+        eager.build()
+        eager.validate()
+        assert(len(lazy_tracker.network) == len(eager.network))
+
+    def test_queue_materialises_producer(self):
+        source = [lazy({"name": "basic::consumer", "depends_on": ["file::>out.txt"]}),
+                  lazy({"name": "basic::producer", "required_for": ["file::>out.txt"]}),
+                  lazy({"name": "basic::unrelated"})]
+        tracker = NaiveTracker()
+        tracker.set_spec_source(LazySpecs(source))
+        tracker.queue("basic::consumer", from_user=True)
+        assert(TaskName("basic::producer") in tracker.specs)
+        assert(not source[2].is_built)
+        tracker.build()
+        tracker.validate()
+        producer  = tracker.specs["basic::producer"].spec.name
+        artifact  = TaskArtifact("file::>out.txt")
+        assert(any(x.de_uniq() == producer for x in tracker.network.pred[artifact] if isinstance(x, TaskName)))
+
+class TestTaskLoader_Lazy:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_lazy_load(self, mocker):
+        specs = {"tasks": {"basic" : [{"name": "test"}, {"name": "other"}]}}
+        loader = task.TaskLoader()
+        mocker.patch.object(loader, "_load_specs_from_path")
+        loader.setup({}, specs)
+        loader.lazy = True
+        build  = mocker.spy(loader.factory, "build")
+        result = loader.load()
+        assert("basic::test" in result)
+        assert(isinstance(result["basic::test"], LazySpec))
+        build.assert_not_called()
+
+    def test_lazy_overloads(self, mocker):
+        specs = {"tasks": {"basic" : [{"name": "test"}, {"name": "test"}]}}
+        loader = task.TaskLoader()
+        mocker.patch.object(loader, "_load_specs_from_path")
+        loader.setup({}, specs)
+        loader.lazy = True
+        loader.load()
+        assert(bool(loader.failures))
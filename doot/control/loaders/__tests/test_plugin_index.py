@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ERA001, ANN202, ANN001, PLR2004, ARG002
+#
+##-- imports
+from __future__ import annotations
+
+import logging as logmod
+import os
+import pathlib as pl
+import warnings
+##-- end imports
+
+import pytest
+from importlib.metadata import EntryPoint
+import doot
+
+from .. import plugin_index
+from ..plugin_index import EntryPointIndex
+
+logging          = logmod.root
+GROUP            = "doot.plugins.command"
+##--|
+
+@pytest.fixture(scope="function")
+def site(tmp_path):
+    site = tmp_path / "site"
+    (site / "blah-1.0.dist-info").mkdir(parents=True)
+    return site
+
+class TestEntryPointIndex:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_lookup_without_path(self):
+        index  = EntryPointIndex()
+        assert(not index.enabled)
+        result = index.lookup([GROUP])
+        assert(GROUP in result)
+        assert(all(isinstance(x, EntryPoint) for x in result[GROUP]))
+
+    def test_single_search_for_groups(self, mocker):
+        search = mocker.spy(plugin_index, "entry_points")
+        EntryPointIndex().lookup([GROUP, "doot.plugins.reporter", "doot.plugins.action"])
+        assert(search.call_count == 1)
+
+    def test_fingerprint_changes_with_dist_info(self, site):
+        index  = EntryPointIndex(search=[str(site)])
+        first  = index.fingerprint()
+        assert(first == index.fingerprint())
+        (site / "other-2.0.dist-info").mkdir()
+        assert(first != index.fingerprint())
+
+    def test_fingerprint_changes_with_mtime(self, site):
+        index  = EntryPointIndex(search=[str(site)])
+        first  = index.fingerprint()
+        meta   = site / "blah-1.0.dist-info"
+        stat   = meta.stat()
+        os.utime(meta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert(first != index.fingerprint())
+
+    def test_index_round_trip(self, tmp_path, site, mocker):
+        path   = tmp_path / "plugins.index"
+        found  = EntryPointIndex(path=path, search=[str(site)]).lookup([GROUP])
+        assert(path.exists())
+        search = mocker.spy(plugin_index, "entry_points")
+        loaded = EntryPointIndex(path=path, search=[str(site)]).lookup([GROUP])
+        search.assert_not_called()
+        assert(loaded == found)
+
+    def test_index_invalidated(self, tmp_path, site, mocker):
+        path   = tmp_path / "plugins.index"
+        EntryPointIndex(path=path, search=[str(site)]).lookup([GROUP])
+        (site / "other-2.0.dist-info").mkdir()
+        search = mocker.spy(plugin_index, "entry_points")
+        EntryPointIndex(path=path, search=[str(site)]).lookup([GROUP])
+        search.assert_called_once()
+
+    def test_unreadable_index(self, tmp_path, site):
+        path   = tmp_path / "plugins.index"
+        path.write_text("not json")
+        result = EntryPointIndex(path=path, search=[str(site)]).lookup([GROUP])
+        assert(GROUP in result)
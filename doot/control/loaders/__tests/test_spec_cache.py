@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ERA001, ANN202, ANN001, PLR2004, ARG002
+#
+##-- imports
+from __future__ import annotations
+
+import logging as logmod
+import pathlib as pl
+import warnings
+##-- end imports
+
+import pytest
+from jgdv.structs.chainguard import ChainGuard
+import doot
+from doot.workflow import TaskSpec
+from doot.workflow.factory import TaskFactory
+
+from doot.control.loaders import task
+from ..spec_cache import SpecCache, CachedSource_d
+from ..lazy_specs import LazySpec
+
+logging          = logmod.root
+factory          = TaskFactory()
+
+TASK_FILE = """
+doot-version = "{version}"
+
+[[tasks.basic]]
+name    = "test"
+ctor    = "doot.workflow:DootTask"
+actions = [{{ do="log", msg="blah" }}]
+depends_on = ["basic::other"]
+"""
+##--|
+
+@pytest.fixture(scope="function")
+def task_file(tmp_path):
+    path = tmp_path / "tasks.toml"
+    path.write_text(TASK_FILE.format(version=doot.__version__))
+    return path
+
+class TestSpecCache:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_disabled_without_path(self):
+        cache = SpecCache()
+        assert(not cache.enabled)
+        cache.put(pl.Path("blah.toml"), CachedSource_d(fingerprint=(0, 0, "", "", "")))
+        assert(not bool(cache))
+
+    def test_fingerprint_changes_with_content(self, tmp_path, task_file):
+        cache  = SpecCache(path=tmp_path / "cache")
+        first  = cache.fingerprint(task_file)
+        assert(first == cache.fingerprint(task_file))
+        task_file.write_text("blah")
+        assert(first != cache.fingerprint(task_file))
+
+    def test_fingerprint_changes_with_context(self, tmp_path, task_file):
+        cache1 = SpecCache(path=tmp_path / "cache", context="a")
+        cache2 = SpecCache(path=tmp_path / "cache", context="b")
+        assert(cache1.fingerprint(task_file) != cache2.fingerprint(task_file))
+
+    def test_round_trip(self, tmp_path, task_file):
+        spec   = factory.build({"name":"basic::test", "ctor":"doot.workflow:DootTask", "actions":[{"do":"log", "msg":"blah"}], "a": 2})
+        cache  = SpecCache(path=tmp_path / "cache")
+        fp     = cache.fingerprint(task_file)
+        cache.put(task_file, CachedSource_d(fingerprint=fp, specs=[spec], state=[{"val":2}]))
+        cache.save()
+        assert((tmp_path / "cache").exists())
+        match SpecCache(path=tmp_path / "cache").get(task_file, fp):
+            case CachedSource_d(specs=[TaskSpec() as loaded], state=[{"val":2}]):
+                assert(loaded.name == spec.name)
+                assert(loaded.ctor == spec.ctor)
+                assert(loaded.actions[0].do == spec.actions[0].do)
+                assert(loaded.extra.a == 2)
+            case x:
+                assert(False), x
+
+    def test_stale_fingerprint_misses(self, tmp_path, task_file):
+        cache  = SpecCache(path=tmp_path / "cache")
+        fp     = cache.fingerprint(task_file)
+        cache.put(task_file, CachedSource_d(fingerprint=fp))
+        task_file.write_text("blah")
+        assert(cache.get(task_file, cache.fingerprint(task_file)) is None)
+
+    def test_unseen_entries_are_pruned(self, tmp_path, task_file):
+        other  = tmp_path / "other.toml"
+        other.write_text(task_file.read_text())
+        cache  = SpecCache(path=tmp_path / "cache")
+        for x in [task_file, other]:
+            cache.put(x, CachedSource_d(fingerprint=cache.fingerprint(x)))
+        cache.save()
+
+        other.unlink()
+        second = SpecCache(path=tmp_path / "cache")
+        assert(second.get(task_file, second.fingerprint(task_file)) is not None)
+        second.save()
+        assert(task_file in SpecCache(path=tmp_path / "cache"))
+        assert(other not in SpecCache(path=tmp_path / "cache"))
+
+    def test_unused_cache_isnt_pruned(self, tmp_path, task_file):
+        cache = SpecCache(path=tmp_path / "cache")
+        cache.put(task_file, CachedSource_d(fingerprint=cache.fingerprint(task_file)))
+        cache.save()
+        SpecCache(path=tmp_path / "cache").save()
+        assert(task_file in SpecCache(path=tmp_path / "cache"))
+
+    def test_unreadable_cache_is_ignored(self, tmp_path):
+        (tmp_path / "cache").write_text("not a pickle")
+        cache = SpecCache(path=tmp_path / "cache")
+        assert(not bool(cache))
+
+class TestTaskLoader_SpecCache:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_loads_from_cache(self, mocker, tmp_path, task_file):
+        first = task.TaskLoader().setup({})
+        first.spec_cache = SpecCache(path=tmp_path / "cache")
+        first._load_specs_from_path(task_file)
+        first.spec_cache.save()
+        assert("basic::test" in first.tasks)
+
+        second = task.TaskLoader().setup({})
+        second.spec_cache = SpecCache(path=tmp_path / "cache")
+        build = mocker.spy(second.factory, "build")
+        second._load_specs_from_path(task_file)
+        build.assert_not_called()
+        assert("basic::test" in second.tasks)
+        assert(second.tasks["basic::test"].depends_on == first.tasks["basic::test"].depends_on)
+
+    def test_changed_file_is_rebuilt(self, mocker, tmp_path, task_file):
+        first = task.TaskLoader().setup({})
+        first.spec_cache = SpecCache(path=tmp_path / "cache")
+        first._load_specs_from_path(task_file)
+        first.spec_cache.save()
+
+        task_file.write_text(TASK_FILE.format(version=doot.__version__).replace('"test"', '"changed"'))
+        second = task.TaskLoader().setup({})
+        second.spec_cache = SpecCache(path=tmp_path / "cache")
+        second._load_specs_from_path(task_file)
+        assert("basic::changed" in second.tasks)
+        assert("basic::test" not in second.tasks)
+
+    def test_lazy_skips_cache(self, mocker, tmp_path, task_file):
+        first = task.TaskLoader().setup({})
+        first.spec_cache = SpecCache(path=tmp_path / "cache")
+        first._load_specs_from_path(task_file)
+        first.spec_cache.save()
+
+        second = task.TaskLoader().setup({})
+        second.lazy = True
+        second.spec_cache = SpecCache(path=tmp_path / "cache")
+        get = mocker.spy(second.spec_cache, "get")
+        second._load_specs_from_path(task_file)
+        get.assert_not_called()
+        assert(isinstance(second.tasks["basic::test"], LazySpec))
+
+    def test_alias_change_invalidates(self, mocker, tmp_path, task_file):
+        first = task.TaskLoader().setup({})
+        mocker.patch.object(task, "SPEC_CACHE", str(tmp_path / "cache"))
+        before = first._build_spec_cache().context
+        aliases = doot.aliases._table()
+        mocker.patch.object(doot, "aliases", ChainGuard({**aliases, "action": {**aliases.get("action", {}), "blah": "doot.workflow.actions:LogAction"}}))
+        assert(first._build_spec_cache().context != before)
+
+    def test_failures_arent_cached(self, tmp_path):
+        path = tmp_path / "tasks.toml"
+        path.write_text(f'doot-version = "{doot.__version__}"\n[[tasks.basic]]\nname = "test"\nsource = "basic::other"\n')
+        loader = task.TaskLoader().setup({})
+        loader.spec_cache = SpecCache(path=tmp_path / "cache")
+        loader._load_specs_from_path(path)
+        assert(path in loader.failures)
+        assert(path not in loader.spec_cache)
@@ -26,6 +26,7 @@ from doot.workflow import TaskSpec
 from doot.util.mock_gen import mock_entry_point, mock_task_ctor
 
 from doot.control.loaders import task
+from doot.control.loaders.spec_cache import SpecCache
 logging          = logmod.root
 
 job_ctor_str     = "doot.workflow:DootJob"
@@ -208,3 +209,66 @@ class TestTaskLoader:
 
         with pytest.raises(doot.errors.StructLoadError):
             basic.load()
+
+class TestTaskLoader_SharedToml:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_reloading_keeps_sources(self, tmp_path):
+        path = tmp_path / "tasks.toml"
+        path.write_text("\n".join([
+            f'doot-version = "{doot.__version__}"',
+            '[[tasks.basic]]',
+            'name    = "test"',
+            'sources = ["base::a"]',
+            ]))
+        loaded = []
+        for _ in range(2):
+            loader = task.TaskLoader().setup({})
+            loader.spec_cache = SpecCache()
+            loader._load_specs_from_path(path)
+            loaded.append(loader.tasks["basic::test"].sources)
+
+        assert(loaded[0] == loaded[1])
+        assert(len(loaded[0]) == 2)
+        assert(list(doot.load_toml(path).tasks.basic[0].sources) == ["base::a"])
+
+class TestTaskLoader_Files:
+
+    @pytest.fixture(scope="function")
+    def task_dir(self, tmp_path):
+        for i in range(6):
+            (tmp_path / f"tasks_{i}.toml").write_text("\n".join([
+                f'doot-version = "{doot.__version__}"',
+                '[[tasks.basic]]',
+                f'name = "task_{i}"',
+                '[[tasks.basic]]',
+                'name = "shared"',
+                f'val  = {i}',
+                '[[tasks.basic]]',
+                f'name = "bad_{i}"',
+                'source = "basic::other"',
+                ]))
+        else:
+            (tmp_path / "broken.toml").write_text('doot-version = "0.0.1"\n')
+            return tmp_path
+
+    def load(self, path):
+        loader = task.TaskLoader().setup({})
+        loader._load_specs_from_path(path)
+        return loader
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_detects_overloads(self, task_dir):
+        loader     = self.load(task_dir)
+        overloads  = [x for errs in loader.failures.values() for x in errs if "Overloaded" in str(x)]
+        assert(len(overloads) == 5)
+        assert(len(loader.tasks) == 7)
+
+    def test_collects_failures(self, task_dir):
+        loader = self.load(task_dir)
+        assert(task_dir / "broken.toml" in loader.failures)
+        assert(all(bool(loader.failures[task_dir / f"tasks_{i}.toml"]) for i in range(6)))
@@ -16,7 +16,7 @@ import pathlib as pl
 import re
 import time
 import types
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint
 from uuid import UUID, uuid1
 
 # ##-- end stdlib imports
@@ -62,12 +62,81 @@ from ._interface import CommandLoader_p
 logging = logmod.getLogger(__name__)
 ##-- end logging
 
+class LazyCommand:
+    """ A command's entry point, which is only loaded and instantiated when the command is used.
+
+    The name is available without loading.
+    Anything else loads the command, and is read from it.
+    """
+    __slots__ = ("_cmd", "_point")
+
+    _point  : EntryPoint
+    _cmd    : Maybe[Command_p]
+
+    def __init__(self, point:EntryPoint) -> None:
+        self._point  = point
+        self._cmd    = None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._cmd is not None else "lazy"
+        return f"<LazyCommand({state}): {self._point.name} : {self._point.value}>"
+
+    def __getattr__(self, key:str) -> Any:  # noqa: ANN401
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return getattr(self.materialise(), key)
+
+    def __call__(self, *args:Any, **kwargs:Any) -> Any:  # noqa: ANN401
+        return self.materialise()(*args, **kwargs)
+
+    @property
+    def name(self) -> str:
+        return self._point.name
+
+    @property
+    def help(self) -> list[str]:
+        return self.materialise().help
+
+    @property
+    def helpline(self) -> str:
+        return self.materialise().helpline
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._cmd is not None
+
+    def param_specs(self) -> list:
+        return self.materialise().param_specs()
+
+    def shutdown(self, *args:Any, **kwargs:Any) -> None:  # noqa: ANN401
+        self.materialise().shutdown(*args, **kwargs)
+
+    def materialise(self) -> Command_p:
+        """ Load and instantiate the command, once.
+        raises PluginLoadError if the entry point isn't a command
+        """
+        if self._cmd is not None:
+            return self._cmd
+
+        try:
+            logging.debug("Loading Cmd: %s", self._point.name)
+            cmd = self._point.load()
+            if not isinstance(cmd, Command_p):
+                raise TypeError("Not a Command_p", cmd)
+
+            self._cmd        = cmd()
+            self._cmd._name  = self._point.name
+        except Exception as err:
+            raise doot.errors.PluginLoadError("Attempted to load a non-command: %s : %s", self._point, err) from err
+        else:
+            return self._cmd
+
 @Proto(CommandLoader_p)
 class CommandLoader:
     """
-      Default Command loaded. using the loaded plugins,
-      selects "command", calls load on each entry point, and if the obj returned is a subclass of Command_p,
-      instantiates it
+      Default Command loader. using the loaded plugins,
+      selects "command", and provides a LazyCommand for each entry point.
+      Each command is loaded, checked to be a Command_p, and instantiated on its first use.
     """
 
     def setup(self, plugins, extra:Maybe[list|dict|ChainGuard]=None) -> Self:
@@ -89,16 +158,6 @@ class CommandLoader:
     def load(self) -> ChainGuard[Command_p]:
         logging.debug("---- Loading Commands")
         for cmd_point in self.cmd_plugins:
-            try:
-                logging.debug("Loading Cmd: %s", cmd_point.name)
-                # load the plugins
-                cmd = cmd_point.load()
-                if not isinstance(cmd, Command_p):
-                    raise TypeError("Not a Command_p", cmd)
-
-                self.cmds[cmd_point.name] = cmd()
-                self.cmds[cmd_point.name]._name = cmd_point.name
-            except Exception as err:
-                raise doot.errors.PluginLoadError("Attempted to load a non-command: %s : %s", cmd_point, err) from err
+            self.cmds[cmd_point.name] = LazyCommand(cmd_point)
 
         return ChainGuard(self.cmds)
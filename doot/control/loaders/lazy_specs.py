@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Lazily built task specs, for only paying for the specs a run uses.
+
+In lazy mode the TaskLoader doesn't build TaskSpecs.
+It indexes each task's raw data by name, as a LazySpec.
+A LazySpec can provide its cli params without being built,
+and is built into a TaskSpec on first use of anything else.
+
+A tracker given a LazySpecs source materialises specs as they are queued,
+referenced by a relation, block a registered spec,
+or are required_for an artifact a registered spec depends on.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from collections import defaultdict
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv.cli import ParamSpecMaker_m
+from jgdv.structs.locator import Location
+from jgdv.structs.strang.errors import StrangError
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow import TaskArtifact, TaskName, TaskSpec
+from doot.workflow._interface import Artifact_i, TaskName_p, TaskSpec_i
+from doot.control.tracker.artifact_index import ArtifactIndex
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Builder = Callable[[dict], TaskSpec_i|Exception]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+BLOCKING_KEYS  : Final[tuple[str, ...]]  = ("required_for", "required-for")
+CLI_K          : Final[str]              = "cli"
+##--|
+
+class LazySpec:
+    """ A task's raw data, built into a TaskSpec on first use.
+
+    The name and cli params are available without building.
+    Any other attribute builds the spec, and is read from it.
+    """
+    __slots__ = ("_build", "_spec", "name", "raw", "source")
+
+    name    : TaskName_p
+    raw     : dict
+    source  : Maybe[str|pl.Path]
+    _build  : Builder
+    _spec   : Maybe[TaskSpec_i]
+
+    @staticmethod
+    def name_of(raw:dict) -> TaskName_p:
+        """ The name a raw spec will have, as TaskSpec joins the group and name.
+        raises StrangError if it isn't a valid name
+        """
+        cleaned = TaskSpec._convert_toml_keys(raw)
+        return TaskName(cleaned['name'])
+
+    def __init__(self, raw:dict, *, build:Builder, source:Maybe[str|pl.Path]=None) -> None:
+        self.name    = LazySpec.name_of(raw)
+        self.raw     = raw
+        self.source  = source
+        self._build  = build
+        self._spec   = None
+
+    def __repr__(self) -> str:
+        state = "built" if self._spec is not None else "lazy"
+        return f"<LazySpec({state}): {self.name}>"
+
+    def __getattr__(self, key:str) -> Any:  # noqa: ANN401
+        if key.startswith("_"):
+            raise AttributeError(key)
+        return getattr(self.materialise(), key)
+
+    @property
+    def is_built(self) -> bool:
+        return self._spec is not None
+
+    def param_specs(self) -> list:
+        """ The spec's cli params, from its raw data """
+        result = []
+        for x in self.raw.get(CLI_K, None) or []:
+            result.append(ParamSpecMaker_m.build_param(**x))
+        else:
+            return result
+
+    def blocks(self) -> list[TaskName_p]:
+        """ The tasks this spec is required for, from its raw data.
+        Only plain names are read, artifacts and anything unparseable are skipped.
+        """
+        result : list[TaskName_p] = []
+        for key in BLOCKING_KEYS:
+            for x in self.raw.get(key, None) or []:
+                match x:
+                    case str() if TaskArtifact.section(0).end in x: # type: ignore[operator]
+                        continue
+                    case str() if Location.section(0).end in x: # type: ignore[operator]
+                        continue
+                    case str() if TaskName.section(0).end in x: # type: ignore[operator]
+                        pass
+                    case {"task": str() as x}:
+                        pass
+                    case _:
+                        continue
+                try:
+                    result.append(TaskName(x))
+                except StrangError:
+                    continue
+        else:
+            return result
+
+    def produces(self) -> list[Artifact_i]:
+        """ The artifacts this spec is required for, from its raw data.
+        Anything unparseable is skipped.
+        """
+        result : list[Artifact_i] = []
+        for key in BLOCKING_KEYS:
+            for x in self.raw.get(key, None) or []:
+                match x:
+                    case str() as target if TaskArtifact.section(0).end in x: # type: ignore[operator]
+                        pass
+                    case {"path": str() as target} if "task" not in x:
+                        pass
+                    case _:
+                        continue
+                try:
+                    result.append(TaskArtifact(target))
+                except StrangError:
+                    continue
+        else:
+            return result
+
+    def materialise(self) -> TaskSpec_i:
+        """ Build the spec, once.
+        raises StructLoadError if it fails to build
+        """
+        match self._spec:
+            case None:
+                pass
+            case spec:
+                return spec
+
+        match self._build(self.raw):
+            case Exception() as err:
+                raise doot.errors.StructLoadError("Failed to build a lazily loaded task spec", self.name, self.source, err) from err
+            case spec:
+                logging.debug("[Lazy.Built] : %s", self.name)
+                self._spec = spec
+                return spec
+
+class LazySpecs:
+    """ A source of lazily built specs, by name, for a tracker to materialise from.
+    Accepts already built specs as well.
+    """
+
+    _specs      : dict[TaskName_p, LazySpec|TaskSpec_i]
+    _blockers   : Maybe[dict[TaskName_p, list[TaskName_p]]]
+    _producers  : dict[Artifact_i, list[TaskName_p]]
+    _products   : ArtifactIndex
+
+    def __init__(self, specs:Iterable[LazySpec|TaskSpec_i]) -> None:
+        self._specs      = {x.name : x for x in specs}
+        self._blockers   = None
+        self._producers  = {}
+        self._products   = ArtifactIndex()
+
+    def __contains__(self, name:TaskName_p) -> bool:
+        return self._lookup(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def materialise(self, name:str|TaskName_p) -> Maybe[TaskSpec_i]:
+        """ The built spec for a name, or the spec generating it, if there is one """
+        match self._lookup(name):
+            case None:
+                return None
+            case LazySpec() as lazy:
+                return lazy.materialise()
+            case spec:
+                return cast("TaskSpec_i", spec)
+
+    def blockers_of(self, name:TaskName_p) -> list[TaskName_p]:
+        """ The names of specs which are required_for a name """
+        if self._blockers is None:
+            self._index_relations()
+
+        assert(self._blockers is not None)
+        return self._blockers.get(self._base(name), [])
+
+    def producers_of(self, artifact:Artifact_i) -> list[TaskName_p]:
+        """ The names of specs which are required_for an artifact,
+        or for a concrete artifact in it, if it is abstract
+        """
+        result : list[TaskName_p]
+        if self._blockers is None:
+            self._index_relations()
+
+        result = list(self._producers.get(artifact, []))
+        if not artifact.is_concrete():
+            for conc in self._products.concretes_in(artifact):
+                result += self._producers.get(conc, [])
+
+        return list(dict.fromkeys(result))
+
+    def _lookup(self, name:str|TaskName_p) -> Maybe[LazySpec|TaskSpec_i]:
+        match name:
+            case str() if not isinstance(name, TaskName_p):
+                try:
+                    name = TaskName(name)
+                except StrangError:
+                    return None
+            case _:
+                pass
+
+        assert(isinstance(name, TaskName_p))
+        return self._specs.get(name, None) or self._specs.get(self._base(name), None)
+
+    def _base(self, name:TaskName_p) -> TaskName_p:
+        """ The abstract spec a name is from. eg: group::a..$head$ -> group::a """
+        return cast("TaskName_p", name.pop(top=True))
+
+    def _index_relations(self) -> None:
+        """ One pass over the specs, without building them,
+        for the tasks and artifacts each spec is required for
+        """
+        blockers   : dict = defaultdict(list)
+        producers  : dict = defaultdict(list)
+        for name, spec in self._specs.items():
+            match spec:
+                case LazySpec() if not spec.is_built:
+                    targets   = spec.blocks()
+                    products  = spec.produces()
+                case _:
+                    targets   = [x.target for x in spec.required_for if isinstance(x.target, TaskName_p)]
+                    products  = [x.target for x in spec.required_for if isinstance(x.target, Artifact_i)]
+
+            for target in targets:
+                blockers[self._base(target)].append(name)
+            for product in products:
+                producers[product].append(name)
+                self._products.add(product)
+        else:
+            self._blockers   = dict(blockers)
+            self._producers  = dict(producers)
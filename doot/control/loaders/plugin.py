@@ -17,7 +17,7 @@ import re
 import time
 import types
 from collections import defaultdict
-from importlib.metadata import EntryPoint, entry_points
+from importlib.metadata import EntryPoint
 from uuid import UUID, uuid1
 
 # ##-- end stdlib imports
@@ -31,6 +31,7 @@ from jgdv.structs.chainguard import ChainGuard
 # ##-- 1st party imports
 import doot
 from . import _interface as API  # noqa: N812
+from .plugin_index import EntryPointIndex
 # ##-- end 1st party imports
 
 # ##-- types
@@ -67,6 +68,7 @@ logging = logmod.getLogger(__name__)
 skip_default_plugins  : Final[bool]           = doot.config.on_fail(False).startup.skip_default_plugins()  # noqa: FBT003
 skip_plugin_search    : Final[bool]           = doot.config.on_fail(False).startup.skip_plugin_search()  # noqa: FBT003
 env_plugins           : Final[dict]           = doot.config.on_fail({}).startup.plugins(wrapper=dict) # type: ignore[arg-type]
+PLUGIN_INDEX          : Final[str|Literal[False]]  = doot.config.on_fail("{temp}/plugins.index", str|bool).startup.plugin_index()
 
 # Constants:
 ## The plugin types to search for:
@@ -143,19 +145,33 @@ class PluginLoader:
 
     def _load_system_plugins(self) -> None:
         plugin_group  : str
-        entry_point   : EntryPoint
+        found         : dict[str, list[EntryPoint]]
         if skip_plugin_search:
             return
 
         logging.info("-- Searching environment for plugins, skip with `skip_plugin_search` in config")
-        for plugin_type in plugin_types:
-            try:
-                plugin_group = f"{PLUGIN_PREFIX}.{plugin_type}"
-                # Load env wide entry points
-                for entry_point in entry_points(group=plugin_group):
-                    self.plugins[plugin_type].append(entry_point)
-            except Exception as err:
-                raise doot.errors.PluginError("Plugin Failed to Load: %s : %s : %s", plugin_group, entry_point, err) from err
+        groups = {plugin_type : f"{PLUGIN_PREFIX}.{plugin_type}" for plugin_type in plugin_types}
+        try:
+            found = self._build_index().lookup(groups.values())
+        except Exception as err:
+            raise doot.errors.PluginError("Plugins Failed to Load: %s", err) from err
+
+        for plugin_type, plugin_group in groups.items():
+            # Load env wide entry points
+            self.plugins[plugin_type] += found[plugin_group]
+
+    def _build_index(self) -> EntryPointIndex:
+        """ The on-disk entry point index, from startup.plugin_index, under the temp location by default.
+        Set it to false to search the environment every time
+        """
+        path : Maybe[pl.Path]
+        match PLUGIN_INDEX:
+            case str() as x:
+                path = doot.locs[x] or None
+            case _:
+                path = None
+
+        return EntryPointIndex(path=path)
 
     def _load_from_toml(self) -> None:
         logging.info("-- Loading Plugins from Toml")
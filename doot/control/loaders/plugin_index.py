@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+A persistent index of the entry points doot searches for plugins.
+
+Looking up entry points reads the metadata of every installed distribution,
+which is slow in large environments.
+So the index stores the entry points of the groups it was asked for,
+fingerprinted by the import path, and the mtimes of its directories
+and their *.dist-info and *.egg-info directories.
+Installing, upgrading, or removing a distribution changes those mtimes,
+and the environment is searched again.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import json
+import logging as logmod
+import pathlib as pl
+import re
+import sys
+import time
+import types
+from importlib.metadata import EntryPoint, entry_points
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Fingerprint = list[list]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+INDEX_FORMAT    : Final[int]              = 1
+METADATA_GLOBS  : Final[tuple[str, ...]]  = ("*.dist-info", "*.egg-info")
+##--|
+
+class EntryPointIndex:
+    """ Entry points by group, stored in a file between runs.
+
+    Without a path, the environment is searched once per loader, rather than once per group.
+    """
+
+    path       : Maybe[pl.Path]
+    search     : list[str]
+    _groups    : dict[str, list[EntryPoint]]
+    _current   : Maybe[Fingerprint]
+
+    def __init__(self, *, path:Maybe[str|pl.Path]=None, search:Maybe[list[str]]=None) -> None:
+        self.path      = None if path is None else pl.Path(path)
+        self.search    = list(sys.path if search is None else search)
+        self._groups   = {}
+        self._current  = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def fingerprint(self) -> Fingerprint:
+        """ The import path and the mtimes of its installed distributions, which change on (un)install """
+        result : Fingerprint = []
+        for entry in self.search:
+            target = pl.Path(entry or ".")
+            try:
+                if not target.is_dir():
+                    result.append([entry, None])
+                    continue
+                result.append([entry, target.stat().st_mtime_ns])
+                for meta in sorted(itz.chain.from_iterable(target.glob(x) for x in METADATA_GLOBS)):
+                    result.append([meta.name, meta.stat().st_mtime_ns])
+            except OSError:
+                result.append([entry, None])
+        else:
+            return result
+
+    def lookup(self, groups:Iterable[str]) -> dict[str, list[EntryPoint]]:
+        """ The entry points of each group,
+        from the index file if the environment is unchanged, otherwise by a single search of it.
+        """
+        wanted = list(groups)
+        if self._current is None:
+            self._current = self.fingerprint()
+            self.load()
+
+        if any(x not in self._groups for x in wanted):
+            self._search(wanted)
+            self.save()
+
+        return {x : list(self._groups[x]) for x in wanted}
+
+    def load(self) -> None:
+        match self.path:
+            case pl.Path() as x if x.exists():
+                pass
+            case _:
+                return
+
+        try:
+            data = json.loads(x.read_text())
+        except (OSError, ValueError) as err:
+            logging.warning("Ignoring unreadable plugin index: %s : %s", x, err)
+            return
+
+        match data:
+            case {"format": int() as fmt, "fingerprint": list() as fp, "groups": dict() as groups} if fmt == INDEX_FORMAT and fp == self._current:
+                logging.debug("[PluginIndex] Hit: %s", x)
+                self._groups = {k : [EntryPoint(name=n, value=v, group=k) for n,v in eps] for k,eps in groups.items()}
+            case _:
+                logging.debug("[PluginIndex] Miss: %s", x)
+
+    def save(self) -> None:
+        """ Write the index to its path, if there is one """
+        if self.path is None:
+            return
+
+        data = {
+            "format"      : INDEX_FORMAT,
+            "fingerprint" : self._current,
+            "groups"      : {k : [[x.name, x.value] for x in eps] for k,eps in self._groups.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp.write_text(json.dumps(data))
+            tmp.replace(self.path)
+        except OSError as err:
+            logging.info("Couldn't write the plugin index: %s : %s", self.path, err)
+
+    def _search(self, groups:list[str]) -> None:
+        """ Read every distribution's entry points once, for all the groups """
+        logging.debug("[PluginIndex] Searching the environment for: %s", groups)
+        found = entry_points()
+        for group in groups:
+            self._groups[group] = list(found.select(group=group))
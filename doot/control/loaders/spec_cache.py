@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+A persistent cache of the task specs built from task files.
+
+Each task file's entry holds the specs built from it,
+along with the global state and locations it declared.
+Entries are keyed by the file's path, and fingerprinted by its
+mtime, size, content hash, the doot version, and the loader's context (eg: task builders).
+So an unchanged file can skip toml parsing and spec validation.
+
+Files which failed to load are never cached, so their errors are reported every time.
+Entries for files which weren't read in a run are dropped when the cache is saved.
+
+CodeReferences hold the code they import, which can't be pickled,
+so they are stored as their text and rebuilt on load.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import hashlib
+import io
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import pickle
+import re
+import time
+import types
+from dataclasses import dataclass, field
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv.structs.strang import CodeReference
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.workflow._interface import TaskSpec_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Fingerprint = tuple[int, int, str, str, str]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+CACHE_FORMAT  : Final[int]  = 1
+##--|
+
+@dataclass
+class CachedSource_d:
+    """ What a task file produced when it was loaded """
+    fingerprint  : Fingerprint
+    specs        : list[TaskSpec_i]  = field(default_factory=list)
+    state        : Any               = field(default_factory=list)
+    locations    : list[dict]        = field(default_factory=list)
+
+class _SpecPickler(pickle.Pickler):
+
+    def persistent_id(self, obj:Any) -> Maybe[tuple]:  # noqa: ANN401
+        match obj:
+            case CodeReference():
+                return (type(obj), obj[:])
+            case _:
+                return None
+
+class _SpecUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid:tuple) -> CodeReference:
+        ctor, text = pid
+        return ctor(text)
+
+class SpecCache:
+    """ Task specs built from task files, stored in a file between runs.
+
+    Without a path, nothing is cached.
+    """
+
+    path      : Maybe[pl.Path]
+    context   : str
+    _entries  : dict[str, CachedSource_d]
+    _seen     : set[str]
+    _dirty    : bool
+
+    def __init__(self, *, path:Maybe[str|pl.Path]=None, context:str="") -> None:
+        self.path      = None if path is None else pl.Path(path)
+        self.context   = context
+        self._entries  = {}
+        self._seen     = set()
+        self._dirty    = False
+        self.load()
+
+    def __contains__(self, source:pl.Path) -> bool:
+        return str(source) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def fingerprint(self, source:pl.Path) -> Fingerprint:
+        """ Identify the current content of a task file.
+        raises OSError if it can't be read
+        """
+        stat    = source.stat()
+        digest  = hashlib.sha256(source.read_bytes()).hexdigest()
+        return (stat.st_mtime_ns, stat.st_size, digest, doot.__version__, self.context)
+
+    def get(self, source:pl.Path, fingerprint:Fingerprint) -> Maybe[CachedSource_d]:
+        """ The cached results for a task file, if its fingerprint hasn't changed """
+        self._seen.add(str(source))
+        match self._entries.get(str(source), None):
+            case CachedSource_d() as entry if entry.fingerprint == fingerprint:
+                logging.debug("[SpecCache] Hit: %s", source)
+                return entry
+            case _:
+                logging.debug("[SpecCache] Miss: %s", source)
+                return None
+
+    def put(self, source:pl.Path, entry:CachedSource_d) -> None:
+        if not self.enabled:
+            return
+        self._seen.add(str(source))
+        self._entries[str(source)]  = entry
+        self._dirty                 = True
+
+    def load(self) -> None:
+        match self.path:
+            case None:
+                return
+            case pl.Path() as x if not x.exists():
+                return
+            case pl.Path() as x:
+                pass
+
+        try:
+            with x.open("rb") as f:
+                match _SpecUnpickler(f).load():
+                    case (int() as fmt, dict() as entries) if fmt == CACHE_FORMAT:
+                        self._entries = entries
+                    case _:
+                        logging.info("Ignoring out of date spec cache: %s", x)
+        except Exception as err:  # noqa: BLE001
+            # Anything can go wrong unpickling stale classes, so just rebuild
+            logging.warning("Ignoring unreadable spec cache: %s : %s", x, err)
+            self._entries = {}
+
+    def save(self) -> None:
+        """ Write the cache to its path, if there is one and anything has changed.
+        Entries which can't be pickled are dropped,
+        as are entries for files not read since it was loaded, if any were.
+        """
+        stale : list[str] = []
+        if bool(self._seen):
+            stale = [x for x in self._entries if x not in self._seen]
+        if self.path is None or not (self._dirty or bool(stale)):
+            return
+
+        entries = {}
+        for key in stale:
+            logging.debug("[SpecCache] Dropping: %s", key)
+            del self._entries[key]
+        for key, entry in self._entries.items():
+            try:
+                _SpecPickler(io.BytesIO()).dump(entry)
+            except (pickle.PicklingError, TypeError, AttributeError) as err:
+                logging.info("Not caching specs from: %s : %s", key, err)
+            else:
+                entries[key] = entry
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        with tmp.open("wb") as f:
+            _SpecPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump((CACHE_FORMAT, entries))
+
+        tmp.replace(self.path)
+        self._dirty = False
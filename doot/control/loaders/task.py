@@ -10,14 +10,17 @@ from __future__ import annotations
 import datetime
 import enum
 import functools as ftz
+import hashlib
 import importlib
 import itertools as itz
+import json
 import logging as logmod
 import re
 import time
 import types
 import typing
 from collections import ChainMap, defaultdict
+from dataclasses import dataclass, field
 from uuid import UUID, uuid1
 
 # ##-- end stdlib imports
@@ -35,6 +38,7 @@ from pydantic import ValidationError
 # ##-- 1st party imports
 import doot
 import doot.errors
+from doot import _interface as DootAPI # noqa: N812
 from doot.workflow import TaskName
 
 # ##-- end 1st party imports
@@ -43,6 +47,8 @@ from doot.workflow import TaskName
 from . import _interface as API#  noqa: N812
 from doot.workflow.factory import TaskFactory
 from ._interface import TaskLoader_p
+from .lazy_specs import LazySpec
+from .spec_cache import CachedSource_d, SpecCache
 
 # # End of Imports.
 
@@ -59,6 +65,7 @@ from typing import no_type_check, final, override, overload
 
 if TYPE_CHECKING:
     from doot.workflow._interface import TaskName_p, TaskSpec_i, TaskFactory_p
+    from .spec_cache import Fingerprint
     import pathlib as pl
     from jgdv import Maybe
     from typing import Final
@@ -79,6 +86,10 @@ logging = logmod.getLogger(__name__)
 TOML_SUFFIX            : Final[str]   = ".toml"
 exit_on_load_failures  : Final[bool]  = doot.config.on_fail(False).shutdown.exit_on_load_failures()
 allow_overloads        : Final[bool]  = doot.config.on_fail(False, bool).allow_overloads()
+LAZY_SPECS             : Final[bool]  = doot.config.on_fail(False, bool).startup.lazy_specs()
+BUILD_ERRORS           : Final[tuple[type[Exception], ...]] = (ValidationError, StrangError, LocationError, ModuleNotFoundError,
+                                                              AttributeError, ValueError, TypeError, ImportError)
+SPEC_CACHE             : Final[str|Literal[False]]  = doot.config.on_fail("{temp}/task_specs.cache", str|bool).startup.spec_cache()
 
 ##--| util
 def apply_group_and_source(group, source, x):  # noqa: ANN201, ANN001
@@ -90,24 +101,33 @@ def apply_group_and_source(group, source, x):  # noqa: ANN201, ANN001
     ...
 
     So the group isn't actually part of the dict.
-    This fn adds it in, plus where the dict came from
+    This fn adds it in, plus where the dict came from.
 
+    The dict and its sources are copied, as parsed toml is shared and reused between loads.
     """
     match x:
         case ChainGuard():
             x = dict(x.items())
-            x['group']  = x.get('group', group)
-            if 'sources' not in x:
-                x['sources'] = []
-            x['sources'].append(str(source))
         case dict():
-            x['group']  = x.get('group', group)
-            if 'sources' not in x:
-                x['sources'] = []
-            x['sources'].append(str(source))
+            x = dict(x)
+        case _:
+            return x
+
+    x['group']    = x.get('group', group)
+    x['sources']  = [*x.get('sources', []), str(source)]
     return x
 
 ##--|
+@dataclass
+class TaskFile_d:
+    """ The results of reading a task file, before they are added to the loader """
+    path         : pl.Path
+    fingerprint  : Maybe[Fingerprint]              = None
+    cached       : Maybe[CachedSource_d]           = None
+    data         : Maybe[ChainGuard]               = None
+    failure      : Maybe[str]                      = None
+    built        : list[TaskSpec_i|LazySpec|Exception]  = field(default_factory=list)
+
 @Proto(TaskLoader_p)
 class TaskLoader:
     """
@@ -120,6 +140,8 @@ class TaskLoader:
     extra                  : Maybe[ChainGuard|dict]
     exit_on_load_failures  : bool
     factory                : TaskFactory_p
+    spec_cache             : SpecCache
+    lazy                   : bool
 
     def __init__(self):
         self.tasks                  =  {}
@@ -129,6 +151,8 @@ class TaskLoader:
         self.extra                  = None
         self.exit_on_load_failures  = exit_on_load_failures
         self.factory                = TaskFactory()
+        self.spec_cache             = SpecCache()
+        self.lazy                   = LAZY_SPECS
 
     def setup(self, plugins:ChainGuard, extra:Maybe[ChainGuard]=None) -> Self:
         logging.debug("---- Registering Task Builders")
@@ -179,7 +203,7 @@ class TaskLoader:
             logging.debug("Loading Tasks from Config files")
             for source in doot.configs_loaded_from: # type: ignore[attr-defined]
                 try:
-                    source_data : ChainGuard = ChainGuard.load(source) # type: ignore[attr-defined]
+                    source_data : ChainGuard = doot.load_toml(source) # type: ignore[attr-defined]
                     task_specs = source_data.on_fail({}).tasks() # type: ignore[attr-defined]
                 except OSError as err:
                     logging.exception("Failed to Load Config File: %s : %s", source, err.args)
@@ -195,8 +219,11 @@ class TaskLoader:
 
             task_sources = doot.config.on_fail([doot.locs[".tasks"]], list).startup.sources.tasks.sources(wrapper=loc_wrapper)  # type: ignore[index, union-attr]
             logging.debug("Loading tasks from sources: %s", [str(x) for x in task_sources])
+            self.spec_cache = self._build_spec_cache()
             for path in task_sources:
                 self._load_specs_from_path(path)
+            else:
+                self.spec_cache.save()
 
         logging.info("---- Loading Tasks took: %s", timer.total_s)
 
@@ -238,9 +265,29 @@ class TaskLoader:
         logging.info("Loaded Tasks from: %s", source)
         return raw_specs
 
+    def _build_spec_cache(self) -> SpecCache:
+        """ The on-disk spec cache, from startup.spec_cache, under the temp location by default.
+        Set it to false to disable caching.
+
+        Its context is what building a spec resolves names with:
+        the task builders, and the aliases for ctors and actions (eg: from plugins),
+        so changing them rebuilds every file.
+        """
+        path     : Maybe[pl.Path]
+        context  : str
+        match SPEC_CACHE:
+            case str() as x:
+                path = doot.locs[x] or None
+            case _:
+                path = None
+
+        aliases  = json.dumps(doot.aliases._table(), sort_keys=True, default=str) # type: ignore[attr-defined]
+        context  = ";".join([*(f"{k}={v}" for k,v in sorted(self.task_builders.items(), key=lambda x: x[0])),
+                             f"aliases={hashlib.sha256(aliases.encode()).hexdigest()}"])
+        return SpecCache(path=path, context=context)
+
     def _load_specs_from_path(self, path:pl.Path) -> None:
         """ load a config file defined task_sources of tasks """
-        data : ChainGuard
         assert(hasattr(doot, "verify_config_version"))
         targets   = []
         if path.is_dir():
@@ -251,84 +298,145 @@ class TaskLoader:
             assert(not path.exists())
 
         for task_file in targets:
-            logging.info("Loading Tasks from: %s", task_file)
-            try:
-                data = ChainGuard.load(task_file) # type: ignore[attr-defined]
-                doot.verify_config_version(data.on_fail(None).doot_version(), source=task_file) # type: ignore[attr-defined]
-            except OSError as err:
-                self.failures[task_file].append(str(err))
-            except doot.errors.VersionMismatchError as err:
-                if "startup" not in data:
-                    # startup designates a config file, which is handled in main
-                    self.failures[task_file].append("Version mismatch")
-            else:
-                doot.update_global_task_state(data, source=task_file) # type: ignore[attr-defined]
-
-                raw_specs : list = []
-                for group, val in data.on_fail({}).tasks().items(): # type: ignore[attr-defined]
-                    # sets 'group' for each task if it hasn't been set already
-                    raw_specs += map(ftz.partial(apply_group_and_source, group, task_file), val)
+            self._add_task_file(self._read_task_file(task_file))
 
-                self._build_task_specs(raw_specs, source=task_file)
+    def _read_task_file(self, task_file:pl.Path) -> TaskFile_d:
+        """ Read a task file and build its specs, or get them from the spec cache if not lazy.
+        Doesn't modify the loader.
+        """
+        data    : ChainGuard
+        result  : TaskFile_d = TaskFile_d(path=task_file, fingerprint=self._fingerprint(task_file))
+        logging.info("Loading Tasks from: %s", task_file)
+        if result.fingerprint is not None:
+            result.cached = self.spec_cache.get(task_file, result.fingerprint)
+        if result.cached is not None:
+            return result
+
+        try:
+            data = doot.load_toml(task_file) # type: ignore[attr-defined]
+            doot.verify_config_version(data.on_fail(None).doot_version(), source=task_file) # type: ignore[attr-defined]
+        except OSError as err:
+            result.failure = str(err)
+        except doot.errors.VersionMismatchError as err:
+            if "startup" not in data:
+                # startup designates a config file, which is handled in main
+                result.failure = "Version mismatch"
+        else:
+            raw_specs : list = []
+            for group, val in data.on_fail({}).tasks().items(): # type: ignore[attr-defined]
+                # sets 'group' for each task if it hasn't been set already
+                raw_specs += map(ftz.partial(apply_group_and_source, group, task_file), val)
+
+            result.data   = data
+            result.built  = [self._prepare(x) for x in raw_specs]
+
+        return result
+
+    def _add_task_file(self, result:TaskFile_d) -> None:
+        """ Add the results of reading a task file, in order """
+        task_file = result.path
+        match result:
+            case TaskFile_d(cached=CachedSource_d() as cached):
+                doot.update_global_task_state(ChainGuard({DootAPI.GLOBAL_STATE_KEY: cached.state}), source=task_file) # type: ignore[attr-defined]
+                for spec in cached.specs:
+                    self._add_task_spec(spec, source=task_file)
+                self._load_location_updates([ChainGuard(x) for x in cached.locations], task_file)
+            case TaskFile_d(failure=str() as msg):
+                self.failures[task_file].append(msg)
+            case TaskFile_d(data=None):
+                pass
+            case TaskFile_d(data=ChainGuard() as data):
+                doot.update_global_task_state(data, source=task_file) # type: ignore[attr-defined]
+                logging.info("---- Building Task Specs (%s Current, %s Potential) ", len(self.tasks), len(result.built))
+                added = self._add_built_specs(result.built, source=task_file)
                 self._load_location_updates(data.on_fail([]).locations(), task_file) # type: ignore[attr-defined]
-
-    def _build_task_specs(self, specs:list[dict], source:Maybe[str|pl.Path]=None) -> None:  # noqa: PLR0912
+                if result.fingerprint is not None and task_file not in self.failures:
+                    table = data._table()
+                    self.spec_cache.put(task_file, CachedSource_d(fingerprint=result.fingerprint,
+                                                                  specs=added,
+                                                                  state=table.get(DootAPI.GLOBAL_STATE_KEY, []),
+                                                                  locations=table.get("locations", [])))
+
+    def _fingerprint(self, task_file:pl.Path) -> Maybe[Fingerprint]:
+        """ The task file's fingerprint for the spec cache, if caching.
+        Lazy specs aren't built when read, so aren't cached
+        """
+        if self.lazy or not self.spec_cache.enabled:
+            return None
+        try:
+            return self.spec_cache.fingerprint(task_file)
+        except OSError:
+            return None
+
+    def _build_task_specs(self, specs:list[dict], source:Maybe[str|pl.Path]=None) -> list[TaskSpec_i]:
         """
         convert raw dicts into TaskSpec objects
-
+        returns the specs that were added
         """
         logging.info("---- Building Task Specs (%s Current, %s Potential) ", len(self.tasks), len(specs))
-        source = source or "<Sourceless>"
-
-        def _allow_registration(task_name:TaskName_p|str) -> bool:
-            """ precondition to check for overrides/name conflicts """
-            logging.info("Checking: %s", task_name)
-            if allow_overloads:
-                return True
-            return task_name not in self.tasks
-
-        for spec in specs:
-            logging.info("Processing: %s", spec['name'])
-            task_alias = "task"
-            task_spec  = None
-            try:
-                match spec:
-                    case {"name": task_name, "ctor": CodeReference() as ctor}:
-                        task_spec = self.factory.build(spec)
-                    case {"name": task_name, "ctor": str() as task_alias} if task_alias in self.task_builders:
-                        spec['ctor'] = CodeReference(self.task_builders[task_alias])
-                        task_spec = self.factory.build(spec)
-                    case {"name": task_name}:
-                        task_spec = self.factory.build(spec)
-                    case _: # Else complain
-                        raise doot.errors.StructLoadError("Task Spec missing, at least, needs at least a name and ctor", spec, spec['sources'][0] )
-            except ValidationError as err:
-                for suberr in err.errors():
-                    locs = ", ".join(suberr['loc'])
-                    self.failures[source].append(f"({locs}) : '{suberr['input']}' :- {suberr['msg']}")
-            except StrangError as err:
-                self.failures[source].append(err)
-            except LocationError as err:
-                self.failures[source].append(err)
-            except ModuleNotFoundError as err:
-                self.failures[source].append(err)
-            except AttributeError as err:
-                self.failures[source].append(err)
-            except ValueError as err:
-                self.failures[source].append(err)
-            except TypeError as err:
-                self.failures[source].append(err)
-            except ImportError as err:
-                self.failures[source].append(err)
-            else:
-                assert(task_spec is not None)
-                if _allow_registration(task_spec.name): # complain on overload
-                    logging.info("Registering Task: %s", task_spec.name)
-                    self.tasks[task_spec.name] = task_spec
-                else:
-                    logging.warning("Current Tasks: %s", self.tasks)
-                    _err = doot.errors.StructLoadError("Task Name Overloaded", task_name)
-                    self.failures[source].append(_err)
+        return self._add_built_specs([self._prepare(x) for x in specs], source=source or "<Sourceless>")
+
+    def _prepare(self, spec:dict) -> TaskSpec_i|LazySpec|Exception:
+        """ Build a raw spec, or in lazy mode, index it to be built when it's used """
+        match spec:
+            case {"name": _} if self.lazy:
+                try:
+                    return LazySpec(spec, build=self._try_build, source=spec.get("sources", [None])[-1])
+                except StrangError as err:
+                    return err
+            case _:
+                return self._try_build(spec)
+
+    def _try_build(self, spec:dict) -> TaskSpec_i|Exception:
+        """ Build a raw spec, returning the error if it fails """
+        logging.info("Processing: %s", spec['name'])
+        task_alias = "task"
+        try:
+            match spec:
+                case {"name": task_name, "ctor": CodeReference() as ctor}:
+                    return self.factory.build(spec)
+                case {"name": task_name, "ctor": str() as task_alias} if task_alias in self.task_builders:
+                    spec['ctor'] = CodeReference(self.task_builders[task_alias])
+                    return self.factory.build(spec)
+                case {"name": task_name}:
+                    return self.factory.build(spec)
+                case _: # Else complain
+                    raise doot.errors.StructLoadError("Task Spec missing, at least, needs at least a name and ctor", spec, spec['sources'][0] )
+        except BUILD_ERRORS as err:
+            return err
+
+    def _add_built_specs(self, built:list[TaskSpec_i|LazySpec|Exception], *, source:str|pl.Path) -> list[TaskSpec_i]:
+        """ Add built specs in order, recording failures.
+        returns the specs that were added
+        """
+        added : list[TaskSpec_i] = []
+        for x in built:
+            match x:
+                case ValidationError() as err:
+                    for suberr in err.errors():
+                        locs = ", ".join(suberr['loc'])
+                        self.failures[source].append(f"({locs}) : '{suberr['input']}' :- {suberr['msg']}")
+                case Exception() as err:
+                    self.failures[source].append(err)
+                case task_spec if self._add_task_spec(task_spec, source=source):
+                    added.append(task_spec)
+                case _:
+                    pass
+        else:
+            return added
+
+    def _add_task_spec(self, task_spec:TaskSpec_i, *, source:str|pl.Path) -> bool:
+        """ Add a built spec, complaining on overloads """
+        logging.info("Checking: %s", task_spec.name)
+        if allow_overloads or task_spec.name not in self.tasks:
+            logging.info("Registering Task: %s", task_spec.name)
+            self.tasks[task_spec.name] = task_spec
+            return True
+
+        logging.warning("Current Tasks: %s", self.tasks)
+        _err = doot.errors.StructLoadError("Task Name Overloaded", task_spec.name)
+        self.failures[source].append(_err)
+        return False
 
     def _load_location_updates(self, data:list[ChainGuard], source:str|pl.Path) -> None:
         logging.debug("Loading Location Updates: %s", source)
@@ -47,6 +47,7 @@ from jgdv.util.plugins.selector import plugin_selector
 import doot
 import doot._interface as API  # noqa: N812
 from doot.cmds._interface import AcceptsSubcmds_p
+from .loaders.cmd import LazyCommand
 import doot.errors as derrs
 
 # ##-- end 1st party imports
@@ -143,7 +144,7 @@ class CLIController:
 
     def parse_args(self, obj:DM, *, override:Maybe[list]=None) -> None:
         """ use loaded cmd and tasks to parse sys.argv """
-        cmds            : list
+        cmds            : dict[str, Command_p]
         subcmds         : list
         unaliased_args  : list[str]
         implicits       : dict[str,list[str]]
@@ -151,15 +152,15 @@ class CLIController:
         ##--|
         parser          = self._load_cli_parser(obj,
                                                 target=doot.config.on_fail("default").startup.loaders.parser())
-        cmds            = list(doot.loaded_cmds.values())
-        subcmds         = self._map_subcmd_constraints()
         unaliased_args  = self._unalias_raw_args(obj)
         implicits       = self._construct_implicits()
+        cmds            = self._callable_cmds(unaliased_args, implicits)
+        subcmds         = self._map_subcmd_constraints(cmds)
 
         try:
             cli_args  = parser(unaliased_args,
                                prog=cast("ParamSource_p", obj),
-                               cmds=cmds,
+                               cmds=list(cmds.values()),
                                subs=subcmds,
                                implicits=implicits,
                                )
@@ -243,8 +244,27 @@ class CLIController:
                 raise TypeError(type(x))
         return result
 
-    def _map_subcmd_constraints(self) -> list[tuple[tuple[str, ...], ParamSource_p]]:
-        subcmd_handlers  = tuple(x for x,y in doot.loaded_cmds.items() if isinstance(y, AcceptsSubcmds_p))
+    def _callable_cmds(self, args:list[str], implicits:dict[str, list[str]]) -> dict[str, Command_p]:
+        """ The loaded cmds the args can call, loaded if they are lazy.
+
+        The parser only recognises a cmd by its literal name,
+        so cmds not named in the args, or as an implicit cmd, are left unloaded.
+        """
+        names  = {*args, *implicits.keys()}
+        result = {}
+        for name, cmd in doot.loaded_cmds.items():
+            match cmd:
+                case _ if name not in names:
+                    continue
+                case LazyCommand():
+                    result[name] = cmd.materialise()
+                case _:
+                    result[name] = cmd
+        else:
+            return result
+
+    def _map_subcmd_constraints(self, cmds:dict[str, Command_p]) -> list[tuple[tuple[str, ...], ParamSource_p]]:
+        subcmd_handlers  = tuple(x for x,y in cmds.items() if isinstance(y, AcceptsSubcmds_p))
         subcmds          = [(subcmd_handlers, x) for x in doot.loaded_tasks.values()]
         return subcmds
 
@@ -281,6 +301,8 @@ class CmdController:
         ##--|
         logging.debug("Initial Retrieval attempt: %s", cmd)
         match doot.loaded_cmds.get(cmd, None):
+            case LazyCommand() as x:
+                return x.materialise()
             case Command_p() as x:
                 return x
             case x:
@@ -166,7 +166,7 @@ class StartupController:
         ##--| Load config Files
         for existing in existing_targets:
             try:
-                config = ChainGuard.load(existing)
+                config = obj.load_toml(existing)
             except OSError as err:
                 raise DErr.InvalidConfigError(existing_targets, *err.args) from err
             else:
@@ -196,7 +196,7 @@ class StartupController:
                 pass
             case pl.Path() as const_file if const_file.exists():
                 obj.report.gen.trace("Loading Constants")
-                base_data = ChainGuard.load(const_file)
+                base_data = obj.load_toml(const_file)
                 obj.verify_config_version(base_data.on_fail(None).doot_version(), source=const_file)
                 obj.constants = base_data.remove_prefix(DootAPI.CONSTANT_PREFIX)
 
@@ -221,7 +221,7 @@ class StartupController:
         match target:
             case pl.Path() as source if source.exists():
                 obj.report.gen.trace("Loading Aliases: %s", source) # type: ignore[arg-type]
-                base_data = ChainGuard.load(source)
+                base_data = obj.load_toml(source)
                 assert(isinstance(base_data, ChainGuard))
                 obj.verify_config_version(base_data.on_fail(None).doot_version(), source=source)
                 base_data = base_data.remove_prefix(DootAPI.ALIAS_PREFIX)
@@ -342,6 +342,7 @@ class DootOverlord:
     path_ext             : list[str]
     configs_loaded_from  : list[str|pl.Path]
     is_setup             : bool
+    _parsed              : dict[pl.Path, tuple[tuple[int, int], ChainGuard]]
 
     def __init__(self, *args:Any, **kwargs:Any):
         super().__init__(*args, **kwargs)
@@ -352,6 +353,7 @@ class DootOverlord:
         self.path_ext             = []
         self.configs_loaded_from  = []
         self.is_setup             = False
+        self._parsed              = {}
         self.config               = empty_chain
         self.constants            = empty_chain
         self.aliases              = empty_chain
@@ -392,6 +394,26 @@ class DootOverlord:
     def load(self) -> None:
         self._plugin.load(self)
 
+    def load_toml(self, path:str|pl.Path) -> ChainGuard:
+        """ Parse a toml file, reusing the result if it has already been parsed.
+
+        Shared by the startup controller and the loaders, so a file, like a pyproject.toml,
+        is only read and parsed once per process.
+        A file which has changed since it was parsed, by mtime or size, is parsed again.
+        The result is shared, so copy anything taken from it before modifying it.
+        raises OSError if it can't be read
+        """
+        path   = pl.Path(path).resolve()
+        stat   = path.stat()
+        sig    = (stat.st_mtime_ns, stat.st_size)
+        match self._parsed.get(path, None):
+            case (prior, ChainGuard() as data) if prior == sig:
+                return data
+            case _:
+                data = ChainGuard.load(path)
+                self._parsed[path] = (sig, data)
+                return data
+
     def load_reporter(self, target:str="default") -> None:
         if not bool(self.loaded_plugins):
             raise RuntimeError("Tried to Load Reporter without loading loaded_plugins")
@@ -3,3 +3,8 @@
 """
 
 from .runner import DootRunner
+from .parallel_runner import DootParallelRunner
+from .plan_runner import DootPlanRunner
+from .process_runner import DootProcessRunner
+from .async_runner import DootAsyncRunner
+from .remote_runner import DootRemoteRunner
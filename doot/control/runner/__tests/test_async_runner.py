@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, ARG002, ARG001, E712
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import asyncio
+import threading
+import warnings
+from types import MethodType
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.runner.async_runner import AsyncActionExecutor, DootAsyncRunner
+from doot.control.tracker import NaiveTracker
+from doot.workflow.factory import TaskFactory
+from doot.workflow import ActionSpec, DootTask
+from doot.workflow._interface import TaskStatus_e
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+factory = TaskFactory()
+
+logmod.getLogger("doot.control.tracker").propagate = False
+
+class _MockObjs_m:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return NaiveTracker()
+
+    @pytest.fixture(scope="function")
+    def runner(self, tracker):
+        return DootAsyncRunner(tracker=tracker, jobs=50)
+
+    def _statuses(self, tracker) -> set:
+        return {x.task.status if isinstance(x.task, DootTask) else x.task for k,x in tracker.specs.items() if k.uuid()}
+
+    def _queue(self, tracker, *specs) -> None:
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+class TestAsyncActionExecutor:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_is_async(self):
+
+        async def action(spec, state):
+            pass
+
+        assert(AsyncActionExecutor.is_async(ActionSpec(fun=action)))
+
+    def test_is_not_async(self):
+
+        def action(spec, state):
+            pass
+
+        assert(not AsyncActionExecutor.is_async(ActionSpec(fun=action)))
+
+    def test_sync_executor_awaits(self):
+        """ the basic executor runs a returned coroutine to completion """
+
+        async def inner():
+            return {"val": 5}
+
+        def action(spec, state):
+            return inner()
+
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=action)], "sleep":0})
+        task = DootTask(spec)
+        AsyncActionExecutor().execute_action_group(task, group="actions", large_step=0)
+        assert(task.internal_state['val'] == 5)
+
+class TestAsyncRunner(_MockObjs_m):
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self, runner):
+        assert(isinstance(runner, DootAsyncRunner))
+        assert(isinstance(runner, API.WorkflowRunner_p))
+        assert(isinstance(runner, API.ParallelRunner_p))
+        assert(runner.jobs == 50)
+
+    def test_ctor_fails_with_sync_executor(self, tracker):
+        from doot.control.runner.runner import ActionExecutor  # noqa: PLC0415
+        with pytest.raises(TypeError):
+            DootAsyncRunner(tracker=tracker, executor=ActionExecutor())
+
+    def test_async_actions_interleave(self, tracker, runner):
+        """ every task waits on an event set by the last task to start, so must run concurrently """
+        started = []
+        count   = 20
+        event   = asyncio.Event()
+
+        async def action(spec, state):
+            started.append(state['_task_name'])
+            if len(started) == count:
+                event.set()
+            await asyncio.wait_for(event.wait(), timeout=5)
+            return {"done": True}
+
+        specs = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=action)], "sleep":0}) for i in range(count)]
+        self._queue(tracker, *specs)
+
+        with runner:
+            runner()
+
+        assert(len(started) == count)
+        assert(self._statuses(tracker) == {TaskStatus_e.DEAD})
+
+    def test_blocking_actions_use_threads(self, tracker, runner):
+        threads = set()
+
+        def action(spec, state):
+            threads.add(threading.get_ident())
+
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=action)], "sleep":0})
+        self._queue(tracker, spec)
+
+        with runner:
+            runner()
+
+        assert(bool(threads))
+        assert(threading.get_ident() not in threads)
+
+    def test_state_updated(self, tracker, runner):
+        results = []
+
+        async def first(spec, state):
+            return {"val": 2}
+
+        def second(spec, state):
+            results.append(state['val'])
+
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=first), ActionSpec(fun=second)], "sleep":0})
+        self._queue(tracker, spec)
+
+        with runner:
+            runner()
+
+        assert(results == [2])
+
+    def test_dependencies_respected(self, tracker, runner):
+        order = []
+
+        async def action(spec, state):
+            order.append(state['_task_name'].de_uniq())
+
+        dep   = factory.build({"name":"basic::dep", "actions":[ActionSpec(fun=action)], "sleep":0})
+        spec  = factory.build({"name":"basic::task", "depends_on":["basic::dep"], "actions":[ActionSpec(fun=action)], "sleep":0})
+        tracker.register(dep, spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(order == [dep.name, spec.name])
+
+    def test_failure(self, tracker, runner):
+
+        async def action(spec, state):
+            return False
+
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=action)], "sleep":0})
+        self._queue(tracker, spec)
+
+        with pytest.raises(doot.errors.TaskFailed):  # noqa: PT012
+            with runner:
+                runner()
+
+    def test_job_generates_tasks(self, tracker, runner):
+        calls = []
+
+        async def sub_action(spec, state):
+            calls.append(state['_task_name'])
+
+        async def job_action(spec, state):
+            return [factory.build({"name":f"basic::sub.{i}", "actions":[ActionSpec(fun=sub_action)], "sleep":0}) for i in range(3)]
+
+        job = factory.build({"name":"basic::+.job", "actions":[ActionSpec(fun=job_action)], "sleep":0})
+        self._queue(tracker, job)
+
+        with runner:
+            runner()
+
+        assert(len(calls) == 3)
+
+    def test_job_queue_failure_awaits_on_fail(self, tracker, runner, mocker):
+        calls = []
+
+        async def job_action(spec, state):
+            return [factory.build({"name":"basic::sub", "sleep":0})]
+
+        async def fail_action(spec, state):
+            calls.append(state['_task_name'])
+
+        job = factory.build({"name":"basic::+.job", "actions":[ActionSpec(fun=job_action)], "on_fail":[ActionSpec(fun=fail_action)], "sleep":0})
+        self._queue(tracker, job)
+        mocker.patch.object(runner, "_queue_more_tasks", side_effect=doot.errors.TaskFailed("Bad generated task", task=job))
+        with pytest.raises(doot.errors.TaskFailed):  # noqa: PT012
+            with runner:
+                runner()
+
+        assert(len(calls) == 1)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, ARG002, ARG001, E712
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import threading
+import warnings
+from types import MethodType
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.runner.parallel_runner import DootParallelRunner
+from doot.control.tracker import NaiveTracker
+from doot.workflow.factory import TaskFactory
+from doot.workflow import ActionSpec, DootTask
+from doot.workflow._interface import TaskStatus_e
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+factory = TaskFactory()
+
+logmod.getLogger("doot.control.tracker").propagate = False
+
+class _MockObjs_m:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return NaiveTracker()
+
+    @pytest.fixture(scope="function")
+    def runner(self, tracker):
+        return DootParallelRunner(tracker=tracker, jobs=4)
+
+    def _statuses(self, tracker) -> set:
+        return {x.task.status if isinstance(x.task, DootTask) else x.task for k,x in tracker.specs.items() if k.uuid()}
+
+class TestParallelRunner(_MockObjs_m):
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self, runner):
+        assert(isinstance(runner, DootParallelRunner))
+        assert(isinstance(runner, API.WorkflowRunner_p))
+        assert(isinstance(runner, API.ParallelRunner_p))
+        assert(runner.jobs == 4)
+
+    def test_min_jobs(self, tracker):
+        runner = DootParallelRunner(tracker=tracker, jobs=-2)
+        assert(runner.jobs == 1)
+
+    def test_runs_all_tasks(self, tracker, runner):
+        calls = []
+
+        def action(spec, state):
+            calls.append(state['_task_name'])
+
+        specs = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=action)], "sleep":0}) for i in range(6)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(len(calls) == 6)
+        assert(self._statuses(tracker) == {TaskStatus_e.DEAD})
+
+    def test_tasks_run_concurrently(self, tracker, runner):
+        """ each task waits on a barrier that only releases if all 4 run at once """
+        barrier = threading.Barrier(4, timeout=5)
+
+        def action(spec, state):
+            barrier.wait()
+
+        specs = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=action)], "sleep":0}) for i in range(4)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(not barrier.broken)
+        assert(self._statuses(tracker) == {TaskStatus_e.DEAD})
+
+    def test_dependencies_respected(self, tracker, runner):
+        order = []
+
+        def action(spec, state):
+            order.append(state['_task_name'].de_uniq())
+
+        dep   = factory.build({"name":"basic::dep", "actions":[ActionSpec(fun=action)], "sleep":0})
+        spec  = factory.build({"name":"basic::task", "depends_on":["basic::dep"], "actions":[ActionSpec(fun=action)], "sleep":0})
+        tracker.register(dep, spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(order == [dep.name, spec.name])
+
+    def test_failure_halts_task(self, tracker, runner):
+        calls = []
+
+        def bad_action(spec, state):
+            return False
+
+        def good_action(spec, state):
+            calls.append(state['_task_name'])
+
+        bad   = factory.build({"name":"basic::bad", "actions":[ActionSpec(fun=bad_action)], "sleep":0})
+        after = factory.build({"name":"basic::after", "depends_on":["basic::bad"], "actions":[ActionSpec(fun=good_action)], "sleep":0})
+        tracker.register(bad, after)
+        tracker.queue(after.name, from_user=True)
+
+        with pytest.raises(doot.errors.TaskFailed):  # noqa: PT012
+            with runner:
+                runner()
+
+        assert(not bool(calls))
+
+    def test_job_generates_tasks(self, tracker, runner):
+        calls = []
+
+        def sub_action(spec, state):
+            calls.append(state['_task_name'])
+
+        def job_action(spec, state):
+            return [factory.build({"name":f"basic::sub.{i}", "actions":[ActionSpec(fun=sub_action)], "sleep":0}) for i in range(3)]
+
+        job = factory.build({"name":"basic::+.job", "actions":[ActionSpec(fun=job_action)], "sleep":0})
+        tracker.register(job)
+        tracker.queue(job.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(len(calls) == 3)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, ARG002, ARG001, E712
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import os
+import warnings
+from types import MethodType
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.runner.process_runner import DootProcessRunner, WorkerSetup_d, _ProcessWorker_m
+from doot.control.tracker import NaiveTracker
+from doot.workflow.factory import TaskFactory
+from doot.workflow import ActionSpec, DootTask
+from doot.workflow._interface import TaskStatus_e
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+factory = TaskFactory()
+
+logmod.getLogger("doot.control.tracker").propagate = False
+
+##--| module level actions, so workers can import them
+
+def pid_action(spec, state):
+    return {"pid": os.getpid()}
+
+def double_action(spec, state):
+    return {"value": state['value'] * 2}
+
+def fail_action(spec, state):
+    return False
+
+def append_action(spec, state):
+    state['items'].append(len(state['items']))
+
+def loc_action(spec, state):
+    return {"loc": str(doot.locs["{process_runner_test}"])}
+
+def record_action(calls, spec, state):
+    calls.append(os.getpid())
+
+class CallableAction:
+
+    def __call__(self, spec, state):
+        return {"pid": os.getpid()}
+
+class ArgsAction:
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, spec, state):
+        return {"value": self.value}
+
+    def method(self, spec, state):
+        return {"value": self.value}
+
+##--|
+
+class _MockObjs_m:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return NaiveTracker()
+
+    @pytest.fixture(scope="function")
+    def runner(self, tracker):
+        return DootProcessRunner(tracker=tracker, jobs=2, batch=3)
+
+    def _tasks(self, tracker) -> list[DootTask]:
+        return [x.task for k,x in tracker.specs.items() if k.uuid() and not k.is_cleanup() and isinstance(x.task, DootTask)]
+
+    def _statuses(self, tracker) -> set:
+        return {x.task.status if isinstance(x.task, DootTask) else x.task for k,x in tracker.specs.items() if k.uuid()}
+
+class TestProcessRunner(_MockObjs_m):
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self, runner):
+        assert(isinstance(runner, DootProcessRunner))
+        assert(isinstance(runner, API.WorkflowRunner_p))
+        assert(isinstance(runner, API.ParallelRunner_p))
+        assert(runner.jobs == 2)
+        assert(runner.batch == 3)
+
+    def test_payload(self, runner):
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=pid_action)], "sleep":0})
+        task = DootTask(spec)
+        task.prepare_actions()
+        assert(isinstance(runner._make_payload(task, 0), bytes))
+
+    def test_payload_local_fn(self, runner):
+
+        def action(spec, state):
+            pass
+
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=action)], "sleep":0})
+        task = DootTask(spec)
+        task.prepare_actions()
+        assert(runner._make_payload(task, 0) is None)
+
+    def test_payload_callable_instance(self, runner):
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=CallableAction())], "sleep":0})
+        task = DootTask(spec)
+        task.prepare_actions()
+        assert(isinstance(runner._make_payload(task, 0), bytes))
+
+    @pytest.mark.parametrize("fun", [ftz.partial(double_action),
+                                     ArgsAction(2),
+                                     ArgsAction(2).method,
+                                     print,
+                                     ])
+    def test_payload_unbuildable_callable(self, runner, fun):
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=fun)], "sleep":0})
+        task = DootTask(spec)
+        task.prepare_actions()
+        assert(runner._make_payload(task, 0) is None)
+
+    def test_runs_in_workers(self, tracker, runner):
+        specs = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=pid_action)], "sleep":0}) for i in range(6)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        tasks = self._tasks(tracker)
+        assert(len(tasks) == 6)
+        assert(self._statuses(tracker) == {TaskStatus_e.DEAD})
+        assert(all(x.internal_state['pid'] != os.getpid() for x in tasks))
+
+    def test_state_merged(self, tracker, runner):
+        spec = factory.build({"name":"basic::task", "value":2, "actions":[ActionSpec(fun=double_action), ActionSpec(fun=double_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        match self._tasks(tracker):
+            case [task]:
+                assert(task.internal_state['value'] == 8)
+            case x:
+                assert(False), x
+
+    def test_state_modified_in_place_merged(self, tracker, runner):
+        spec = factory.build({"name":"basic::task", "items":[], "actions":[ActionSpec(fun=append_action), ActionSpec(fun=append_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        match self._tasks(tracker):
+            case [task]:
+                assert(task.internal_state['items'] == [0, 1])
+            case x:
+                assert(False), x
+
+    def test_workers_share_locations(self, tracker, runner, tmp_path):
+        doot.locs.Current.update({"process_runner_test": str(tmp_path / "blah")}, strict=False)
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=loc_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        match self._tasks(tracker):
+            case [task]:
+                assert(task.internal_state['loc'] == str(tmp_path / "blah"))
+            case x:
+                assert(False), x
+
+    def test_unshippable_runs_locally(self, tracker, runner):
+        calls = []
+
+        def action(spec, state):
+            calls.append(os.getpid())
+
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(calls == [os.getpid()])
+
+    def test_partial_runs_locally(self, tracker, runner):
+        calls = []
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=ftz.partial(record_action, calls))], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(calls == [os.getpid()])
+
+    def test_failure(self, tracker, runner):
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=fail_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with pytest.raises(doot.errors.TaskFailed):  # noqa: PT012
+            with runner:
+                runner()
+
+class TestProcessWorker:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_changed_finds_in_place_changes(self):
+        original  = {"a": [1], "b": 2, "c": {"d": 3}}
+        state     = {"a": [1, 2], "b": 2, "c": {"d": 3}, "e": 4}
+        assert(_ProcessWorker_m.changed(original, state) == {"a": [1, 2], "e": 4})
+
+    def test_setup_current(self):
+        setup = WorkerSetup_d.current()
+        assert(setup.reporter is type(doot.report))
+        assert(all(isinstance(x, str) for x in setup.locations.values()))
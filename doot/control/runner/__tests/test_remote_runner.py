@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, ARG002, ARG001, E712
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import json
+import logging as logmod
+import pathlib as pl
+import os
+import socket
+import threading
+import warnings
+from types import MethodType
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.runner.process_runner import _ProcessWorker_m
+from doot.control.runner.remote_runner import (TOKEN_ENV, DootRemoteRunner, Message_e, RemoteWorkerPool,
+                                               parse_address, recv_frame, recv_message,
+                                               send_frame, send_message, serve)
+from doot.control.tracker import NaiveTracker
+from doot.workflow.factory import TaskFactory
+from doot.workflow import ActionSpec, DootTask
+from doot.workflow._interface import TaskStatus_e
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+factory = TaskFactory()
+
+logmod.getLogger("doot.control.tracker").propagate = False
+
+##--| module level actions, so workers can import them
+
+def pid_action(spec, state):
+    return {"pid": os.getpid()}
+
+def double_action(spec, state):
+    return {"value": state['value'] * 2}
+
+def fail_action(spec, state):
+    return False
+
+##--|
+
+class _MockObjs_m:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return NaiveTracker()
+
+    @pytest.fixture(scope="function")
+    def address(self, tmp_path):
+        return f"unix:{tmp_path / 'workers.sock'}"
+
+    @pytest.fixture(scope="function")
+    def runner(self, tracker, address):
+        return DootRemoteRunner(tracker=tracker, jobs=2, batch=2, address=address, token="test", local=2)
+
+    def _tasks(self, tracker) -> list[DootTask]:
+        return [x.task for k,x in tracker.specs.items() if k.uuid() and not k.is_cleanup() and isinstance(x.task, DootTask)]
+
+    def _statuses(self, tracker) -> set:
+        return {x.task.status if isinstance(x.task, DootTask) else x.task for k,x in tracker.specs.items() if k.uuid()}
+
+    def _payload(self, runner, name:str, *actions) -> bytes:
+        task = DootTask(factory.build({"name":name, "value":1, "actions":[ActionSpec(fun=x) for x in actions], "sleep":0}))
+        task.prepare_actions()
+        return runner._make_payload(task, 0)
+
+class TestProtocol:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_parse_unix(self):
+        assert(parse_address("unix:/tmp/blah.sock") == (socket.AF_UNIX, "/tmp/blah.sock"))
+
+    def test_parse_tcp(self):
+        assert(parse_address("example.com:5000") == (socket.AF_INET, ("example.com", 5000)))
+
+    def test_parse_tcp_no_host(self):
+        assert(parse_address(":5000") == (socket.AF_INET, ("localhost", 5000)))
+
+    def test_parse_bad(self):
+        with pytest.raises(doot.errors.ConfigError):
+            parse_address("blah")
+
+    def test_frame_roundtrip(self):
+        left, right = socket.socketpair()
+        with left, right:
+            send_frame(left, b"blah")
+            send_frame(left, b"")
+            assert(recv_frame(right) == b"blah")
+            assert(recv_frame(right) == b"")
+
+    def test_message_roundtrip(self):
+        left, right = socket.socketpair()
+        with left, right:
+            send_message(left, Message_e.TASKS, [b"a", b"b"])
+            send_message(left, Message_e.STOP)
+            assert(recv_message(right) == (Message_e.TASKS, [b"a", b"b"]))
+            assert(recv_message(right) == (Message_e.STOP, None))
+
+    def test_closed_mid_frame(self):
+        left, right = socket.socketpair()
+        with right:
+            left.sendall(b"\x00\x00\x00\x05ab")
+            left.close()
+            with pytest.raises(ConnectionError):
+                recv_frame(right)
+
+class TestRemoteWorkerPool(_MockObjs_m):
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_only_runs_batches(self, address):
+        pool = RemoteWorkerPool(address, token="test")
+        with pytest.raises(TypeError):
+            pool.submit(print, [])
+
+    def test_thread_worker(self, runner, address):
+        payload = self._payload(runner, "basic::task", double_action)
+        with RemoteWorkerPool(address, token="test") as pool:
+            fut     = pool.submit(_ProcessWorker_m.run_batch, [payload])
+            worker  = threading.Thread(target=serve, args=(address,), kwargs={"token":"test"})
+            worker.start()
+            match fut.result(timeout=10):
+                case [(True, {"value":2}, None)]:
+                    pass
+                case x:
+                    assert(False), x
+
+        worker.join(timeout=5)
+        assert(not worker.is_alive())
+        assert(list(pool.workers.values()) == [1])
+
+    def test_bad_token_rejected(self, address):
+        with RemoteWorkerPool(address, token="test") as pool, pytest.raises(ConnectionError):
+            serve(address, token="wrong", wait=1)
+
+        assert(not bool(pool.workers))
+
+    def test_no_token_without_local_workers(self, address, monkeypatch):
+        monkeypatch.delenv(TOKEN_ENV, raising=False)
+        pool = RemoteWorkerPool(address)
+        with pytest.raises(doot.errors.ConfigError):
+            pool.start()
+
+    def test_no_token_with_local_workers(self, address, monkeypatch):
+        monkeypatch.delenv(TOKEN_ENV, raising=False)
+        with RemoteWorkerPool(address, local=1) as pool:
+            assert(bool(pool.token))
+
+    def test_no_workers_times_out(self, runner, address):
+        payload = self._payload(runner, "basic::task", double_action)
+        with RemoteWorkerPool(address, token="test", wait=0.2) as pool:
+            fut = pool.submit(_ProcessWorker_m.run_batch, [payload])
+            with pytest.raises(doot.errors.ControlError):
+                fut.result(timeout=5)
+            with pytest.raises(doot.errors.ControlError):
+                pool.submit(_ProcessWorker_m.run_batch, [payload]).result(timeout=5)
+
+    def test_lost_worker_requeues(self, runner, address):
+        payload = self._payload(runner, "basic::task", double_action)
+        family, addr = parse_address(address)
+        with RemoteWorkerPool(address, token="test") as pool:
+            fut = pool.submit(_ProcessWorker_m.run_batch, [payload])
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                sock.connect(addr)
+                send_frame(sock, json.dumps({"token":"test", "host":"fake", "pid":0}).encode())
+                send_message(sock, Message_e.PULL)
+                assert(recv_message(sock)[0] == Message_e.TASKS)
+
+            assert(not fut.done())
+            worker = threading.Thread(target=serve, args=(address,), kwargs={"token":"test"})
+            worker.start()
+            assert(fut.result(timeout=10)[0][0] is True)
+
+        worker.join(timeout=5)
+
+class TestRemoteRunner(_MockObjs_m):
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self, runner, address):
+        assert(isinstance(runner, DootRemoteRunner))
+        assert(isinstance(runner, API.WorkflowRunner_p))
+        assert(isinstance(runner, API.ParallelRunner_p))
+        assert(runner.address == address)
+        assert(runner.local == 2)
+
+    def test_runs_in_local_workers(self, tracker, runner):
+        specs = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=pid_action)], "sleep":0}) for i in range(6)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        tasks = self._tasks(tracker)
+        assert(len(tasks) == 6)
+        assert(self._statuses(tracker) == {TaskStatus_e.DEAD})
+        assert(all(x.internal_state['pid'] != os.getpid() for x in tasks))
+
+    def test_state_merged(self, tracker, runner):
+        spec = factory.build({"name":"basic::task", "value":2, "actions":[ActionSpec(fun=double_action), ActionSpec(fun=double_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        match self._tasks(tracker):
+            case [task]:
+                assert(task.internal_state['value'] == 8)
+            case x:
+                assert(False), x
+
+    def test_failure(self, tracker, runner):
+        spec = factory.build({"name":"basic::task", "actions":[ActionSpec(fun=fail_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with pytest.raises(doot.errors.TaskFailed):  # noqa: PT012
+            with runner:
+                runner()
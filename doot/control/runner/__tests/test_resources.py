@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, ARG002, ARG001, E712
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import threading
+import time
+import warnings
+from types import MethodType
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.runner.parallel_runner import DootParallelRunner
+from doot.control.runner.resources import ResourcePools
+from doot.control.runner.timers import GroupThrottle
+from doot.control.tracker import NaiveTracker
+from doot.workflow.factory import TaskFactory
+from doot.workflow import ActionSpec, DootTask, TaskName
+from doot.workflow._interface import TaskStatus_e
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+factory = TaskFactory()
+
+logmod.getLogger("doot.control.tracker").propagate = False
+
+class TestResourcePools:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        pools = ResourcePools({"db":1, "cpu":4})
+        assert(pools.capacity == {"db":1, "cpu":4})
+        assert(pools.available("db") == 1)
+        assert(pools.available("other") is None)
+
+    def test_acquire_release(self):
+        pools = ResourcePools({"db":1})
+        assert(pools.acquire(TaskName("basic::a"), {"db":1}))
+        assert(pools.available("db") == 0)
+        assert(not pools.acquire(TaskName("basic::b"), {"db":1}))
+        pools.release(TaskName("basic::a"))
+        assert(pools.available("db") == 1)
+        assert(pools.acquire(TaskName("basic::b"), {"db":1}))
+
+    def test_acquire_is_all_or_nothing(self):
+        pools = ResourcePools({"db":1, "cpu":2})
+        assert(pools.acquire(TaskName("basic::a"), {"db":1}))
+        assert(not pools.acquire(TaskName("basic::b"), {"cpu":2, "db":1}))
+        assert(pools.available("cpu") == 2)
+
+    def test_acquire_twice(self):
+        pools = ResourcePools({"db":1})
+        assert(pools.acquire(TaskName("basic::a"), {"db":1}))
+        assert(pools.acquire(TaskName("basic::a"), {"db":1}))
+        assert(pools.available("db") == 0)
+
+    def test_unknown_pools_are_unlimited(self):
+        pools = ResourcePools({"db":1})
+        assert(pools.acquire(TaskName("basic::a"), {"gpu":100}))
+        assert(pools.acquire(TaskName("basic::b"), {"gpu":100}))
+
+    def test_request_too_large(self):
+        pools = ResourcePools({"db":1})
+        with pytest.raises(doot.errors.TrackingError):
+            pools.acquire(TaskName("basic::a"), {"db":2})
+
+    def test_release_unknown(self):
+        pools = ResourcePools({"db":1})
+        pools.release(TaskName("basic::a"))
+        assert(pools.available("db") == 1)
+
+    def test_requests_of(self):
+        spec = factory.build({"name":"basic::task", "resources":{"db":1, "cpu":2}})
+        task = DootTask(spec)
+        assert(ResourcePools.requests_of(task) == {"db":1, "cpu":2})
+
+class TestResourceAdmission:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return NaiveTracker()
+
+    def test_pool_limits_concurrency(self, tracker):
+        lock    = threading.Lock()
+        running = []
+        peak    = []
+
+        def action(spec, state):
+            with lock:
+                running.append(state['_task_name'])
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(state['_task_name'])
+
+        runner = DootParallelRunner(tracker=tracker, jobs=4, pools=ResourcePools({"db":1}))
+        specs  = [factory.build({"name":f"basic::task.{i}", "resources":{"db":1}, "actions":[ActionSpec(fun=action)], "sleep":0}) for i in range(4)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(len(peak) == 4)
+        assert(max(peak) == 1)
+        assert(runner.pools.available("db") == 1)
+
+    def test_unconstrained_tasks_still_run(self, tracker):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def action(spec, state):
+            barrier.wait()
+
+        runner = DootParallelRunner(tracker=tracker, jobs=4, pools=ResourcePools({"db":1}))
+        specs  = [
+            factory.build({"name":"basic::limited", "resources":{"db":1}, "actions":[ActionSpec(fun=action)], "sleep":0}),
+            factory.build({"name":"basic::free", "actions":[ActionSpec(fun=action)], "sleep":0}),
+            ]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(not barrier.broken)
+
+    def test_failure_releases(self, tracker):
+
+        def bad_action(spec, state):
+            return False
+
+        runner = DootParallelRunner(tracker=tracker, jobs=2, pools=ResourcePools({"db":1}))
+        spec   = factory.build({"name":"basic::bad", "resources":{"db":1}, "actions":[ActionSpec(fun=bad_action)], "sleep":0})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+
+        with pytest.raises(doot.errors.TaskFailed):  # noqa: PT012
+            with runner:
+                runner()
+
+        assert(runner.pools.available("db") == 1)
+
+    def test_parked_task_keeps_its_rate_limit_token(self, tracker):
+        runner = DootParallelRunner(tracker=tracker, jobs=2,
+                                    pools=ResourcePools({"db":1}),
+                                    throttle=GroupThrottle({"basic": {"rate":1, "burst":1}}))
+        task   = DootTask(factory.build({"name":"basic::task", "resources":{"db":1}, "sleep":0}))
+        other  = DootTask(factory.build({"name":"basic::other", "sleep":0}))
+        assert(runner.pools.acquire(TaskName("basic::holder"), {"db":1}))
+        # Parked for the pool, repeatedly, without taking more tokens
+        assert(not runner._admit(task, 0.0))
+        assert(not runner._admit(task, 0.0))
+        assert(not bool(runner._timers))
+        runner.pools.release(TaskName("basic::holder"))
+        assert(runner._admit(task, 0.0))
+        # The task's single token was the group's only one
+        assert(runner.throttle.delay_for(other, 0.0) == 1.0)
@@ -94,6 +94,12 @@ class TestRunner(_MockObjs_m):
         assert(isinstance(ctor, API.WorkflowRunner_p))
         assert(isinstance(ctor, API.RunnerHandlers_p))
 
+    def test_exit_finishes_tracker(self, ctor, mocker, setup_config, runner):
+        """ The tracker is finished even when the run is interrupted """
+        finish_spy = mocker.spy(runner.tracker, "finish")
+        assert(runner.__exit__(KeyboardInterrupt, KeyboardInterrupt(), None) is False)
+        finish_spy.assert_called_once()
+
 @pytest.mark.parametrize("ctor", [DootRunner])
 class TestRunner_Jobs(_MockObjs_m):
 
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, ARG002, ARG001, E712
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import threading
+import time
+import warnings
+from types import MethodType
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+from jgdv.structs.chainguard import ChainGuard
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+from doot.control.runner.parallel_runner import DootParallelRunner
+from doot.control.runner.timers import GroupThrottle, TimerHeap, TokenBucket
+from doot.control.tracker import NaiveTracker
+from doot.workflow.factory import TaskFactory
+from doot.workflow import ActionSpec, DootTask, TaskName
+from doot.workflow._interface import TaskStatus_e
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+factory = TaskFactory()
+
+logmod.getLogger("doot.control.tracker").propagate = False
+class TestTimerHeap:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        timers = TimerHeap()
+        assert(not bool(timers))
+        assert(timers.next_due() is None)
+
+    def test_pop_due(self):
+        timers = TimerHeap()
+        timers.push("b", 2.0)
+        timers.push("a", 1.0)
+        timers.push("c", 3.0)
+        assert(timers.next_due() == 1.0)
+        assert(timers.pop_due(2.0) == ["a", "b"])
+        assert(len(timers) == 1)
+        assert(timers.next_due() == 3.0)
+
+    def test_same_time_is_fifo(self):
+        timers = TimerHeap()
+        for x in ["a", "b", "c"]:
+            timers.push(x, 1.0)
+
+        assert(timers.pop_due(1.0) == ["a", "b", "c"])
+
+    def test_nothing_due(self):
+        timers = TimerHeap()
+        timers.push("a", 5.0)
+        assert(timers.pop_due(1.0) == [])
+        assert(bool(timers))
+
+class TestTokenBucket:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_bad_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_spaces_out_takes(self):
+        bucket = TokenBucket(2)
+        assert(bucket.take(0.0) == 0.0)
+        assert(bucket.take(0.0) == 0.5)
+        assert(bucket.take(0.0) == 1.0)
+
+    def test_refills(self):
+        bucket = TokenBucket(2)
+        assert(bucket.take(0.0) == 0.0)
+        assert(bucket.take(0.5) == 0.0)
+
+    def test_burst(self):
+        bucket = TokenBucket(1, burst=3)
+        assert([bucket.take(0.0) for _ in range(4)] == [0.0, 0.0, 0.0, 1.0])
+
+class TestGroupThrottle:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_no_delay(self):
+        throttle = GroupThrottle()
+        task     = DootTask(factory.build({"name":"basic::task", "sleep":0}))
+        assert(throttle.delay_for(task, 0.0) == 0.0)
+
+    def test_cool_down_delays_group(self):
+        throttle  = GroupThrottle()
+        task      = DootTask(factory.build({"name":"basic::task", "sleep":2}))
+        other     = DootTask(factory.build({"name":"basic::other", "sleep":0}))
+        elsewhere = DootTask(factory.build({"name":"separate::task", "sleep":0}))
+        throttle.cool(task, 10.0)
+        assert(throttle.delay_for(other, 11.0) == 1.0)
+        assert(throttle.delay_for(elsewhere, 11.0) == 0.0)
+        assert(throttle.delay_for(other, 12.0) == 0.0)
+
+    def test_rate_limit(self):
+        throttle = GroupThrottle({"basic": 2})
+        tasks    = [DootTask(factory.build({"name":f"basic::task.{i}", "sleep":0})) for i in range(3)]
+        assert([throttle.delay_for(x, 0.0) for x in tasks] == [0.0, 0.5, 1.0])
+
+    def test_rate_limit_reservation(self):
+        throttle = GroupThrottle({"basic": {"rate":1, "burst":1}})
+        first    = DootTask(factory.build({"name":"basic::first", "sleep":0}))
+        second   = DootTask(factory.build({"name":"basic::second", "sleep":0}))
+        assert(throttle.delay_for(first, 0.0) == 0.0)
+        assert(throttle.delay_for(second, 0.0) == 1.0)
+        # Asking again when due doesn't take another token
+        assert(throttle.delay_for(second, 1.0) == 0.0)
+
+    def test_refund_keeps_token(self):
+        throttle = GroupThrottle({"basic": {"rate":1, "burst":1}})
+        task     = DootTask(factory.build({"name":"basic::task", "sleep":0}))
+        other    = DootTask(factory.build({"name":"basic::other", "sleep":0}))
+        assert(throttle.delay_for(task, 0.0) == 0.0)
+        throttle.refund(task)
+        # The task uses its refunded token, instead of taking another
+        assert(throttle.delay_for(task, 0.0) == 0.0)
+        assert(throttle.delay_for(other, 0.0) == 1.0)
+
+    def test_refund_without_rate_limit(self):
+        throttle = GroupThrottle()
+        task     = DootTask(factory.build({"name":"basic::task", "sleep":0}))
+        throttle.refund(task)
+        assert(not bool(throttle._reserved))
+
+    def test_bad_rate_limit(self):
+        with pytest.raises(doot.errors.ConfigError):
+            GroupThrottle({"basic": "fast"})
+
+class TestDelayedAdmission:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return NaiveTracker()
+
+    def test_cool_down_doesnt_block_other_groups(self, tracker):
+        lock   = threading.Lock()
+        starts = {}
+
+        def action(label):
+            def fn(spec, state):
+                with lock:
+                    starts[label] = time.monotonic()
+            return fn
+
+        runner = DootParallelRunner(tracker=tracker, jobs=1, throttle=GroupThrottle())
+        specs  = [
+            factory.build({"name":"slow::a", "actions":[ActionSpec(fun=action("slow.a"))], "sleep":0.3}),
+            factory.build({"name":"slow::b", "actions":[ActionSpec(fun=action("slow.b"))], "sleep":0.3}),
+            factory.build({"name":"fast::c", "actions":[ActionSpec(fun=action("fast.c"))], "sleep":0}),
+            factory.build({"name":"fast::d", "actions":[ActionSpec(fun=action("fast.d"))], "sleep":0}),
+            ]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        first, second = sorted([starts["slow.a"], starts["slow.b"]])
+        assert(len(starts) == 4)
+        assert(0.29 <= second - first)
+        assert(max(starts["fast.c"], starts["fast.d"]) < second)
+
+    def test_cool_down_spaces_group(self, tracker):
+        lock   = threading.Lock()
+        starts = []
+
+        def action(spec, state):
+            with lock:
+                starts.append(time.monotonic())
+
+        runner = DootParallelRunner(tracker=tracker, jobs=1, throttle=GroupThrottle())
+        specs  = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=action)], "sleep":0.1}) for i in range(3)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(len(starts) == 3)
+        assert(all(0.09 <= b - a for a, b in itz.pairwise(starts)))
+
+    def test_rate_limit_spaces_group(self, tracker):
+        lock   = threading.Lock()
+        starts = []
+
+        def action(spec, state):
+            with lock:
+                starts.append(time.monotonic())
+
+        runner = DootParallelRunner(tracker=tracker, jobs=4, throttle=GroupThrottle({"basic":10}))
+        specs  = [factory.build({"name":f"basic::task.{i}", "actions":[ActionSpec(fun=action)], "sleep":0}) for i in range(3)]
+        tracker.register(*specs)
+        for spec in specs:
+            tracker.queue(spec.name, from_user=True)
+
+        with runner:
+            runner()
+
+        assert(len(starts) == 3)
+        assert(0.18 <= max(starts) - min(starts))
@@ -73,8 +73,15 @@ class RunnerHandlers_p(Protocol):
 
     def notify_artifact(self, art:Artifact_i) -> None: ...
 
+    def sleep_before(self, task:Maybe[Task_p|Artifact_i]) -> None: ...
+
     def sleep_after(self, task:Maybe[Task_p|Artifact_i]) -> None: ...
 
+@runtime_checkable
+class ParallelRunner_p(Protocol):
+    """ A Runner which can run multiple tasks at once """
+    jobs : int
+
 @runtime_checkable
 class WorkflowRunner_p(Protocol):
     """
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+A Runner which interleaves tasks on a single asyncio event loop.
+
+Actions may be 'async def', or return awaitables.
+Blocking actions are run on the loop's default thread executor,
+so they don't stall every other task.
+
+As with DootParallelRunner, the tracker is only touched by the runner itself,
+never by actions in other threads. The coordination they share is in _Concurrent_m.
+
+"""
+# ruff: noqa: N812
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import asyncio
+import datetime
+import enum
+import functools as ftz
+import inspect
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from collections import deque
+from contextlib import nullcontext
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Mixin, Proto
+from jgdv.debugging import NullHandler, SignalHandler
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.control.runner._interface import WorkflowRunner_p, ParallelRunner_p
+from doot.workflow._interface import ActionResponse_e as ActRE
+from doot.workflow._interface import Job_p, Task_p
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from .parallel_runner import _Concurrent_m
+from .resources import ResourcePools, _Admission_m
+from .timers import GroupThrottle, TimerHeap
+from .runner import ACTION_GROUP, DEPENDS_GROUP, FAIL_GROUP, SETUP_GROUP, ActionExecutor, DootRunner, skip_msg
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.control.tracker._interface import WorkflowTracker_p
+    from doot.workflow._interface import Artifact_i, ActionSpec_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type InFlight = dict[asyncio.Task, tuple[Task_p, int]]
+
+##--|
+from typing import ContextManager
+# isort: on
+# ##-- end types
+
+##-- logging
+logging           = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+max_steps     : Final[int]  = doot.config.on_fail(100_000).commands.run.max_steps()
+DEFAULT_JOBS  : Final[int]  = doot.config.on_fail(1_000, int).settings.commands.run.jobs()
+##--|
+
+class AsyncActionExecutor(ActionExecutor):
+    """ An ActionExecutor which awaits actions.
+    Coroutine actions run on the event loop, everything else is sent to a thread.
+    """
+
+    async def execute_action_group_async(self, task:Task_p, *, group:str, large_step:int) -> Maybe[tuple[int, ActRE, list]]:
+        """ The async equivalent of execute_action_group """
+        actions  = task.get_action_group(group)
+
+        if not bool(actions):
+            return None
+
+        group_result    = ActRE.SUCCESS
+        to_queue        = []
+        executed_count  = 0
+
+        for action in self.skip_relation_specs(actions):
+            match await self.execute_action_async(large_step, executed_count, action, task, group=group):
+                case True | None:
+                    continue
+                case list() as result:
+                    to_queue += result
+                case False:
+                    group_result = ActRE.FAIL
+                    break
+                case ActRE.SKIP:
+                    doot.report.wf.act("skip", skip_msg)
+                    group_result = ActRE.SKIP
+                    break
+
+            executed_count += 1
+
+        return executed_count, group_result, to_queue
+
+    async def execute_action_async(self, large_step:int, count:int, action:ActionSpec_i, task:Task_p, group:Maybe[str]=None) -> ActRE|list:
+        """ Run an action, awaiting its result if it is a coroutine """
+        self._announce_action(large_step, count, action, task, group=group)
+        if self.is_async(action):
+            response = action(task.internal_state)
+        else:
+            response = await asyncio.to_thread(action, task.internal_state)
+
+        while inspect.isawaitable(response):
+            response = await response
+
+        return self._handle_response(response, action, task)
+
+    async def test_conditions_async(self, task:Task_p, *, large_step:int) -> bool:
+        match await self.execute_action_group_async(task, group=DEPENDS_GROUP, large_step=large_step):
+            case None:
+                return True
+            case _, ActRE.SKIP | ActRE.FAIL, _:
+                return False
+            case _:
+                return True
+
+    @staticmethod
+    def is_async(action:ActionSpec_i) -> bool:
+        """ Whether an action's function is a coroutine function, so can be called directly on the loop """
+        fun = getattr(action, "fun", None)
+        return inspect.iscoroutinefunction(fun) or inspect.iscoroutinefunction(getattr(fun, "__call__", None))  # noqa: B004
+
+##--|
+
+@Proto(WorkflowRunner_p, ParallelRunner_p, check=False)
+@Mixin(None, _Concurrent_m, _Admission_m)
+class DootAsyncRunner(DootRunner):
+    """ A Runner that runs up to 'jobs' tasks at once as coroutines on one event loop.
+    Tasks are only started once the resources they declare are available in 'pools',
+    and their group isn't cooling down or rate limited by 'throttle'.
+    """
+
+    jobs        : int
+    pools       : ResourcePools
+    executor    : AsyncActionExecutor
+    throttle    : GroupThrottle
+    _in_flight  : InFlight
+    _parked     : deque[Task_p]
+    _timers     : TimerHeap[Task_p]
+
+    def __init__(self:Self, *, tracker:WorkflowTracker_p, executor:Maybe[AsyncActionExecutor]=None, jobs:Maybe[int]=None, pools:Maybe[ResourcePools]=None, throttle:Maybe[GroupThrottle]=None):
+        super().__init__(tracker=tracker, executor=executor or AsyncActionExecutor())
+        if not isinstance(self.executor, AsyncActionExecutor):
+            raise TypeError("An Async Runner needs an AsyncActionExecutor", self.executor)
+        self.jobs        = max(1, jobs or DEFAULT_JOBS)
+        self.pools       = pools or ResourcePools.from_config()
+        self.throttle    = throttle or GroupThrottle.from_config()
+        self._in_flight  = {}
+        self._parked     = deque()
+        self._timers     = TimerHeap()
+
+    @override
+    def __call__(self, *tasks:str, handler:Maybe[API.Handler]=None):  #noqa: ARG002
+        match handler:
+            case True:
+                handler = SignalHandler()
+            case False:
+                handler = NullHandler()
+            case type() as x:
+                handler = x()
+            case x if hasattr(x, "__enter__"):
+                handler = x
+            case _:
+                handler = nullcontext()
+
+        assert(isinstance(handler, ContextManager))
+        with handler:
+            asyncio.run(self._run_loop())
+
+    ##--| coordinator
+
+    async def _run_loop(self) -> None:
+        try:
+            while (self._has_pending() or bool(self._in_flight)) and self.large_step < max_steps:
+                self._dispatch_ready()
+                await self._collect_finished()
+        except BaseException:
+            for fut in self._in_flight:
+                fut.cancel()
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+            raise
+        finally:
+            self._in_flight.clear()
+            self._parked.clear()
+            self._timers.clear()
+
+    def _dispatch_ready(self) -> None:
+        """ Start tasks from the tracker until 'jobs' are in flight, or none are ready """
+        self._dispatch_with(self._start_async)
+
+    def _start_async(self, task:Task_p, large_step:int) -> asyncio.Task:
+        return asyncio.create_task(self._run_async(task, large_step), name=str(task.name))
+
+    async def _collect_finished(self) -> None:
+        """ Wait for at least one task to finish, or a delayed task to be due,
+        then handle every finished task
+        """
+        match bool(self._in_flight), self._wait_time():
+            case False, None:
+                # Nothing ready, running, or delayed, so count it as a step, to keep max_steps as a bound
+                self.large_step += 1
+                return
+            case False, float() as delay:
+                await asyncio.sleep(delay)
+                return
+            case True, delay:
+                done, _ = await asyncio.wait(self._in_flight.keys(), timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+
+        self._handle_finished(done)
+
+    @override
+    def _queue_generated(self, job:Task_p, specs:list, *, large_step:int) -> bool:
+        """ Queue the tasks a job generated.
+        If that fails, the job's on_fail group is awaited as a new in flight task,
+        which then fails with the error, so the job isn't finished yet.
+        """
+        try:
+            self._queue_more_tasks(job.name, specs)
+        except doot.errors.DootError as err:
+            fut = asyncio.create_task(self._fail_async(job, err, large_step=large_step), name=str(job.name))
+            self._in_flight[fut] = (job, large_step)
+            return False
+        else:
+            return True
+
+    ##--| tasks
+
+    async def _fail_async(self, job:Task_p, err:doot.errors.DootError, *, large_step:int) -> Never:
+        """ Run a job's on_fail group, then fail with its error """
+        await self.executor.execute_action_group_async(job, group=FAIL_GROUP, large_step=large_step)
+        raise err
+
+    async def _run_async(self, task:Task_p, large_step:int) -> Maybe[list]:
+        """ Run a task or job's action groups, returning any specs a job generates.
+        Does not modify the tracker.
+        """
+        result : Maybe[list] = None
+        try:
+            match task:
+                case Job_p():
+                    result = await self._expand_job_async(task, large_step=large_step)
+                case Task_p():
+                    await self._execute_task_async(task, large_step=large_step)
+        except doot.errors.DootError:
+            await self.executor.execute_action_group_async(task, group=FAIL_GROUP, large_step=large_step)
+            raise
+
+        return result
+
+    async def _execute_task_async(self, task:Task_p, *, large_step:int) -> None:
+        logmod.debug("-- Expanding Task %s: %s", large_step, task.name)
+        doot.report.wf.branch(task.spec.name, info=f"Task {large_step}")
+        if not await self.executor.test_conditions_async(task, large_step=large_step):
+            return
+
+        await self.executor.execute_action_group_async(task, group=SETUP_GROUP, large_step=large_step)
+        await self.executor.execute_action_group_async(task, group=ACTION_GROUP, large_step=large_step)
+
+    async def _expand_job_async(self, job:Job_p, *, large_step:int) -> Maybe[list]:
+        logmod.debug("-- Expanding Job %s: %s", large_step, job.name)
+        doot.report.wf.branch(job.spec.name, info=f"Job {large_step}")
+        if not await self.executor.test_conditions_async(job, large_step=large_step):
+            return None
+
+        await self.executor.execute_action_group_async(job, group=SETUP_GROUP, large_step=large_step)
+        match await self.executor.execute_action_group_async(job, group=ACTION_GROUP, large_step=large_step):
+            case int(), ActRE(), [*xs]:
+                return xs
+            case _:
+                return None
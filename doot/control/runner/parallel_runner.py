@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+A Runner which executes independent tasks concurrently on a thread pool.
+
+The tracker is *only* touched from the coordinating thread (the one that calls the runner).
+Worker threads run a task's action groups, and hand back the result
+so the coordinator can update the tracker's statuses and queue any generated tasks.
+
+"""
+# ruff: noqa: N812
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import os
+import pathlib as pl
+import re
+import time
+import types
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Mixin, Proto
+from jgdv.debugging import NullHandler, SignalHandler
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.control.runner._interface import WorkflowRunner_p, ParallelRunner_p
+from doot.workflow import TaskArtifact
+from doot.workflow._interface import Job_p, Task_p
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from .resources import ResourcePools, _Admission_m
+from .timers import GroupThrottle, TimerHeap
+from .runner import DootRunner, FAIL_GROUP
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.control.tracker._interface import WorkflowTracker_p
+    from doot.workflow._interface import Artifact_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from .runner import ActionExecutor
+    type InFlight = dict[Future, tuple[Task_p, int]]
+
+##--|
+from typing import ContextManager
+# isort: on
+# ##-- end types
+
+##-- logging
+logging           = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+max_steps     : Final[int]  = doot.config.on_fail(100_000).commands.run.max_steps()
+DEFAULT_JOBS  : Final[int]  = doot.config.on_fail(os.cpu_count() or 1, int).settings.commands.run.jobs()
+WORKER_PREFIX : Final[str]  = "doot-worker"
+##--|
+
+class _Concurrent_m:
+    """ Runner mixin for coordinating tasks which run concurrently.
+
+    Tasks are started by a callable which returns a Future, or an asyncio.Task,
+    that is held in self._in_flight until it is done.
+    Finished tasks are then handled by the coordinator,
+    so only the coordinator touches the tracker.
+
+    Needs self.jobs, self._in_flight, and _Admission_m
+    """
+
+    jobs        : int
+    _in_flight  : dict[Any, tuple[Task_p, int]]
+
+    def _dispatch_with(self, start:Callable[[Task_p, int], Any]) -> None:
+        """ Start tasks from the tracker until 'jobs' are in flight, or none are ready """
+        task : Maybe[Task_p|Artifact_i]
+        while len(self._in_flight) < self.jobs and self._has_pending():
+            task = None
+            try:
+                match (task:=self._next_admitted()):
+                    case None:
+                        return
+                    case TaskArtifact():
+                        self.notify_artifact(task)
+                        self.handle_success(task)
+                    case Task_p():
+                        self._in_flight[start(task, self.large_step)] = (task, self.large_step)
+                        self.large_step += 1
+                    case x:
+                        doot.report.gen.error("Unknown Value provided to runner: %s", x)
+            except doot.errors.TaskError as err:
+                err.task = task
+                self.handle_failure(err)
+            except doot.errors.DootError as err:
+                self.handle_failure(err)
+
+    def _handle_finished(self, done:Iterable) -> None:
+        """ Update the tracker for each finished task, queuing anything a job generated """
+        for fut in done:
+            task, step = self._in_flight.pop(fut)
+            try:
+                match fut.result():
+                    case None | []:
+                        pass
+                    case [*xs] if not self._queue_generated(task, xs, large_step=step):
+                        # The job's failure is still being handled
+                        continue
+                    case [*_]:
+                        pass
+            except doot.errors.TaskError as err:
+                err.task = task
+                self.handle_failure(err)
+            except doot.errors.DootError as err:
+                self._release(task)
+                self.handle_failure(err)
+            except Exception as err:
+                doot.report.wf.fail(info="Exception", msg=str(err))
+                self.tracker.clear()
+                raise
+            else:
+                self.handle_success(task)
+
+    def _queue_generated(self, job:Task_p, specs:list, *, large_step:int) -> bool:
+        """ Queue the tasks a job generated, running its on_fail group if that fails.
+        Returns True when the job is finished
+        """
+        try:
+            self._queue_more_tasks(job.name, specs)
+        except doot.errors.DootError:
+            self.executor.execute_action_group(job, group=FAIL_GROUP, large_step=large_step)
+            raise
+        else:
+            return True
+
+    ##--| handlers
+
+    def handle_success[T:Task_p|Artifact_i](self, task:Maybe[T]) -> Maybe[T]:
+        self._release(task)
+        return super().handle_success(task) # type: ignore[misc]
+
+    def handle_failure(self, failure:Exception) -> None:
+        match failure:
+            case doot.errors.TaskError(task=Task_p() as task):
+                self._release(task)
+            case _:
+                pass
+
+        super().handle_failure(failure) # type: ignore[misc]
+
+@Proto(WorkflowRunner_p, ParallelRunner_p, check=False)
+@Mixin(None, _Concurrent_m, _Admission_m)
+class DootParallelRunner(DootRunner):
+    """ A Runner that executes every task the tracker can provide on a pool of worker threads.
+
+    The coordinating thread pulls tasks from the tracker until it has 'jobs' tasks in flight,
+    or the tracker has nothing ready, then waits for a task to complete.
+    Status updates, job expansion, and failure handling all happen on the coordinating thread,
+    so the tracker doesn't need to be thread safe.
+
+    Tasks are only started once the resources they declare are available in 'pools',
+    and their group isn't cooling down or rate limited by 'throttle'.
+    """
+
+    jobs        : int
+    pools       : ResourcePools
+    throttle    : GroupThrottle
+    _in_flight  : InFlight
+    _parked     : deque[Task_p]
+    _timers     : TimerHeap[Task_p]
+
+    def __init__(self:Self, *, tracker:WorkflowTracker_p, executor:Maybe[ActionExecutor]=None, jobs:Maybe[int]=None, pools:Maybe[ResourcePools]=None, throttle:Maybe[GroupThrottle]=None):
+        super().__init__(tracker=tracker, executor=executor)
+        self.jobs        = max(1, jobs or DEFAULT_JOBS)
+        self.pools       = pools or ResourcePools.from_config()
+        self.throttle    = throttle or GroupThrottle.from_config()
+        self._in_flight  = {}
+        self._parked     = deque()
+        self._timers     = TimerHeap()
+
+    @override
+    def __call__(self, *tasks:str, handler:Maybe[API.Handler]=None):  #noqa: ARG002
+        match handler:
+            case True:
+                handler = SignalHandler()
+            case False:
+                handler = NullHandler()
+            case type() as x:
+                handler = x()
+            case x if hasattr(x, "__enter__"):
+                handler = x
+            case _:
+                handler = nullcontext()
+
+        assert(isinstance(handler, ContextManager))
+        logging.info("Running with %s workers", self.jobs)
+        with handler, ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix=WORKER_PREFIX) as pool:
+            try:
+                while (self._has_pending() or bool(self._in_flight)) and self.large_step < max_steps:
+                    self._dispatch_ready(pool)
+                    self._collect_finished()
+            except BaseException:
+                for fut in self._in_flight:
+                    fut.cancel()
+                raise
+            finally:
+                self._in_flight.clear()
+                self._parked.clear()
+                self._timers.clear()
+
+    ##--| coordinator
+
+    def _dispatch_ready(self, pool:ThreadPoolExecutor) -> None:
+        """ Pull tasks from the tracker and submit them to the pool,
+        until the pool is full, or the tracker has nothing ready.
+        """
+        self._dispatch_with(ftz.partial(pool.submit, self._run_in_worker))
+
+    def _collect_finished(self) -> None:
+        """ Wait for at least one in flight task to finish, or a delayed task to be due,
+        then handle every finished task
+        """
+        match bool(self._in_flight), self._wait_time():
+            case False, None:
+                # Nothing ready, running, or delayed, so count it as a step, to keep max_steps as a bound
+                self.large_step += 1
+                return
+            case False, float() as delay:
+                time.sleep(delay)
+                return
+            case True, delay:
+                done, _ = wait(self._in_flight.keys(), timeout=delay, return_when=FIRST_COMPLETED)
+
+        self._handle_finished(done)
+
+    ##--| worker
+
+    def _run_in_worker(self, task:Task_p, large_step:int) -> Maybe[list]:
+        """ The body of a worker thread.
+        Executes a task, or a job's actions, returning any specs a job generates.
+        Does not modify the tracker.
+        """
+        result : Maybe[list] = None
+        match task:
+            case Job_p():
+                try:
+                    result = self._expand_job_actions(task, large_step=large_step)
+                except doot.errors.DootError:
+                    self.executor.execute_action_group(task, group=FAIL_GROUP, large_step=large_step)
+                    raise
+            case Task_p():
+                self.execute_task(task, large_step=large_step)
+
+        return result
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+A Runner which executes a precomputed plan of the tracker's network,
+instead of asking the tracker for the next task on every step.
+
+Only static networks can be planned ahead.
+Jobs generate tasks while running, and artifacts may need to be checked,
+so a network containing either is run by the usual dynamic loop instead.
+
+"""
+# ruff: noqa: N812
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from contextlib import nullcontext
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Mixin, Proto
+from jgdv.debugging import NullHandler, SignalHandler
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.control.runner._interface import WorkflowRunner_p
+from doot.control.tracker._interface import SUCCESS_STATUSES, ExecutionPolicy_e, PlanEntry_d
+from doot.workflow._interface import TaskStatus_e, Task_p
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from .runner import DootRunner
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.control.tracker._interface import WorkflowTracker_p
+    from doot.workflow._interface import TaskName_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from .runner import ActionExecutor
+
+##--|
+from typing import ContextManager
+# isort: on
+# ##-- end types
+
+##-- logging
+logging           = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+max_steps       : Final[int]  = doot.config.on_fail(100_000).commands.run.max_steps()
+DEFAULT_POLICY  : Final[str]  = doot.config.on_fail("PRIORITY", str).settings.commands.run.policy()
+STATIC_DESCS    : Final[set[str]]  = {"Task", "Cleanup"}
+##--|
+
+@Proto(WorkflowRunner_p, check=False)
+class DootPlanRunner(DootRunner):
+    """ A Runner which gets the tracker's plan once, then runs it in order.
+
+    A task is halted without running if any of its dependencies did not succeed.
+    Cleanup tasks run regardless, as they do for the dynamic runner.
+    """
+
+    policy : ExecutionPolicy_e
+
+    def __init__(self:Self, *, tracker:WorkflowTracker_p, executor:Maybe[ActionExecutor]=None, policy:Maybe[ExecutionPolicy_e]=None):
+        super().__init__(tracker=tracker, executor=executor)
+        self.policy = policy or ExecutionPolicy_e[DEFAULT_POLICY.upper()]
+
+    @override
+    def __call__(self, *tasks:str, handler:Maybe[API.Handler]=None):
+        plan = self.tracker.plan(policy=self.policy)
+        if not self.is_static(plan):
+            logging.info("Network is not static, running dynamically")
+            return super().__call__(*tasks, handler=handler)
+
+        match handler:
+            case True:
+                handler = SignalHandler()
+            case False:
+                handler = NullHandler()
+            case type() as x:
+                handler = x()
+            case x if hasattr(x, "__enter__"):
+                handler = x
+            case _:
+                handler = nullcontext()
+
+        assert(isinstance(handler, ContextManager))
+        logging.info("Running a plan of %s steps", len(plan))
+        with handler:
+            for entry in plan:
+                if max_steps <= self.large_step:
+                    break
+                self.run_planned(entry.node)
+
+    @staticmethod
+    def is_static(plan:list[PlanEntry_d]) -> bool:
+        """ Whether a plan can be run without consulting the tracker """
+        return all(x.desc in STATIC_DESCS for x in plan)
+
+    def run_planned(self, name:TaskName_p) -> None:
+        """ Instantiate and run a single step of the plan """
+        task : Maybe[Task_p] = None
+        deps = self.tracker._dependency_states_of(name)
+        if not name.is_cleanup() and any(status not in SUCCESS_STATUSES for _, status in deps):
+            logging.info("[Plan] Halting, as a dependency did not succeed: %s", name)
+            self.tracker.set_status(name, TaskStatus_e.HALTED)
+            return
+
+        try:
+            self.tracker._instantiate(name, task=True, parent=self._parent_of(name, deps))
+            match self.tracker.specs[name].task:
+                case Task_p() as task:
+                    self.tracker.set_status(name, TaskStatus_e.RUNNING)
+                    self.sleep_before(task)
+                    self.execute_task(task)
+                case x:
+                    raise doot.errors.TrackingError("Planned task failed to instantiate", name, x)
+        except doot.errors.TaskError as err:
+            err.task = name
+            self.handle_failure(err)
+        except doot.errors.DootError as err:
+            self.handle_failure(err)
+        except Exception as err:
+            doot.report.wf.fail(info="Exception", msg=str(err))
+            self.tracker.clear()
+            raise
+        else:
+            self.handle_success(task)
+            self.sleep_after(task)
+        finally:
+            self.large_step += 1
+
+    def _parent_of(self, name:TaskName_p, deps:list[tuple]) -> Maybe[TaskName_p]:
+        """ A cleanup task's parent is the task it cleans up, which shares its uuid """
+        if not name.is_cleanup():
+            return None
+        return next((x for x, _ in deps if not x.is_cleanup() and x.uuid() == name.uuid()), None)
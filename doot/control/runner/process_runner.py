@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+A Runner which executes tasks in a pool of long lived worker processes.
+
+Workers are started with the coordinator's config files, locations, global task state,
+logging, and reporter, so actions behave as they would in the coordinator.
+Tasks are shipped to workers as a pickled payload of their prepared ActionSpecs
+(without their functions) and internal state.
+Each worker imports an action's CodeReference once, and reuses it for every later task.
+The state the actions return is merged back into the task's internal_state,
+on the coordinating process.
+
+Jobs, and tasks whose actions or state can't be pickled, are run on worker threads,
+as in DootParallelRunner.
+
+"""
+# ruff: noqa: N812
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import inspect
+import itertools as itz
+import logging as logmod
+import multiprocessing as mp
+import pathlib as pl
+import pickle
+import re
+import time
+import types
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Mixin, Proto
+from jgdv.logging import JGDVLogConfig
+from jgdv.structs.strang import CodeReference
+from jgdv.structs.strang.errors import StrangError
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.control.runner._interface import WorkflowRunner_p, ParallelRunner_p
+from doot.workflow import ActionSpec, TaskArtifact
+from doot.workflow._interface import Job_p, Task_p
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from .parallel_runner import DootParallelRunner
+from .resources import ResourcePools
+from .runner import ACTION_GROUP, DEPENDS_GROUP, FAIL_GROUP, SETUP_GROUP, ActionExecutor
+from .timers import GroupThrottle
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.control.tracker._interface import WorkflowTracker_p
+    from doot.workflow._interface import Artifact_i, TaskName_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Payload      = bytes
+    type WorkerResult = tuple[bool, dict, Maybe[str]]
+
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging           = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+DEFAULT_BATCH  : Final[int]        = doot.config.on_fail(4, int).settings.commands.run.batch()
+START_METHOD   : Final[str]        = doot.config.on_fail("spawn", str).settings.commands.run.start_method()
+SHIPPED_GROUPS : Final[tuple[str, ...]] = (DEPENDS_GROUP, SETUP_GROUP, ACTION_GROUP, FAIL_GROUP)
+UNSHIPPABLE    : Final[tuple[str, ...]] = ("<locals>", "<lambda>")
+##--|
+
+@dataclass
+class WorkerSetup_d:
+    """ How doot is set up in the coordinating process,
+    to set up a worker process the same way.
+    """
+    configs    : list[pl.Path]   = field(default_factory=list)
+    locations  : dict[str, str]  = field(default_factory=dict)
+    state      : dict            = field(default_factory=dict)
+    reporter   : Maybe[type]     = None
+
+    @staticmethod
+    def current() -> WorkerSetup_d:
+        """ Describe how doot is currently set up """
+        locs = doot.locs.Current
+        return WorkerSetup_d(configs=[pl.Path(x).resolve() for x in doot.configs_loaded_from],
+                             locations={x : str(locs.access(x)) for x in locs},
+                             state=dict(doot.global_task_state),
+                             reporter=type(doot.report))
+
+    def apply(self) -> None:
+        """ Set up doot in a fresh worker process """
+        if bool(self.configs) and not doot.is_setup:
+            doot.setup(targets=self.configs)
+            JGDVLogConfig().setup(doot.config)
+
+        doot.locs.Current.update(self.locations, strict=False)
+        doot.global_task_state.update(self.state)
+        match self.reporter:
+            case type() as ctor if not isinstance(doot.report, ctor):
+                doot.report = ctor()
+            case _:
+                pass
+
+class _ShippedTask:
+    """ The worker side stand in for a task.
+    Provides just enough of Task_p for an ActionExecutor to run its action groups.
+    """
+
+    def __init__(self, name:str, groups:dict[str, list[ActionSpec]], state:dict) -> None:
+        self.name            = name
+        self.spec            = None
+        self.internal_state  = state
+        self._groups         = groups
+
+    def get_action_group(self, group_name:str) -> list[ActionSpec]:
+        return self._groups.get(group_name, [])
+
+class _ProcessWorker_m:
+    """ Functions run inside the worker processes.
+    Everything is a staticmethod, so it can be pickled by reference.
+    """
+    _actions  : ClassVar[dict[str, Callable]] = {}
+    _executor : ClassVar[Maybe[ActionExecutor]] = None
+
+    @staticmethod
+    def worker_init(setup:Maybe[WorkerSetup_d]=None) -> None:
+        """ Run once when a worker process starts """
+        if setup is not None:
+            setup.apply()
+        _ProcessWorker_m._actions.clear()
+        _ProcessWorker_m._executor = ActionExecutor()
+
+    @staticmethod
+    def resolve(ref:CodeReference) -> Callable:
+        """ Import an action once per worker, reusing it for later tasks """
+        key = str(ref)
+        match _ProcessWorker_m._actions.get(key, None):
+            case None:
+                pass
+            case x:
+                return x
+
+        match ref():
+            case ImportError() as err:
+                raise err
+            case type() as x:
+                fun = x()
+            case x if callable(x):
+                fun = x
+            case x:
+                raise doot.errors.StructError("Action Reference is not callable", ref, x)
+
+        _ProcessWorker_m._actions[key] = fun
+        return fun
+
+    @staticmethod
+    def run_batch(payloads:list[Payload]) -> list[WorkerResult]:
+        """ Run a batch of tasks, in order, returning for each:
+        (success, the state it changed, failure message)
+        """
+        return [_ProcessWorker_m.run_one(x) for x in payloads]
+
+    @staticmethod
+    def run_one(payload:Payload) -> WorkerResult:
+        name, step, shipped, state = pickle.loads(payload)  # noqa: S301
+        # A separate copy, so state changed in place can be found
+        *_, original = pickle.loads(payload)  # noqa: S301
+        executor  = _ProcessWorker_m._executor or ActionExecutor()
+        groups    = {}
+        for group, actions in shipped.items():
+            for action in actions:
+                action.set_function(fun=_ProcessWorker_m.resolve(action.do))
+            groups[group] = actions
+
+        task = _ShippedTask(name, groups, state)
+        try:
+            doot.report.wf.branch(name, info=f"Task {step}")
+            if executor.test_conditions(task, large_step=step): # type: ignore[arg-type]
+                executor.execute_action_group(task, group=SETUP_GROUP, large_step=step) # type: ignore[arg-type]
+                executor.execute_action_group(task, group=ACTION_GROUP, large_step=step) # type: ignore[arg-type]
+        except doot.errors.DootError as err:
+            executor.execute_action_group(task, group=FAIL_GROUP, large_step=step) # type: ignore[arg-type]
+            return False, _ProcessWorker_m.changed(original, state), str(err)
+
+        return True, _ProcessWorker_m.changed(original, state), None
+
+    @staticmethod
+    def changed(original:dict, state:dict) -> dict:
+        """ The entries of the state which were added, replaced, or modified """
+        return {k:v for k,v in state.items() if k not in original or original[k] != v}
+
+##--|
+
+@Proto(WorkflowRunner_p, ParallelRunner_p, check=False)
+class DootProcessRunner(DootParallelRunner):
+    """ A Runner that executes tasks in a pool of worker processes,
+    avoiding the GIL for cpu bound actions.
+
+    Ready tasks are grouped into batches of up to 'batch' tasks per dispatch,
+    so small tasks don't spend most of their time on IPC.
+    """
+
+    batch     : int
+    _procs    : Maybe[Executor]
+    _backing  : dict[Future, Future]
+
+    def __init__(self:Self, *, tracker:WorkflowTracker_p, executor:Maybe[ActionExecutor]=None, jobs:Maybe[int]=None, batch:Maybe[int]=None, pools:Maybe[ResourcePools]=None, throttle:Maybe[GroupThrottle]=None):
+        super().__init__(tracker=tracker, executor=executor, jobs=jobs, pools=pools, throttle=throttle)
+        self.batch     = max(1, batch or DEFAULT_BATCH)
+        self._procs    = None
+        self._backing  = {}
+
+    @override
+    def __call__(self, *tasks:str, handler:Maybe[API.Handler]=None):
+        with self._make_pool() as procs:
+            self._procs = procs
+            try:
+                super().__call__(*tasks, handler=handler)
+            except BaseException:
+                procs.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                self._procs = None
+                self._backing.clear()
+
+    def _make_pool(self) -> Executor:
+        """ The pool that batches of shipped tasks are submitted to """
+        ctx = mp.get_context(START_METHOD)
+        return ProcessPoolExecutor(max_workers=self.jobs,
+                                   mp_context=ctx,
+                                   initializer=_ProcessWorker_m.worker_init,
+                                   initargs=(WorkerSetup_d.current(),))
+
+    ##--| coordinator
+
+    @override
+    def _dispatch_ready(self, pool:ThreadPoolExecutor) -> None:
+        """ Pull ready tasks from the tracker.
+        Shippable tasks are batched and sent to the process pool,
+        everything else is run on the thread pool.
+        """
+        task      : Maybe[Task_p|Artifact_i]
+        remote    : list[tuple[Task_p, int, Payload]]  = []
+        capacity  : int                                = self.jobs - len(set(self._backing.get(x, x) for x in self._in_flight))
+        local     : int                                = 0
+
+        def has_room() -> bool:
+            batches = -(-len(remote) // self.batch)
+            return local + batches < capacity or 0 < (len(remote) % self.batch)
+
+        while 0 < capacity and has_room() and self._has_pending():
+            task = None
+            try:
+                match (task:=self._next_admitted()):
+                    case None:
+                        break
+                    case TaskArtifact():
+                        self.notify_artifact(task)
+                        self.handle_success(task)
+                    case Job_p():
+                        self._submit_local(pool, task)
+                        local += 1
+                    case Task_p():
+                        match self._make_payload(task, self.large_step):
+                            case None:
+                                self._submit_local(pool, task)
+                                local += 1
+                            case bytes() as payload:
+                                remote.append((task, self.large_step, payload))
+                                self.large_step += 1
+                    case x:
+                        doot.report.gen.error("Unknown Value provided to runner: %s", x)
+            except doot.errors.TaskError as err:
+                err.task = task
+                self.handle_failure(err)
+            except doot.errors.DootError as err:
+                self.handle_failure(err)
+
+        self._submit_remote(remote, slots=max(1, capacity - local))
+
+    def _submit_local(self, pool:ThreadPoolExecutor, task:Task_p) -> None:
+        fut = pool.submit(self._run_in_worker, task, self.large_step)
+        self._in_flight[fut] = (task, self.large_step)
+        self.large_step += 1
+
+    def _submit_remote(self, remote:list[tuple[Task_p, int, Payload]], *, slots:int) -> None:
+        """ Split the shippable tasks into batches, one per free worker, and submit them """
+        assert(self._procs is not None)
+        if not bool(remote):
+            return
+
+        count    = min(slots, len(remote))
+        batches  = [remote[i::count] for i in range(count)]
+        for batch in batches:
+            batch_fut  = self._procs.submit(_ProcessWorker_m.run_batch, [x[2] for x in batch])
+            children   = []
+            for task, step, _ in batch:
+                child                   = Future()
+                child.set_running_or_notify_cancel()
+                self._in_flight[child]  = (task, step)
+                self._backing[child]    = batch_fut
+                children.append((child, task))
+
+            batch_fut.add_done_callback(ftz.partial(self._resolve_batch, children))
+
+    def _resolve_batch(self, children:list[tuple[Future, Task_p]], batch_fut:Future) -> None:
+        """ Called when a batch finishes.
+        Merges each task's changed state, and completes its placeholder future
+        """
+        try:
+            results = batch_fut.result()
+        except BaseException as err:  # noqa: BLE001
+            for child, _ in children:
+                if not child.done():
+                    child.set_exception(err)
+            return
+
+        for (child, task), (success, changed, msg) in zip(children, results, strict=True):
+            task.internal_state.update(changed)
+            if child.done():
+                continue
+            if success:
+                child.set_result(None)
+            else:
+                child.set_exception(doot.errors.TaskFailed("Task %s: Action Failed: %s", task.name, msg, task=task.spec))
+
+    @override
+    def _collect_finished(self) -> None:
+        super()._collect_finished()
+        for child in [x for x in self._backing if x not in self._in_flight]:
+            del self._backing[child]
+
+    def _make_payload(self, task:Task_p, large_step:int) -> Maybe[Payload]:
+        """ Pickle a task's actions and state for a worker process.
+        Returns None if the task can't be shipped.
+        """
+        shipped : dict[str, list[ActionSpec]] = {}
+        for group in SHIPPED_GROUPS:
+            actions = []
+            for action in task.get_action_group(group):
+                match action:
+                    case ActionSpec(do=CodeReference() as ref) if not any(x in str(ref) for x in UNSHIPPABLE):
+                        actions.append(action.model_copy(update={"fun":None}))
+                    case ActionSpec(do=None, fun=types.FunctionType() as fun):
+                        ref = f"{fun.__module__}:{fun.__qualname__}"
+                        if any(x in ref for x in UNSHIPPABLE):
+                            return None
+                        actions.append(action.model_copy(update={"fun":None, "do":CodeReference(ref)}))
+                    case ActionSpec(do=None, fun=fun) if fun is not None:
+                        match self._class_ref(fun):
+                            case None:
+                                return None
+                            case CodeReference() as ref:
+                                actions.append(action.model_copy(update={"fun":None, "do":ref}))
+                    case ActionSpec():
+                        return None
+                    case _:
+                        # Relation specs
+                        pass
+            else:
+                shipped[group] = actions
+
+        try:
+            return pickle.dumps((str(task.name), large_step, shipped, task.internal_state))
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            logging.info("Task can't be sent to a worker process, running locally: %s : %s", task.name, err)
+            return None
+
+    def _class_ref(self, fun:Callable) -> Maybe[CodeReference]:
+        """ A reference to the class of a callable instance, which a worker can import and build without arguments.
+        Returns None for anything else, eg: partials, bound methods, and builtins.
+        """
+        cls = type(fun)
+        ref = f"{cls.__module__}:{cls.__qualname__}"
+        if any(x in ref for x in UNSHIPPABLE):
+            return None
+
+        try:
+            coderef = CodeReference(ref)
+            sig     = inspect.signature(cls)
+        except (ValueError, TypeError, StrangError):
+            return None
+
+        match coderef():
+            case type() as x if x is cls:
+                pass
+            case _:
+                return None
+
+        required = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        if any(x.kind in required and x.default is inspect.Parameter.empty for x in sig.parameters.values()):
+            return None
+
+        return coderef
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+A Runner which spreads a run across 'doot worker' processes,
+which can be on other machines.
+
+The coordinator listens on a TCP or Unix socket,
+given as 'host:port' or 'unix:path'.
+Workers connect, then repeatedly pull a batch of tasks, run it, and send back the results.
+
+The protocol is a sequence of length prefixed frames::
+
+    frame   := size:uint32 (big endian) + body:bytes[size]
+
+The first frame a worker sends is a json handshake::
+
+    {"token": str, "host": str, "pid": int}
+
+And, once the token is accepted, every later frame is a pickled (Message_e, body) pair:
+
+    worker         coordinator
+    PULL      ->
+              <-   TASKS   [payload]
+    RESULTS   ->                       [(success, changed state, failure message)]
+    PULL      ->
+              <-   STOP
+
+Payloads and results are the same as the process runner uses,
+so tasks are shipped the same way, and unshippable tasks and jobs run on the coordinator.
+As bodies are pickled, only run workers on a network you trust.
+
+If a worker disconnects while running a batch, the batch is given to another worker.
+If no worker has connected after 'worker_wait' seconds, batches fail with a ControlError.
+
+"""
+# ruff: noqa: N812
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import hmac
+import itertools as itz
+import json
+import logging as logmod
+import multiprocessing as mp
+import os
+import pathlib as pl
+import pickle
+import queue
+import re
+import secrets
+import socket
+import struct
+import threading
+import time
+import types
+from concurrent.futures import Executor, Future
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Proto
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.control.runner._interface import WorkflowRunner_p, ParallelRunner_p
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from .process_runner import START_METHOD, DootProcessRunner, WorkerSetup_d, _ProcessWorker_m
+from .resources import ResourcePools
+from .runner import ActionExecutor
+from .timers import GroupThrottle
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.control.tracker._interface import WorkflowTracker_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from .process_runner import Payload, WorkerResult
+
+    type Address = str|tuple[str, int]
+    type Batch   = tuple[Future, list[Payload]]
+
+##--|
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging           = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+ADDRESS         : Final[str]    = doot.config.on_fail("unix:.temp/doot-workers.sock", str).settings.commands.run.workers.address()
+LOCAL_WORKERS   : Final[int]    = doot.config.on_fail(0, int).settings.commands.run.workers.local()
+CONNECT_WAIT    : Final[float]  = doot.config.on_fail(10.0, int|float).settings.commands.run.workers.connect_wait()
+WORKER_WAIT     : Final[float]  = doot.config.on_fail(60.0, int|float).settings.commands.run.workers.worker_wait()
+TOKEN_ENV       : Final[str]    = "DOOT_WORKER_TOKEN"
+UNIX_PREFIX     : Final[str]    = "unix:"
+HEADER          : Final[struct.Struct]  = struct.Struct("!I")
+MAX_FRAME       : Final[int]    = 1 << 30
+POLL            : Final[float]  = 0.1
+##--|
+
+class Message_e(enum.StrEnum):
+    """ The kinds of message sent after the handshake """
+    PULL     = "pull"
+    TASKS    = "tasks"
+    RESULTS  = "results"
+    STOP     = "stop"
+
+##--| protocol
+
+def parse_address(text:str) -> tuple[socket.AddressFamily, Address]:
+    """ 'unix:path' or 'host:port' -> (socket family, address) """
+    match text.removeprefix(UNIX_PREFIX):
+        case str() as path if text.startswith(UNIX_PREFIX):
+            return socket.AF_UNIX, path
+        case str() as x if ":" in x:
+            host, _, port = x.rpartition(":")
+            return socket.AF_INET, (host or "localhost", int(port))
+        case x:
+            raise doot.errors.ConfigError("Worker addresses are 'unix:path' or 'host:port'", x)
+
+def send_frame(sock:socket.socket, body:bytes) -> None:
+    sock.sendall(HEADER.pack(len(body)) + body)
+
+def recv_frame(sock:socket.socket) -> bytes:
+    size = HEADER.unpack(_recv_exact(sock, HEADER.size))[0]
+    if MAX_FRAME < size:
+        raise ConnectionError("Frame is too large", size)
+    return _recv_exact(sock, size)
+
+def send_message(sock:socket.socket, kind:Message_e, body:Any=None) -> None:
+    send_frame(sock, pickle.dumps((str(kind), body)))
+
+def recv_message(sock:socket.socket) -> tuple[Message_e, Any]:
+    kind, body = pickle.loads(recv_frame(sock))  # noqa: S301
+    return Message_e(kind), body
+
+def _recv_exact(sock:socket.socket, size:int) -> bytes:
+    chunks  = []
+    needed  = size
+    while 0 < needed:
+        match sock.recv(min(needed, 1 << 16)):
+            case b"":
+                raise ConnectionError("Connection closed mid frame")
+            case bytes() as chunk:
+                chunks.append(chunk)
+                needed -= len(chunk)
+    else:
+        return b"".join(chunks)
+
+##--| worker
+
+def serve(address:Maybe[str]=None, *, token:Maybe[str]=None, wait:float=CONNECT_WAIT, setup:Maybe[WorkerSetup_d]=None) -> int:
+    """ The worker side of the protocol.
+    Connects to a coordinator, retrying for up to 'wait' seconds,
+    then runs the batches it pulls until told to stop.
+    Returns the number of batches run.
+
+    A 'doot worker' is already set up from its own config,
+    but a local worker process is given the coordinator's setup.
+    """
+    count  : int  = 0
+    family, addr  = parse_address(address or ADDRESS)
+    token         = token or os.environ.get(TOKEN_ENV, "")
+    _ProcessWorker_m.worker_init(setup)
+    with _connect(family, addr, wait=wait) as sock:
+        send_frame(sock, json.dumps({"token": token, "host": socket.gethostname(), "pid": os.getpid()}).encode())
+        while True:
+            send_message(sock, Message_e.PULL)
+            match recv_message(sock):
+                case Message_e.STOP, _:
+                    return count
+                case Message_e.TASKS, list() as payloads:
+                    send_message(sock, Message_e.RESULTS, _ProcessWorker_m.run_batch(payloads))
+                    count += 1
+                case x:
+                    raise doot.errors.DootError("Unexpected message from the coordinator", x)
+
+def _connect(family:socket.AddressFamily, addr:Address, *, wait:float) -> socket.socket:
+    deadline = time.monotonic() + wait
+    while True:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.connect(addr)
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            if deadline < time.monotonic():
+                raise
+            time.sleep(POLL)
+        else:
+            return sock
+
+##--| coordinator
+
+class RemoteWorkerPool(Executor):
+    """ The coordinator side of the protocol.
+
+    An Executor the process runner can submit batches to.
+    A batch waits in a queue until a connected worker pulls it.
+
+    If 'local' is more than 0, that many workers are started as local processes.
+    Without local workers, a token is required, so 'doot worker's can connect.
+    If no worker connects within 'wait' seconds, pending and later batches fail.
+    """
+
+    address   : str
+    token     : str
+    local     : int
+    wait      : float
+    workers   : dict[str, int]
+    _pending  : queue.SimpleQueue[Batch]
+    _closed   : threading.Event
+    _failure  : Maybe[doot.errors.ControlError]
+    _lock     : threading.Lock
+    _server   : Maybe[socket.socket]
+    _threads  : list[threading.Thread]
+    _procs    : list[mp.process.BaseProcess]
+
+    def __init__(self, address:Maybe[str]=None, *, token:Maybe[str]=None, local:int=0, wait:float=WORKER_WAIT) -> None:
+        self.address   = address or ADDRESS
+        self.token     = token or os.environ.get(TOKEN_ENV, None) or ""
+        self.local     = local
+        self.wait      = wait
+        self.workers   = {}
+        self._pending  = queue.SimpleQueue()
+        self._closed   = threading.Event()
+        self._failure  = None
+        self._lock     = threading.Lock()
+        self._server   = None
+        self._threads  = []
+        self._procs    = []
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def start(self) -> None:
+        """ Listen for workers, and start any local ones """
+        match bool(self.token), bool(self.local):
+            case False, False:
+                raise doot.errors.ConfigError("Remote workers need a shared token, set in $%s, or local workers", TOKEN_ENV)
+            case False, True:
+                self.token = secrets.token_hex(16)
+            case _:
+                pass
+
+        family, addr  = parse_address(self.address)
+        if family == socket.AF_UNIX:
+            path = pl.Path(cast("str", addr))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.unlink(missing_ok=True)
+
+        self._server = socket.socket(family, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(addr)
+        self._server.listen()
+        self._server.settimeout(POLL)
+        self._spawn(self._accept_loop, name="doot-coordinator")
+        logging.info("Waiting for workers on: %s", self.address)
+        ctx    = mp.get_context(START_METHOD)
+        setup  = WorkerSetup_d.current()
+        for _ in range(self.local):
+            proc = ctx.Process(target=serve, args=(self.address,), kwargs={"token":self.token, "setup":setup}, daemon=True)
+            proc.start()
+            self._procs.append(proc)
+
+    @override
+    def submit(self, fn:Callable, /, *args:Any, **kwargs:Any) -> Future:
+        """ Queue a batch of payloads for a worker to pull.
+        fn must be _ProcessWorker_m.run_batch, as that is what workers run.
+        """
+        if fn is not _ProcessWorker_m.run_batch:
+            raise TypeError("Workers only run batches of shipped tasks", fn)
+        if self._closed.is_set():
+            raise RuntimeError("Can't submit to a closed worker pool")
+
+        fut : Future = Future()
+        with self._lock:
+            if self._failure is None:
+                self._pending.put((fut, *args))
+                return fut
+
+        fut.set_running_or_notify_cancel()
+        fut.set_exception(self._failure)
+        return fut
+
+    @override
+    def shutdown(self, wait:bool=True, *, cancel_futures:bool=False) -> None:
+        """ Tell workers to stop as they next pull, and stop listening """
+        self._closed.set()
+        if cancel_futures:
+            while not self._pending.empty():
+                self._pending.get_nowait()[0].cancel()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            for proc in self._procs:
+                proc.join(timeout=CONNECT_WAIT)
+                if proc.is_alive():
+                    proc.terminate()
+
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            match parse_address(self.address):
+                case socket.AF_UNIX, str() as path:
+                    pl.Path(path).unlink(missing_ok=True)
+                case _:
+                    pass
+
+    def _spawn(self, fn:Callable, *args:Any, name:str) -> None:
+        thread = threading.Thread(target=fn, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _accept_loop(self) -> None:
+        assert(self._server is not None)
+        deadline = time.monotonic() + self.wait
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except TimeoutError:
+                if not bool(self.workers) and deadline < time.monotonic():
+                    self._fail_pending(doot.errors.ControlError("No workers connected within %ss to: %s", self.wait, self.address))
+                    return
+                continue
+            except OSError:
+                return
+            else:
+                self._spawn(self._serve_worker, conn, name="doot-worker-conn")
+
+    def _fail_pending(self, err:doot.errors.ControlError) -> None:
+        """ Fail every queued batch, and any submitted later """
+        logging.error("%s", err)
+        with self._lock:
+            self._failure = err
+        while not self._pending.empty():
+            fut, _ = self._pending.get_nowait()
+            if fut.set_running_or_notify_cancel():
+                fut.set_exception(err)
+
+    def _next_batch(self) -> Maybe[Batch]:
+        """ Wait for a batch that hasn't been cancelled, or None once the pool is closed """
+        while not self._closed.is_set():
+            try:
+                fut, payloads = self._pending.get(timeout=POLL)
+            except queue.Empty:
+                continue
+            if fut.running() or fut.set_running_or_notify_cancel():
+                return fut, payloads
+        else:
+            return None
+
+    def _serve_worker(self, conn:socket.socket) -> None:
+        """ Handshake with a worker, then give it batches as it pulls them """
+        batch   : Maybe[Batch]  = None
+        worker  : str           = "unknown"
+        try:
+            with conn:
+                conn.settimeout(CONNECT_WAIT)
+                match json.loads(recv_frame(conn)):
+                    case {"token": str() as token, "host": host, "pid": pid} if hmac.compare_digest(token, self.token):
+                        conn.settimeout(None)
+                        worker = f"{host}:{pid}"
+                        self.workers[worker] = 0
+                        logging.info("Worker connected: %s", worker)
+                    case _:
+                        logging.warning("Rejected a worker with a bad handshake")
+                        return
+
+                while True:
+                    match recv_message(conn):
+                        case Message_e.PULL, _:
+                            pass
+                        case x:
+                            raise ConnectionError("Unexpected message from a worker", worker, x)
+
+                    match (batch:=self._next_batch()):
+                        case None:
+                            send_message(conn, Message_e.STOP)
+                            return
+                        case _, payloads:
+                            send_message(conn, Message_e.TASKS, payloads)
+
+                    match recv_message(conn):
+                        case Message_e.RESULTS, list() as results:
+                            batch[0].set_result(results)
+                            self.workers[worker] += 1
+                            batch = None
+                        case x:
+                            raise ConnectionError("Unexpected message from a worker", worker, x)
+
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError) as err:
+            logging.warning("Lost worker %s: %s", worker, err)
+        finally:
+            if batch is not None and not batch[0].done():
+                logging.info("Requeuing a batch from worker: %s", worker)
+                self._pending.put(batch)
+
+##--|
+
+@Proto(WorkflowRunner_p, ParallelRunner_p, check=False)
+class DootRemoteRunner(DootProcessRunner):
+    """ A Runner that sends batches of tasks to 'doot worker' processes, via a RemoteWorkerPool.
+    'jobs' limits how many batches are in flight, so should be at least the number of workers.
+    Tasks are still tracked, and their state merged, on the coordinator.
+    """
+
+    address  : str
+    token    : Maybe[str]
+    local    : int
+
+    def __init__(self:Self, *, tracker:WorkflowTracker_p, executor:Maybe[ActionExecutor]=None, jobs:Maybe[int]=None, batch:Maybe[int]=None, pools:Maybe[ResourcePools]=None, throttle:Maybe[GroupThrottle]=None, address:Maybe[str]=None, token:Maybe[str]=None, local:Maybe[int]=None):
+        super().__init__(tracker=tracker, executor=executor, jobs=jobs, batch=batch, pools=pools, throttle=throttle)
+        self.address  = address or ADDRESS
+        self.token    = token
+        self.local    = LOCAL_WORKERS if local is None else local
+
+    @override
+    def _make_pool(self) -> RemoteWorkerPool:
+        return RemoteWorkerPool(self.address, token=self.token, local=self.local)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Named resource pools, limiting which tasks can run at the same time.
+
+Pool capacities are set in the config::
+
+    [settings.commands.run]
+    resources = { cpu = 4, db = 1 }
+
+And tasks declare what they need::
+
+    [[tasks.group]]
+    name      = "link"
+    resources = { cpu = 2, db = 1 }
+
+A concurrent runner only starts a task once all of its resources are available.
+Resources which have no pool configured are unlimited.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from collections import defaultdict, deque
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow._interface import Task_p
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from .timers import GroupThrottle, TimerHeap
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.control.tracker._interface import WorkflowTracker_p
+    from doot.workflow._interface import Artifact_i, TaskName_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+RESOURCES_K : Final[str] = "resources"
+##--|
+
+class ResourcePools:
+    """ Counts the use of named resources, by running tasks.
+
+    capacity : pool name -> the total available
+    """
+
+    capacity  : dict[str, int]
+    _used     : defaultdict[str, int]
+    _held     : dict[TaskName_p, dict[str, int]]
+
+    def __init__(self, capacity:Maybe[Mapping[str, int]]=None) -> None:
+        self.capacity  = {str(k):int(v) for k,v in (capacity or {}).items()}
+        self._used     = defaultdict(int)
+        self._held     = {}
+
+    @classmethod
+    def from_config(cls) -> ResourcePools:
+        return cls(dict(doot.config.on_fail({}).settings.commands.run.resources()))
+
+    def __bool__(self) -> bool:
+        return bool(self.capacity)
+
+    def __contains__(self, name:TaskName_p) -> bool:
+        return name in self._held
+
+    @staticmethod
+    def requests_of(task:Task_p) -> dict[str, int]:
+        """ The resources a task declares it needs """
+        return {str(k):int(v) for k,v in task.spec.extra.on_fail({}).resources().items()}
+
+    def available(self, pool:str) -> Maybe[int]:
+        """ The unused amount of a pool, or None if the pool is unlimited """
+        if pool not in self.capacity:
+            return None
+        return self.capacity[pool] - self._used[pool]
+
+    def acquire(self, name:TaskName_p, requests:Mapping[str, int]) -> bool:
+        """ Take the requested resources for a task, if they are all available.
+        Takes nothing and returns False otherwise.
+        """
+        bounded : dict[str, int]
+        if name in self._held:
+            return True
+
+        bounded = {k:v for k,v in requests.items() if k in self.capacity}
+        for pool, amount in bounded.items():
+            if self.capacity[pool] < amount:
+                raise doot.errors.TrackingError("Task needs more of a resource than exists", name, pool, amount, self.capacity[pool])
+            if self.capacity[pool] < self._used[pool] + amount:
+                logging.debug("[Resources] Waiting on %s for: %s", pool, name)
+                return False
+
+        for pool, amount in bounded.items():
+            self._used[pool] += amount
+        else:
+            self._held[name] = bounded
+            return True
+
+    def release(self, name:TaskName_p) -> None:
+        """ Return a task's resources to their pools """
+        for pool, amount in self._held.pop(name, {}).items():
+            self._used[pool] -= amount
+
+class _Admission_m:
+    """ Runner mixin for admitting tasks from the tracker only when they can start now.
+
+    Tasks waiting on resources are parked, and are tried again before asking the tracker for more.
+    Tasks waiting on their group's cool-down or rate limit are put on a timer heap,
+    and are parked when they are due.
+
+    Needs self.pools, self.throttle, self._parked and self._timers
+    """
+
+    tracker   : WorkflowTracker_p
+    pools     : ResourcePools
+    throttle  : GroupThrottle
+    _parked   : deque[Task_p]
+    _timers   : TimerHeap[Task_p]
+
+    def _has_pending(self) -> bool:
+        """ Whether the tracker, the parked tasks, or the timers, have more to run """
+        return bool(self.tracker) or bool(self._parked) or bool(self._timers)
+
+    def _next_admitted(self) -> Maybe[Task_p|Artifact_i]:
+        """ The next task that can be run now, or None """
+        now = time.monotonic()
+        self._parked.extend(self._timers.pop_due(now))
+        for _ in range(len(self._parked)):
+            task = self._parked.popleft()
+            if self._admit(task, now):
+                return task
+
+        while (task:=self.tracker.next_for()) is not None:
+            match task:
+                case Task_p() if not self._admit(task, now):
+                    pass
+                case _:
+                    return task
+        else:
+            return None
+
+    def _admit(self, task:Task_p, now:float) -> bool:
+        """ Whether a task can start now.
+        If not, it is delayed on the timers or parked until resources are available.
+        """
+        match self.throttle.delay_for(task, now):
+            case x if 0 < x:
+                logging.debug("[Timers] Delaying %s by %s", task.name, x)
+                self._timers.push(task, now + x)
+                return False
+            case _:
+                pass
+
+        if not self.pools.acquire(task.name, ResourcePools.requests_of(task)):
+            self.throttle.refund(task)
+            self._parked.append(task)
+            return False
+
+        return True
+
+    def _wait_time(self) -> Maybe[float]:
+        """ Seconds until the next delayed task is due, or None if there are none """
+        match self._timers.next_due():
+            case None:
+                return None
+            case float() as due:
+                return max(0.0, due - time.monotonic())
+
+    def _release(self, task:Maybe[Task_p|Artifact_i]) -> None:
+        """ Return a finished task's resources, and start its group's cool-down """
+        match task:
+            case Task_p():
+                self.pools.release(task.name)
+                self.throttle.cool(task)
+            case _:
+                pass
@@ -8,9 +8,11 @@
 from __future__ import annotations
 
 # ##-- stdlib imports
+import asyncio
 import datetime
 import enum
 import functools as ftz
+import inspect
 import itertools as itz
 import logging as logmod
 import pathlib as pl
@@ -43,6 +45,7 @@ from doot.workflow._interface import Job_p, Task_p, TaskName_p, TaskSpec_i, Acti
 # ##-| Local
 from . import _interface as API # noqa: N812
 from . import util as RU
+from .timers import GroupThrottle
 
 # # End of Imports.
 
@@ -66,7 +69,7 @@ if TYPE_CHECKING:
     from typing import Never, Self, Literal
     from typing import TypeGuard
     from collections.abc import Iterable, Iterator, Callable, Generator
-    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable, Awaitable
 
 ##--|
 from typing import ContextManager
@@ -149,8 +152,14 @@ class ActionExecutor:
           or an ActRE describing the action result.
 
         """
-        result : ActRE|list
-        ##--|
+        self._announce_action(large_step, count, action, task, group=group)
+        response = action(task.internal_state)
+        if inspect.isawaitable(response):
+            response = asyncio.run(self._await(response))
+
+        return self._handle_response(response, action, task)
+
+    def _announce_action(self, large_step:int, count:int, action:ActionSpec_i, task:Task_p, group:Maybe[str]=None) -> None:
         task.internal_state['_action_step'] = count
         match group:
             case str():
@@ -160,7 +169,10 @@ class ActionExecutor:
 
         logging.debug("Action Executing for Task: %s", task.name)
         logging.debug("Action State: %s.%s: args=%s kwargs=%s. state(size)=%s", large_step, count, action.args, dict(action.kwargs), len(task.internal_state.keys()))
-        response = action(task.internal_state)
+
+    def _handle_response(self, response:Any, action:ActionSpec_i, task:Task_p) -> ActRE|list:
+        """ Convert what an action returned into an ActRE or a list of specs """
+        result : ActRE|list
         match response:
             case None | True:
                 result = ActRE.SUCCESS
@@ -179,6 +191,10 @@ class ActionExecutor:
 
         return result
 
+    @staticmethod
+    async def _await(awaitable:Awaitable) -> Any:
+        return await awaitable
+
     def test_conditions(self, task:Task_p, *, large_step:int) -> bool:
         """ run a task's depends_on group, coercing to a bool
         returns False if the runner should skip the rest of the task
@@ -201,6 +217,7 @@ class DootRunner:
     tracker        : WorkflowTracker_p
     teardown_list  : list
     executor       : ActionExecutor
+    throttle       : GroupThrottle
 
     def __init__(self:Self, *, tracker:WorkflowTracker_p, executor:Maybe[ActionExecutor]=None):
         super().__init__()
@@ -208,6 +225,7 @@ class DootRunner:
         self.tracker        = tracker
         self.executor       = executor or ActionExecutor()
         self.teardown_list  = []                                                                   # list of tasks to teardown
+        self.throttle       = GroupThrottle.from_config()
 
     def __call__(self, *tasks:str, handler:Maybe[API.Handler]=None):  #noqa: ARG002
         """ tasks are initial targets to run.
@@ -250,8 +268,10 @@ class DootRunner:
                 case TaskArtifact():
                     self.notify_artifact(task)
                 case Job_p():
+                    self.sleep_before(task)
                     self.expand_job(task)
                 case Task_p():
+                    self.sleep_before(task)
                     self.execute_task(task)
                 case x:
                     doot.report.gen.error("Unknown Value provided to runner: %s", x)
@@ -269,40 +289,52 @@ class DootRunner:
             self.sleep_after(task)
             self.large_step += 1
 
-    def expand_job(self, job:Job_p) -> None:
+    def expand_job(self, job:Job_p, *, large_step:Maybe[int]=None) -> None:
         """ turn a job into all of its tasks, including teardowns """
-        logmod.debug("-- Expanding Job %s: %s", self.large_step, job.name)
-        assert(isinstance(job, Job_p))
+        step = self.large_step if large_step is None else large_step
         try:
-            doot.report.wf.branch(job.spec.name, info=f"Job {self.large_step}")
-            if not self.executor.test_conditions(job, large_step=self.large_step):
-                return
-
-            self.executor.execute_action_group(job, group=SETUP_GROUP, large_step=self.large_step)
-            match self.executor.execute_action_group(job, group=ACTION_GROUP, large_step=self.large_step):
-                case None:
+            match self._expand_job_actions(job, large_step=step):
+                case None | []:
                     pass
-                case int(), ActRE(), [*xs]:
+                case [*xs]:
                     self._queue_more_tasks(job.name, xs)
         except doot.errors.DootError as err:
-            self.executor.execute_action_group(job, group=FAIL_GROUP, large_step=self.large_step)
+            self.executor.execute_action_group(job, group=FAIL_GROUP, large_step=step)
             raise
 
-    def execute_task(self, task:Task_p) -> None:
+    def execute_task(self, task:Task_p, *, large_step:Maybe[int]=None) -> None:
         """ execute a single task's actions """
-        logmod.debug("-- Expanding Task %s: %s", self.large_step, task.name)
+        step = self.large_step if large_step is None else large_step
+        logmod.debug("-- Expanding Task %s: %s", step, task.name)
         assert(not isinstance(task, Job_p))
         try:
-            doot.report.wf.branch(task.spec.name, info=f"Task {self.large_step}")
-            if not self.executor.test_conditions(task, large_step=self.large_step):
+            doot.report.wf.branch(task.spec.name, info=f"Task {step}")
+            if not self.executor.test_conditions(task, large_step=step):
                 return
 
-            self.executor.execute_action_group(task, group=SETUP_GROUP, large_step=self.large_step)
-            self.executor.execute_action_group(task, group=ACTION_GROUP, large_step=self.large_step)
+            self.executor.execute_action_group(task, group=SETUP_GROUP, large_step=step)
+            self.executor.execute_action_group(task, group=ACTION_GROUP, large_step=step)
         except doot.errors.DootError as err:
-            self.executor.execute_action_group(task, group=FAIL_GROUP, large_step=self.large_step)
+            self.executor.execute_action_group(task, group=FAIL_GROUP, large_step=step)
             raise
 
+    def _expand_job_actions(self, job:Job_p, *, large_step:int) -> Maybe[list]:
+        """ Run a job's action groups, returning the specs it generated, without queuing them.
+        Does *not* run the on_fail group
+        """
+        logmod.debug("-- Expanding Job %s: %s", large_step, job.name)
+        assert(isinstance(job, Job_p))
+        doot.report.wf.branch(job.spec.name, info=f"Job {large_step}")
+        if not self.executor.test_conditions(job, large_step=large_step):
+            return None
+
+        self.executor.execute_action_group(job, group=SETUP_GROUP, large_step=large_step)
+        match self.executor.execute_action_group(job, group=ACTION_GROUP, large_step=large_step):
+            case int(), ActRE(), [*xs]:
+                return xs
+            case _:
+                return None
+
     def _queue_more_tasks(self, source:TaskName_p, new_tasks:list) -> None:
         """ When 'allowed', an action group can queue more tasks in the tracker,
         can return a new ActRE to describe the result status of this group
@@ -330,5 +362,8 @@ class DootRunner:
     def handle_failure(self, failure:Exception) -> None:
         raise NotImplementedError()
 
+    def sleep_before[T:Task_p|Artifact_i](self, task:Maybe[T]) -> None:
+        raise NotImplementedError()
+
     def sleep_after[T:Task_p|Artifact_i](self, task:Maybe[T]) -> None:
         raise NotImplementedError()
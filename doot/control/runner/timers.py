@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Non-blocking delays for runners.
+
+Instead of sleeping after every task, a runner records when tasks may start,
+and keeps running anything else that is ready in the meantime.
+
+A task which sets 'sleep' starts a cool-down for its group when it finishes::
+
+    [[tasks.group]]
+    name  = "fetch"
+    sleep = 2.0
+
+And groups can be rate limited, in tasks started per second::
+
+    [settings.commands.run]
+    rate_limits = { group=2.5, other={ rate=1, burst=4 } }
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import heapq
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow._interface import Task_p
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.workflow._interface import TaskName_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+DEFAULT_SLEEP_LENGTH : Final[int|float] = doot.config.on_fail(0.0, int|float).commands.run.sleep.task()
+DEFAULT_BURST        : Final[float]     = 1.0
+##--|
+
+class TimerHeap[T]:
+    """ Items waiting until a point in time.
+    Items due at the same time are popped in the order they were pushed.
+    """
+
+    _heap     : list[tuple[float, int, T]]
+    _counter  : Iterator[int]
+
+    def __init__(self) -> None:
+        self._heap     = []
+        self._counter  = itz.count()
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item:T, at:float) -> None:
+        """ Add an item, due at the monotonic time 'at' """
+        heapq.heappush(self._heap, (at, next(self._counter), item))
+
+    def pop_due(self, now:Maybe[float]=None) -> list[T]:
+        """ Remove and return every item which is due """
+        result  : list[T]  = []
+        now                = time.monotonic() if now is None else now
+        while bool(self._heap) and self._heap[0][0] <= now:
+            result.append(heapq.heappop(self._heap)[-1])
+        else:
+            return result
+
+    def next_due(self) -> Maybe[float]:
+        """ When the earliest item is due, or None """
+        if not bool(self._heap):
+            return None
+        return self._heap[0][0]
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+class TokenBucket:
+    """ A rate limit, of 'rate' tokens per second, holding up to 'burst' tokens.
+
+    Taking a token never fails. If there isn't one, it is borrowed from the future,
+    and the delay until it would have been available is returned.
+    So successive takes are spaced out by 1/rate seconds.
+    """
+
+    rate    : float
+    burst   : float
+    _tokens : float
+    _last   : Maybe[float]
+
+    def __init__(self, rate:float, burst:float=DEFAULT_BURST) -> None:
+        if rate <= 0:
+            raise ValueError("A rate limit must be positive", rate)
+        self.rate     = float(rate)
+        self.burst    = max(1.0, float(burst))
+        self._tokens  = self.burst
+        self._last    = None
+
+    def take(self, now:Maybe[float]=None) -> float:
+        """ Take a token, returning how many seconds to wait before using it """
+        now = time.monotonic() if now is None else now
+        if self._last is not None:
+            self._tokens = min(self.burst, self._tokens + ((now - self._last) * self.rate))
+
+        self._last     = now
+        self._tokens  -= 1
+        if 0 <= self._tokens:
+            return 0.0
+
+        return -self._tokens / self.rate
+
+class GroupThrottle:
+    """ Tracks when each task group may next start a task.
+
+    A group is cooling down after one of its tasks, with a 'sleep', finishes.
+    A rate limited group also spaces out its starts by its tokens per second.
+
+    _cool_until : group -> the monotonic time its cool-down ends
+    _buckets    : group -> its rate limit
+    _reserved   : tasks which already hold a token, while waiting to start
+    """
+
+    _cool_until  : dict[str, float]
+    _buckets     : dict[str, TokenBucket]
+    _reserved    : set[TaskName_p]
+
+    def __init__(self, rates:Maybe[Mapping]=None) -> None:
+        self._cool_until  = {}
+        self._buckets     = {}
+        self._reserved    = set()
+        for group, rate in (rates or {}).items():
+            match rate:
+                case int() | float():
+                    self._buckets[str(group)] = TokenBucket(rate)
+                case {"rate": rate, "burst": burst}:
+                    self._buckets[str(group)] = TokenBucket(rate, burst)
+                case {"rate": rate}:
+                    self._buckets[str(group)] = TokenBucket(rate)
+                case x:
+                    raise doot.errors.ConfigError("Bad rate limit for group", group, x)
+
+    @classmethod
+    def from_config(cls) -> GroupThrottle:
+        return cls(dict(doot.config.on_fail({}).settings.commands.run.rate_limits()))
+
+    @staticmethod
+    def group_of(task:Task_p) -> str:
+        return str(task.name[0,:])
+
+    @staticmethod
+    def sleep_of(task:Task_p) -> float:
+        """ The cool-down a task declares """
+        return task.spec.extra.on_fail(DEFAULT_SLEEP_LENGTH, int|float).sleep()
+
+    def delay_for(self, task:Task_p, now:Maybe[float]=None) -> float:
+        """ How many seconds until a task may start.
+        Once its group isn't cooling down, a task takes a token from its group's rate limit,
+        so asking again for the same task doesn't take another.
+        """
+        now    = time.monotonic() if now is None else now
+        group  = self.group_of(task)
+        match self._cool_until.get(group, now) - now:
+            case float() as x if 0 < x:
+                return x
+            case _:
+                pass
+
+        match self._buckets.get(group, None):
+            case None:
+                return 0.0
+            case _ if task.name in self._reserved:
+                self._reserved.discard(task.name)
+                return 0.0
+            case TokenBucket() as bucket:
+                pass
+
+        match bucket.take(now):
+            case x if 0 < x:
+                self._reserved.add(task.name)
+                return x
+            case _:
+                return 0.0
+
+    def refund(self, task:Task_p) -> None:
+        """ Return the token a task took, when it couldn't start after all.
+        The task holds it until its next attempt, instead of taking another.
+        """
+        if self.group_of(task) in self._buckets:
+            self._reserved.add(task.name)
+
+    def cool(self, task:Task_p, now:Maybe[float]=None) -> None:
+        """ Start the cool-down of a task's group, if the task has a sleep """
+        now        = time.monotonic() if now is None else now
+        sleep_len  = self.sleep_of(task)
+        if sleep_len <= 0:
+            return
+
+        group = self.group_of(task)
+        doot.report.gen.detail("[Cooling %s (%s)...]", group, sleep_len, extra={"colour":"white"})
+        self._cool_until[group] = max(self._cool_until.get(group, now), now + sleep_len)
@@ -72,8 +72,6 @@ max_steps            : Final[int]             = doot.config.on_fail(100_000).com
 fail_prefix          : Final[str]             = doot.constants.printer.fail_prefix
 loop_entry_msg       : Final[str]             = doot.constants.printer.loop_entry
 loop_exit_msg        : Final[str]             = doot.constants.printer.loop_exit
-
-DEFAULT_SLEEP_LENGTH : Final[int|float]       = doot.config.on_fail(0.2, int|float).commands.run.sleep.task()
 ##--|
 
 class _RunnerCtx_m:
@@ -108,7 +106,10 @@ class _RunnerCtx_m:
     def __exit__(self:WorkflowRunner_p, exc_type:type[Exception], exc_value:Exception, exc_traceback:Traceback) -> Literal[False]:
         logging.info("Exiting Runner Control")
         # TODO handle exc_types?
-        self._finish()
+        try:
+            self.tracker.finish()
+        finally:
+            self._finish()
         return False
 
     def _finish(self:WorkflowRunner_p) -> None:
@@ -185,17 +186,31 @@ class _RunnerHandlers_m:
         doot.report.wf.result(["Artifact: %s", art])
         raise doot.errors.StateError("Artifact resolutely does not exist", art)
 
-    def sleep_after(self:WorkflowRunner_p, task:Maybe[Task_p|Artifact_i]) -> None:
+    def sleep_before(self:WorkflowRunner_p, task:Maybe[Task_p|Artifact_i]) -> None:
         """
-          The runner's sleep method, which spaces out tasks
+          Wait out the cool-down or rate limit of a task's group, before running it.
+          Other groups don't wait.
         """
         match task:
-            case None:
-                return
-            case TaskArtifact():
+            case Task_p():
+                pass
+            case _:
                 return
 
-        assert(isinstance(task, Task_p))
-        sleep_len = task.spec.extra.on_fail(DEFAULT_SLEEP_LENGTH, int|float).sleep()
-        doot.report.gen.detail("[Sleeping (%s)...]", sleep_len, extra={"colour":"white"})
-        time.sleep(sleep_len)
+        match self.throttle.delay_for(task):
+            case x if 0 < x:
+                doot.report.gen.detail("[Sleeping (%s)...]", x, extra={"colour":"white"})
+                time.sleep(x)
+            case _:
+                pass
+
+    def sleep_after(self:WorkflowRunner_p, task:Maybe[Task_p|Artifact_i]) -> None:
+        """
+          Start the cool-down of a task's group.
+          Doesn't sleep, later tasks of the group wait for it in sleep_before
+        """
+        match task:
+            case Task_p():
+                self.throttle.cool(task)
+            case _:
+                return
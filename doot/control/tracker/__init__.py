@@ -3,3 +3,5 @@
 """
 from ._base import Tracker_abs
 from .naive_tracker import NaiveTracker
+from .ready_tracker import ReadyTracker
+from .critical_tracker import CriticalPathTracker
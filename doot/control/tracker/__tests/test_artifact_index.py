@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ARG001, ANN001, PLR2004
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import random
+import unittest
+import warnings
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow import TaskArtifact
+
+# ##-- end 1st party imports
+
+from ..artifact_index import ArtifactIndex
+from ..registry import TrackRegistry
+from ..naive_tracker import NaiveTracker
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+#
+logging = logmod.root
+logmod.getLogger("jgdv").propagate = False
+
+ABSTRACTS : Final[list[str]] = ["file::>a/b/*.py", "file::>a/*/c.py", "file::>**/c.py", "file::>x/*.txt", "file::>a/b/?.py"]
+CONCRETES : Final[list[str]] = ["file::>a/b/c.py", "file::>x/y.txt", "file::>q/c.py"]
+
+class TestArtifactIndex:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        index = ArtifactIndex()
+        assert(isinstance(index, ArtifactIndex))
+        assert(len(index) == 0)
+
+    def test_add(self):
+        index = ArtifactIndex()
+        art   = TaskArtifact("file::>a/b/c.py")
+        index.add(art)
+        index.add(art)
+        assert(art in index)
+        assert(len(index) == 1)
+
+    def test_abstracts_of(self):
+        index     = ArtifactIndex()
+        abstracts = [TaskArtifact(x) for x in ABSTRACTS]
+        for x in abstracts:
+            index.add(x)
+
+        found = index.abstracts_of(TaskArtifact("file::>a/b/c.py"))
+        assert(set(found) == {abstracts[0], abstracts[1], abstracts[2], abstracts[4]})
+
+    def test_abstracts_of_other_branch(self):
+        index     = ArtifactIndex()
+        abstracts = [TaskArtifact(x) for x in ABSTRACTS]
+        for x in abstracts:
+            index.add(x)
+
+        assert(index.abstracts_of(TaskArtifact("file::>q/c.py")) == [abstracts[2]])
+        assert(index.abstracts_of(TaskArtifact("file::>q/d.py")) == [])
+
+    def test_concretes_in(self):
+        index     = ArtifactIndex()
+        concretes = [TaskArtifact(x) for x in CONCRETES]
+        for x in concretes:
+            index.add(x)
+
+        assert(index.concretes_in(TaskArtifact("file::>x/*.txt")) == [concretes[1]])
+        assert(set(index.concretes_in(TaskArtifact("file::>**/c.py"))) == {concretes[0], concretes[2]})
+        assert(index.concretes_in(TaskArtifact("file::>z/*.txt")) == [])
+
+    def test_concrete_added_after_query(self):
+        index  = ArtifactIndex()
+        pattern = TaskArtifact("file::>x/*.txt")
+        assert(index.concretes_in(pattern) == [])
+        conc = TaskArtifact("file::>x/y.txt")
+        index.add(conc)
+        assert(index.concretes_in(pattern) == [conc])
+
+    def test_unexpandable_location(self, mocker):
+        index     = ArtifactIndex()
+        abstracts = [TaskArtifact(x) for x in ABSTRACTS]
+        located   = TaskArtifact("file::>{temp}/a.txt")
+        for x in abstracts:
+            index.add(x)
+
+        assert(index.path_of(located) is None)
+        mocker.patch.object(type(located), "is_concrete", return_value=True)
+        index.add(located)
+
+        assert(index.abstracts_of(located) == [])
+        assert(index.concretes_in(TaskArtifact("file::>x/*.txt")) == [])
+        assert(located in index._pending)
+
+    def test_matches_brute_force(self):
+        """ The index finds the same matches as checking every pair """
+        rand      = random.Random(0)
+        dirs      = ["a", "b", "c"]
+        names     = ["x.py", "y.py", "z.txt"]
+        concretes = [TaskArtifact("file::>" + "/".join([*rand.choices(dirs, k=rand.randint(1, 3)), rand.choice(names)])) for _ in range(40)]
+        patterns  = ["a/*.py", "a/b/*.txt", "*/x.py", "**/y.py", "b/c/?.py", "c/*/*.txt"]
+        abstracts = [TaskArtifact(f"file::>{x}") for x in patterns]
+        index     = ArtifactIndex()
+        for x in [*concretes, *abstracts]:
+            index.add(x)
+
+        for conc in set(concretes):
+            path     = index.path_of(conc)
+            expected = {x for x in abstracts if path in x or conc in x}
+            assert(set(index.abstracts_of(conc)) == expected), conc
+
+        for abstract in abstracts:
+            expected = {x for x in concretes if index.path_of(x) in abstract}
+            assert(set(index.concretes_in(abstract)) == expected), abstract
+
+class TestRegistryIndex:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_registered_artifacts_are_indexed(self):
+        registry = TrackRegistry(tracker=NaiveTracker())
+        art      = TaskArtifact("file::>a/b/c.py")
+        registry._register_artifact(art)
+        assert(art in registry.artifact_index)
+        assert(art in registry.concrete)
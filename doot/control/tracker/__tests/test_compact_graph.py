@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ARG001, ANN001, PLR2004
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import random
+import unittest
+import warnings
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+import networkx as nx
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+from .. import _interface as API # noqa: N812
+from ..compact_graph import CompactDiGraph
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+#
+logging = logmod.root
+
+class TestCompactDiGraph:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        graph = CompactDiGraph()
+        assert(isinstance(graph, CompactDiGraph))
+        assert(len(graph) == 0)
+        assert(len(graph.edges) == 0)
+
+    def test_add_node_idempotent(self):
+        graph = CompactDiGraph()
+        assert(graph.add_node("a") == 0)
+        assert(graph.add_node("b") == 1)
+        assert(graph.add_node("a") == 0)
+        assert(len(graph) == 2)
+        assert("a" in graph)
+        assert("c" not in graph)
+
+    def test_flags(self):
+        graph = CompactDiGraph()
+        for x in range(20):
+            graph.add_node(x)
+        assert(graph.nodes[3][API.EXPANDED] is False)
+        graph.nodes[3][API.EXPANDED] = True
+        graph.nodes[17][API.REACTIVE_ADD] = True
+        assert(graph.nodes[3][API.EXPANDED] is True)
+        assert(graph.nodes[3].get(API.REACTIVE_ADD, None) is False)
+        assert(graph.nodes[17][API.REACTIVE_ADD] is True)
+        assert(not any(graph.nodes[x][API.EXPANDED] for x in range(20) if x != 3))
+        graph.nodes[3][API.EXPANDED] = False
+        assert(graph.nodes[3][API.EXPANDED] is False)
+
+    def test_other_node_attrs(self):
+        graph = CompactDiGraph()
+        graph.add_node("a", colour="blue")
+        assert(graph.nodes["a"]["colour"] == "blue")
+        assert(graph.nodes["a"].get("size", None) is None)
+        assert(set(graph.nodes["a"]) == {API.EXPANDED, API.REACTIVE_ADD, "colour"})
+
+    def test_missing_node(self):
+        graph = CompactDiGraph()
+        with pytest.raises(KeyError):
+            graph.nodes["a"]
+        with pytest.raises(KeyError):
+            graph.pred["a"]
+
+    def test_edges(self):
+        graph = CompactDiGraph()
+        graph.add_edge("a", "b", type=API.EdgeType_e.TASK)
+        graph.add_edge("a", "c", type=API.EdgeType_e.TASK_CROSS, weight=2)
+        assert(len(graph) == 3)
+        assert(len(graph.edges) == 2)
+        assert(("a", "b") in graph.edges)
+        assert(("b", "a") not in graph.edges)
+        assert(graph.edges["a", "b"] == {"type": API.EdgeType_e.TASK})
+        assert(graph.edges["a", "c"] == {"type": API.EdgeType_e.TASK_CROSS, "weight": 2})
+        assert(list(graph.succ["a"]) == ["b", "c"])
+        assert(list(graph.pred["c"]) == ["a"])
+        assert(list(graph.adj["a"].keys()) == ["b", "c"])
+        assert(not bool(graph.succ["b"]))
+        assert(bool(graph.pred["b"]))
+
+    def test_add_edge_idempotent(self):
+        graph = CompactDiGraph()
+        graph.add_edge("a", "b", type=API.EdgeType_e.TASK)
+        graph.add_edge("a", "b", type=API.EdgeType_e.TASK_CROSS)
+        assert(len(graph.edges) == 1)
+        assert(graph.edges["a", "b"]["type"] is API.EdgeType_e.TASK_CROSS)
+
+    def test_edge_lookup_by_direction(self):
+        graph = CompactDiGraph()
+        graph.add_edge("a", "b", type=API.EdgeType_e.TASK)
+        graph.add_edge("c", "b", type=API.EdgeType_e.TASK_CROSS)
+        assert("b" in graph.succ["a"])
+        assert("a" not in graph.succ["b"])
+        assert("a" in graph.pred["b"])
+        assert("b" not in graph.pred["a"])
+        assert("d" not in graph.pred["b"])
+        assert(graph.pred["b"]["c"] == {"type": API.EdgeType_e.TASK_CROSS})
+        assert(len(graph.pred["b"]) == 2)
+        assert(len(graph.succ["b"]) == 0)
+        with pytest.raises(KeyError):
+            graph.succ["b"]["a"]
+
+    def test_high_degree_lookup(self):
+        """ a node with many successors is bisected, and still iterates in insertion order """
+        rand     = random.Random(3)
+        targets  = rand.sample(range(1, 200), 50)
+        graph    = CompactDiGraph()
+        for x in targets:
+            graph.add_edge(0, x, type=API.EdgeType_e.TASK)
+        graph.add_edge(0, targets[10], type=API.EdgeType_e.TASK_CROSS)
+        assert(graph._ids[0] in graph._sorted)
+        assert(list(graph.succ[0]) == targets)
+        assert(len(graph.edges) == 50)
+        assert(graph.edges[0, targets[10]]["type"] is API.EdgeType_e.TASK_CROSS)
+        for x in range(1, 200):
+            assert(graph.has_edge(0, x) == (x in targets))
+        for x in targets:
+            assert(0 in graph.pred[x])
+
+    def test_matches_networkx(self):
+        """ random graphs have the same views, in the same order, as an nx.DiGraph """
+        rand     = random.Random(7)
+        compact  = CompactDiGraph()
+        expected = nx.DiGraph()
+        for _ in range(500):
+            left, right = rand.randrange(100), rand.randrange(100)
+            if left == right:
+                continue
+            compact.add_edge(left, right, type=API.EdgeType_e.TASK)
+            expected.add_edge(left, right, type=API.EdgeType_e.TASK)
+        else:
+            assert(list(compact.nodes) == list(expected.nodes))
+            assert(list(compact.edges) == list(expected.edges))
+            for node in expected.nodes:
+                assert(list(compact.pred[node]) == list(expected.pred[node]))
+                assert(list(compact.succ[node]) == list(expected.succ[node]))
+                assert(len(compact.succ[node]) == len(expected.succ[node]))
+                assert(len(compact.pred[node]) == len(expected.pred[node]))
+            for left in expected.nodes:
+                for right in expected.nodes:
+                    assert(compact.has_edge(left, right) == expected.has_edge(left, right))
+
+    def test_subgraph(self):
+        compact = CompactDiGraph()
+        for x in range(10):
+            compact.add_edge(x, x+1, type=API.EdgeType_e.TASK)
+        else:
+            compact.nodes[3][API.EXPANDED] = True
+
+        sub = compact.subgraph(range(2, 6))
+        assert(isinstance(sub, nx.DiGraph))
+        assert(list(sub.nodes) == [2, 3, 4, 5])
+        assert(list(sub.edges) == [(2, 3), (3, 4), (4, 5)])
+        assert(sub.nodes[3][API.EXPANDED] is True)
+        assert(sub.edges[2, 3]["type"] is API.EdgeType_e.TASK)
+        assert(list(nx.topological_sort(sub)) == [2, 3, 4, 5])
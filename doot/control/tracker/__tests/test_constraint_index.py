@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ARG001, ANN001, PLR2004
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import unittest
+import warnings
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow import TaskName
+
+# ##-- end 1st party imports
+
+from ..constraint_index import ConstraintIndex
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+#
+logging = logmod.root
+
+ABSTRACT : Final[TaskName] = TaskName("basic::dep")
+
+@pytest.fixture(scope="function")
+def instances():
+    values = {
+        ABSTRACT.to_uniq() : {"a": 1, "b": "x"},
+        ABSTRACT.to_uniq() : {"a": 2, "b": "x"},
+        ABSTRACT.to_uniq() : {"a": 1, "b": "y"},
+        ABSTRACT.to_uniq() : {"b": "x"},
+        ABSTRACT.to_uniq() : {"a": [1], "b": "x"},
+    }
+    return values
+
+class TestConstraintIndex:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        index = ConstraintIndex(lambda x: {})
+        assert(isinstance(index, ConstraintIndex))
+
+    def test_candidates(self, instances):
+        index     = ConstraintIndex(instances.__getitem__)
+        names     = list(instances)
+        result    = index.candidates(ABSTRACT, ("a", "b"), (1, "x"), names)
+        # the match, and the unkeyed missing and unhashable values
+        assert(result == [names[0], names[3], names[4]])
+
+    def test_candidates_single_key(self, instances):
+        index     = ConstraintIndex(instances.__getitem__)
+        names     = list(instances)
+        result    = index.candidates(ABSTRACT, ("b",), ("y",), names)
+        assert(result == [names[2]])
+
+    def test_no_keys_matches_all(self, instances):
+        index     = ConstraintIndex(instances.__getitem__)
+        names     = list(instances)
+        assert(index.candidates(ABSTRACT, (), (), names) == names)
+
+    def test_unhashable_values_scan_all(self, instances):
+        index     = ConstraintIndex(instances.__getitem__)
+        names     = list(instances)
+        assert(index.candidates(ABSTRACT, ("a",), ([1],), names) == names)
+
+    def test_add_updates_tables(self, instances):
+        index     = ConstraintIndex(instances.__getitem__)
+        names     = list(instances)
+        assert(index.candidates(ABSTRACT, ("b",), ("z",), names) == [])
+        new_inst  = ABSTRACT.to_uniq()
+        instances[new_inst] = {"b": "z"}
+        index.add(ABSTRACT, new_inst)
+        assert(index.candidates(ABSTRACT, ("b",), ("z",), []) == [new_inst])
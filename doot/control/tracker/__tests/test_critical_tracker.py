@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import unittest
+import warnings
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+import networkx as nx
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow._interface import TaskStatus_e, TaskSpec_i, TaskMeta_e, DelayedSpec
+from doot.util import mock_gen
+from ..critical_tracker import CriticalPathTracker
+from ..durations import TaskDurations
+from ..network import TrackNetwork
+from .. import _interface as API  # noqa: N812
+from doot.workflow.structs.task_spec import TaskSpec
+from doot.workflow.structs.task_name import TaskName
+
+# ##-- end 1st party imports
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+from doot.workflow._interface import Task_p
+# isort: on
+# ##-- end types
+logging                                                      = logmod.root
+logmod.getLogger("jgdv").propagate                           = False
+logmod.getLogger("doot.util.factory").propagate              = False
+logmod.getLogger("doot.control.tracker.registry").propagate  = False
+logmod.getLogger("doot.control.tracker.queue").propagate     = False
+logmod.getLogger("doot.control.tracker.network").propagate   = False
+logmod.getLogger("doot.control.tracker._base").propagate     = False
+logmod.getLogger("doot.workflow.task").propagate             = False
+
+class TestTaskDurations:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_default(self):
+        durations = TaskDurations()
+        assert(durations.get(TaskName("basic::task")) == 1.0)
+        assert(durations.get(TaskName("basic::task"), 5) == 5)
+
+    def test_record_by_abstract_name(self):
+        durations = TaskDurations()
+        name      = TaskName("basic::task").to_uniq()
+        durations.record(name, 4)
+        assert(TaskName("basic::task") in durations)
+        assert(durations.get(TaskName("basic::task")) == 4)
+
+    def test_record_smooths(self):
+        durations = TaskDurations()
+        name      = TaskName("basic::task")
+        durations.record(name, 4)
+        durations.record(name, 2)
+        assert(durations.get(name) == 3)
+
+    def test_save_and_load(self, tmp_path):
+        path      = tmp_path / "durations.json"
+        durations = TaskDurations(path=path)
+        durations.record(TaskName("basic::task"), 4)
+        durations.save()
+        assert(path.exists())
+        assert(TaskDurations(path=path).get(TaskName("basic::task")) == 4)
+
+    def test_unreadable_file(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text("not json")
+        assert(len(TaskDurations(path=path)) == 0)
+
+class TestCriticalPathTracker:
+
+    @pytest.fixture(scope="function", params=["networkx", "compact"])
+    def tracker(self, request):
+        return CriticalPathTracker(durations=TaskDurations(), network=ftz.partial(TrackNetwork, backend=request.param))
+
+    def _concrete(self, tracker, name:str) -> TaskName:
+        return next(x for x in tracker.specs[TaskName(name)].related if not x.is_cleanup())
+
+    def _run_all(self, tracker) -> list:
+        order = []
+        while (task:=tracker.next_for()) is not None:
+            if not task.name.is_cleanup():
+                order.append(task.name.de_uniq())
+            tracker.set_status(task.name, TaskStatus_e.SUCCESS)
+        else:
+            return order
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        assert(isinstance(CriticalPathTracker, API.WorkflowTracker_p))
+
+    def test_longest_path_first(self, tracker):
+        """ 'short' is ready first, but 'long' heads a longer chain """
+        tracker.durations.record(TaskName("basic::long"), 10)
+        tracker.durations.record(TaskName("basic::after"), 10)
+        specs = [
+            tracker._factory.build({"name":"basic::short"}),
+            tracker._factory.build({"name":"basic::long"}),
+            tracker._factory.build({"name":"basic::after", "depends_on":["basic::long"]}),
+        ]
+        tracker.register(*specs)
+        tracker.queue("basic::short", from_user=True)
+        tracker.queue("basic::after", from_user=True)
+        tracker.build()
+        assert(tracker.critical_path(self._concrete(tracker, "basic::long")) > tracker.critical_path(self._concrete(tracker, "basic::short")))
+        assert(self._run_all(tracker)[0] == "basic::long")
+
+    def test_priority_inherited(self, tracker):
+        """ 'blocker' inherits the priority of the target that depends on it """
+        specs = [
+            tracker._factory.build({"name":"basic::other", "priority":10}),
+            tracker._factory.build({"name":"basic::blocker", "priority":1}),
+            tracker._factory.build({"name":"basic::target", "priority":50, "depends_on":["basic::blocker"]}),
+        ]
+        tracker.register(*specs)
+        tracker.queue("basic::other", from_user=True)
+        tracker.queue("basic::target", from_user=True)
+        tracker.build()
+        assert(tracker.inherited_priority(self._concrete(tracker, "basic::blocker")) == 50)
+        assert(self._run_all(tracker)[:2] == ["basic::blocker", "basic::target"])
+
+    def test_records_durations(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha"})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        assert(spec.name not in tracker.durations)
+        self._run_all(tracker)
+        assert(spec.name in tracker.durations)
+        assert(tracker.durations.get(spec.name) < 1)
+
+    def test_failure_not_recorded(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha"})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        task = tracker.next_for()
+        tracker.set_status(task.name, TaskStatus_e.FAILED)
+        assert(spec.name not in tracker.durations)
+
+    def test_finish_saves_after_failure(self, tmp_path):
+        """ Durations recorded before a failure are saved when the tracker finishes """
+        path     = tmp_path / "durations.json"
+        tracker  = CriticalPathTracker(durations=TaskDurations(path=path))
+        specs    = [
+            tracker._factory.build({"name":"basic::alpha"}),
+            tracker._factory.build({"name":"basic::beta", "depends_on":["basic::alpha"]}),
+        ]
+        tracker.register(*specs)
+        tracker.queue("basic::beta", from_user=True)
+        tracker.build()
+        while (task:=tracker.next_for()) is not None:
+            if task.name.de_uniq() == "basic::beta":
+                tracker.set_status(task.name, TaskStatus_e.FAILED)
+                break
+            tracker.set_status(task.name, TaskStatus_e.SUCCESS)
+
+        assert(not path.exists())
+        tracker.finish()
+        assert(TaskName("basic::alpha") in TaskDurations(path=path))
+
+    def test_default_path(self):
+        assert(CriticalPathTracker()._durations_path() == doot.locs["{temp}/durations.json"])
+
+    def test_disabled_path(self, mocker):
+        mocker.patch("doot.control.tracker.critical_tracker.DURATIONS_PATH", False)
+        tracker = CriticalPathTracker()
+        assert(tracker._durations_path() is None)
+        assert(tracker.durations.path is None)
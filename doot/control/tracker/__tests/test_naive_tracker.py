@@ -31,6 +31,8 @@ import doot.errors
 from doot.workflow._interface import TaskStatus_e, TaskSpec_i, TaskMeta_e, DelayedSpec
 from doot.util import mock_gen
 from ..naive_tracker import NaiveTracker
+from ..network import TrackNetwork
+from ..compact_graph import CompactDiGraph
 from .. import _interface as API  # noqa: N812
 from doot.workflow.structs.task_spec import TaskSpec
 from doot.workflow.structs.task_name import TaskName
@@ -585,3 +587,94 @@ class TestTracker_delayed:
                 assert(actual.value == base_spec.value)
             case x:
                 assert(False), x
+
+class TestTracker_plan:
+
+    @pytest.fixture(scope="function", params=["networkx", "compact"])
+    def tracker(self, request):
+        tracker = NaiveTracker(network=ftz.partial(TrackNetwork, backend=request.param))
+        specs   = [
+            tracker._factory.build({"name":"basic::alpha", "depends_on":["basic::dep", "basic::dep2"]}),
+            tracker._factory.build({"name":"basic::dep", "priority":5}),
+            tracker._factory.build({"name":"basic::dep2", "priority":20, "depends_on":["basic::dep3"]}),
+            tracker._factory.build({"name":"basic::dep3"}),
+        ]
+        tracker.register(*specs)
+        tracker.queue("basic::alpha", from_user=True)
+        tracker.build()
+        return tracker
+
+    def _tasks(self, plan:list) -> list[str]:
+        return [str(x.node.de_uniq()) for x in plan if not x.node.is_cleanup()]
+
+    def _assert_topological(self, tracker, plan:list) -> None:
+        seen = set()
+        for entry in plan:
+            assert(all(x in seen for x in tracker._network.pred[entry.node]))
+            seen.add(entry.node)
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_plan_empty(self):
+        tracker = NaiveTracker()
+        tracker.build()
+        assert(tracker.plan() == [])
+
+    def test_plan_priority(self, tracker):
+        plan = tracker.plan(policy=API.ExecutionPolicy_e.PRIORITY)
+        assert(len(plan) == 8)
+        self._assert_topological(tracker, plan)
+        assert(self._tasks(plan) == ["basic::dep3", "basic::dep2", "basic::dep", "basic::alpha"])
+
+    def test_plan_depth(self, tracker):
+        plan = tracker.plan(policy=API.ExecutionPolicy_e.DEPTH)
+        self._assert_topological(tracker, plan)
+        assert(self._tasks(plan) == ["basic::dep3", "basic::dep2", "basic::dep", "basic::alpha"])
+
+    def test_plan_breadth(self, tracker):
+        plan = tracker.plan(policy=API.ExecutionPolicy_e.BREADTH)
+        self._assert_topological(tracker, plan)
+        assert(self._tasks(plan) == ["basic::dep3", "basic::dep", "basic::dep2", "basic::alpha"])
+        assert([x.depth for x in plan] == sorted(x.depth for x in plan))
+
+    def test_plan_entries_unpack(self, tracker):
+        for depth, node, desc in tracker.plan():
+            assert(isinstance(depth, int))
+            assert(desc == ("Cleanup" if node.is_cleanup() else "Task"))
+
+    def test_plan_is_cached(self, tracker, mocker):
+        sort_spy = mocker.spy(tracker, "_plan_by_priority")
+        first    = tracker.plan()
+        second   = tracker.plan()
+        assert(first == second)
+        assert(first is not second)
+        assert(sort_spy.call_count == 1)
+
+    def test_plan_recalculated_on_change(self, tracker):
+        first = tracker.plan()
+        tracker.register(tracker._factory.build({"name":"basic::other"}))
+        tracker.queue("basic::other", from_user=True)
+        tracker.build()
+        assert(len(first) < len(tracker.plan()))
+
+    def test_plan_doesnt_materialise_graph(self, tracker, mocker):
+        sub_spy = mocker.spy(CompactDiGraph, "subgraph")
+        for policy in API.ExecutionPolicy_e:
+            self._assert_topological(tracker, tracker.plan(policy=policy))
+        assert(sub_spy.call_count == 0)
+
+    def test_plan_recalculated_on_rewire(self, tracker):
+        """ Rewiring without changing the number of nodes or edges still changes the plan """
+        network  = tracker._network
+        if isinstance(network._graph, CompactDiGraph):
+            pytest.skip("Edges can't be removed from a compact graph")
+        nodes    = {str(x.de_uniq()):x for x in network.nodes if isinstance(x, TaskName) and x.uuid() and not x.is_cleanup()}
+        first    = tracker.plan(policy=API.ExecutionPolicy_e.PRIORITY)
+        counts   = len(network.nodes), len(network.edges)
+        network._graph.remove_edge(nodes["basic::dep"], nodes["basic::alpha"])
+        network.connect(nodes["basic::dep"], nodes["basic::dep3"])
+        assert((len(network.nodes), len(network.edges)) == counts)
+        second   = tracker.plan(policy=API.ExecutionPolicy_e.PRIORITY)
+        assert(self._tasks(first) != self._tasks(second))
+        assert(self._tasks(second) == ["basic::dep", "basic::dep3", "basic::dep2", "basic::alpha"])
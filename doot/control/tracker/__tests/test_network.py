@@ -72,9 +72,9 @@ logmod.getLogger("doot.util").propagate = False
 def expected_spec_count(*args:Any) -> int:
     return len(args)
 
-@pytest.fixture(scope="function")
-def network(mocker):
-    tracker = NaiveTracker()
+@pytest.fixture(scope="function", params=["networkx", "compact"])
+def network(mocker, request):
+    tracker = NaiveTracker(network=ftz.partial(TrackNetwork, backend=request.param))
     return tracker._network
 
 ##--|
@@ -129,6 +129,23 @@ class TestTrackerNetwork:
         assert(len(obj.succ[name1]) == 1)
         assert(len(obj.pred[name2]) == 1)
 
+    def test_version_changes_on_connect(self, network):
+        obj = network
+        name1 = TaskName("basic::task").to_uniq()
+        name2 = TaskName("basic::other").to_uniq()
+        # Mock the tasks:
+        obj._tracker.specs[name1] = True
+        obj._tracker.specs[name2] = True
+        start = obj.version
+        obj.connect(name1, False)  # noqa: FBT003
+        added = obj.version
+        assert(start < added)
+        obj.connect(name1, name2)
+        connected = obj.version
+        assert(added < connected)
+        obj.connect(name1, name2)
+        assert(obj.version == connected)
+
     def test_connect_tasks_must_be_instanced(self, network):
         obj = network
         name1 = TaskName("basic::task")
@@ -192,10 +209,11 @@ class TestTrackerNetwork:
             "test_key": "bloo"
         })
         spec2 = network._tracker._factory.build({"name":"basic::dep",
-                                "depends_on": [{"task":"basic::chained", "inject":{"from_spec":{"test_key":"{test_key}"}}}],
+                                "depends_on": [{"task":"basic::leaf", "inject":{"from_spec":{"test_key":"{test_key}"}}}],
                                 })
-        spec3 = network._tracker._factory.build({"name":"basic::chained", "must_inject":["test_key"]})
-        obj._tracker.register(spec, spec2, spec3)
+        spec3 = network._tracker._factory.build({"name":"basic::chained"})
+        spec4 = network._tracker._factory.build({"name":"basic::leaf", "must_inject":["test_key"]})
+        obj._tracker.register(spec, spec2, spec3, spec4)
         instance = obj._tracker._instantiate(spec.name)
         assert(instance.uuid())
         obj.connect(instance)
@@ -208,6 +226,78 @@ class TestTrackerNetwork:
         assert(any(spec3.name < x for x in result.succ.tasks))
         assert(result.root is True)
 
+class TestTrackerNetworkOrdering:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def _names(self, network, *names):
+        result = []
+        for x in names:
+            name = TaskName(x).to_uniq()
+            network._tracker.specs[name] = True
+            result.append(name)
+        else:
+            return result
+
+    def _is_ordered(self, network) -> bool:
+        return all(network._order[x] < network._order[y] for x, y in network.edges)
+
+    def test_order_kept_on_connect(self, network):
+        obj           = network
+        a, b, c, d    = self._names(obj, "basic::a", "basic::b", "basic::c", "basic::d")
+        obj.connect(a, b)
+        obj.connect(c, d)
+        obj.connect(b, c)
+        obj.connect(d)
+        assert(self._is_ordered(obj))
+
+    def test_cycle_rejected(self, network):
+        obj       = network
+        a, b, c   = self._names(obj, "basic::a", "basic::b", "basic::c")
+        obj.connect(a, b)
+        obj.connect(b, c)
+        with pytest.raises(doot.errors.TrackingError):
+            obj.connect(c, a)
+
+        assert(not obj._graph.has_edge(c, a))
+        assert(self._is_ordered(obj))
+
+    def test_self_loop_rejected(self, network):
+        obj   = network
+        a,    = self._names(obj, "basic::a")
+        obj.connect(a, False) # noqa: FBT003
+        with pytest.raises(doot.errors.TrackingError):
+            obj.connect(a, a)
+
+    def test_order_kept_on_build(self, network):
+        obj   = network
+        spec  = network._tracker._factory.build({"name":"basic::task", "depends_on":["basic::dep"], "required_for":["basic::after"]})
+        spec2 = network._tracker._factory.build({"name":"basic::dep", "depends_on":["basic::leaf"]})
+        spec3 = network._tracker._factory.build({"name":"basic::after"})
+        spec4 = network._tracker._factory.build({"name":"basic::leaf"})
+        obj._tracker.register(spec, spec2, spec3, spec4)
+        obj.connect(obj._tracker._instantiate(spec.name))
+        obj.build_network()
+        assert(self._is_ordered(obj))
+
+    def test_validation_checks_only_new_nodes(self, network):
+        obj   = network
+        spec  = network._tracker._factory.build({"name":"basic::task", "depends_on":["basic::dep"]})
+        spec2 = network._tracker._factory.build({"name":"basic::dep"})
+        spec3 = network._tracker._factory.build({"name":"basic::other"})
+        obj._tracker.register(spec, spec2, spec3)
+        obj.connect(obj._tracker._instantiate(spec.name))
+        obj.build_network()
+        obj.validate_network()
+        assert(not bool(obj._unvalidated))
+        other = obj._tracker._instantiate(spec3.name)
+        obj.connect(other)
+        assert(obj._unvalidated == {other})
+        obj.build_network(sources=[other])
+        obj.validate_network()
+        assert(not bool(obj._unvalidated))
+
 class TestTrackerNetworkBuild:
 
     def test_build_empty(self, network):
@@ -709,7 +799,7 @@ class TestTrackerNetworkBuild_Artifacts:
                 assert(len(_rels) == 1)
                 dep_inst = _rels.pop()
                 assert(dep_inst.uuid())
-                assert(nx.has_path(obj._graph, dep_inst, instance))
+                assert(nx.has_path(obj._graph.subgraph(obj.nodes), dep_inst, instance))
             case x:
                 assert(False), x
 
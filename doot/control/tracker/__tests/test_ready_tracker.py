@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import threading
+import unittest
+import warnings
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+import networkx as nx
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow._interface import TaskStatus_e, TaskSpec_i, TaskMeta_e, DelayedSpec
+from doot.util import mock_gen
+from ..ready_tracker import ReadyTracker
+from .. import _interface as API  # noqa: N812
+from doot.workflow.structs.task_spec import TaskSpec
+from doot.workflow.structs.task_name import TaskName
+
+# ##-- end 1st party imports
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+from doot.workflow._interface import Task_p
+# isort: on
+# ##-- end types
+logging                                                      = logmod.root
+logmod.getLogger("jgdv").propagate                           = False
+logmod.getLogger("doot.util.factory").propagate              = False
+logmod.getLogger("doot.control.tracker.registry").propagate  = False
+logmod.getLogger("doot.control.tracker.queue").propagate     = False
+logmod.getLogger("doot.control.tracker.network").propagate   = False
+logmod.getLogger("doot.control.tracker._base").propagate     = False
+logmod.getLogger("doot.workflow.task").propagate             = False
+
+
+class TestReadyTracker:
+
+    @pytest.fixture(scope="function")
+    def tracker(self):
+        return ReadyTracker()
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        assert(isinstance(ReadyTracker, API.WorkflowTracker_p))
+
+    def test_next_for_empty(self, tracker):
+        tracker.build()
+        assert(tracker.next_for() is None)
+        assert(not bool(tracker))
+
+    def test_next_simple(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha"})
+        tracker.register(spec)
+        instance = tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        tracker.validate()
+        match tracker.next_for():
+            case Task_p() as result:
+                assert(spec.name < result.name)
+            case x:
+                assert(False), x
+        assert(tracker.get_status(target=instance)[0] is TaskStatus_e.RUNNING)
+        assert(bool(tracker))
+
+    def test_next_dependency_blocks(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha", "depends_on":["basic::dep"]})
+        dep  = tracker._factory.build({"name":"basic::dep"})
+        tracker.register(spec, dep)
+        instance = tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        match tracker.next_for():
+            case Task_p() as result:
+                assert(dep.name < result.name)
+            case x:
+                assert(False), x
+        assert(tracker.get_status(target=instance)[0] is TaskStatus_e.WAIT)
+        assert(tracker._blocking[instance] == 1)
+        # The dependency is running, so nothing else is ready
+        assert(tracker.next_for() is None)
+
+    def test_dependency_success_releases(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha", "depends_on":["basic::dep"]})
+        dep  = tracker._factory.build({"name":"basic::dep"})
+        tracker.register(spec, dep)
+        instance = tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        dep_inst = tracker.next_for()
+        tracker.set_status(dep_inst.name, TaskStatus_e.SUCCESS)
+        match tracker.next_for():
+            case Task_p() as result:
+                assert(spec.name < result.name)
+            case x:
+                assert(False), x
+        assert(instance not in tracker._blocking)
+        assert(tracker.get_status(target=instance)[0] is TaskStatus_e.RUNNING)
+
+    def test_accepts_task_objects(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha"})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        task = tracker.next_for()
+        assert(tracker.set_status(task, TaskStatus_e.SUCCESS))
+        assert(task.status is TaskStatus_e.SUCCESS)
+
+    def test_failure_halts_dependents(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha", "depends_on":["basic::dep"]})
+        dep  = tracker._factory.build({"name":"basic::dep"})
+        tracker.register(spec, dep)
+        instance = tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        dep_inst = tracker.next_for()
+        tracker.set_status(dep_inst.name, TaskStatus_e.FAILED)
+        while (task:=tracker.next_for()) is not None:
+            assert(task.name.is_cleanup())
+            tracker.set_status(task.name, TaskStatus_e.SUCCESS)
+
+        assert(tracker.get_status(target=instance)[0] in {TaskStatus_e.HALTED, TaskStatus_e.DEAD})
+        assert(instance not in tracker.active)
+
+    def test_chain_never_spins(self, tracker, mocker):
+        """ A long chain of tasks, each only ready after its predecessor """
+        count  = 50
+        specs  = [tracker._factory.build({"name":"basic::task.0"})]
+        specs += [tracker._factory.build({"name":f"basic::task.{i}", "depends_on":[f"basic::task.{i-1}"]}) for i in range(1, count)]
+        tracker.register(*specs)
+        tracker.queue(specs[-1].name, from_user=True)
+        tracker.build()
+        deque_spy = mocker.spy(tracker._queue, "deque_entry")
+        order     = []
+        while (task:=tracker.next_for()) is not None:
+            if not task.name.is_cleanup():
+                order.append(task.name.de_uniq())
+            tracker.set_status(task.name, TaskStatus_e.SUCCESS)
+
+        assert(order == [x.name for x in specs])
+        assert(not bool(tracker))
+        # each task and cleanup is dequeued a small, fixed number of times
+        assert(deque_spy.call_count < 4 * (2 * count))
+
+    def test_cleanup_runs(self, tracker):
+        spec = tracker._factory.build({"name":"basic::task", "cleanup":[], "blah":"aweg"})
+        tracker.register(spec)
+        tracker.queue(spec, from_user=True)
+        tracker.build()
+        task = tracker.next_for()
+        tracker.set_status(task.name, TaskStatus_e.SUCCESS)
+        match tracker.next_for():
+            case Task_p() as task2:
+                assert(task2.name.is_cleanup())
+                assert(task2.internal_state["blah"] == "aweg")
+            case x:
+                assert(False), x
+
+    def test_registry_changes_are_pushed(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha"})
+        tracker.register(spec)
+        tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        task = tracker.next_for()
+        tracker._registry.set_status(task.name, TaskStatus_e.SUCCESS)
+        assert(task.name not in tracker._running)
+        assert(task.name in tracker._finished)
+
+    def test_wait_without_running_returns(self, tracker):
+        tracker.build()
+        assert(tracker.next_for(wait=True) is None)
+
+    def test_wait_times_out(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha", "depends_on":["basic::dep"]})
+        dep  = tracker._factory.build({"name":"basic::dep"})
+        tracker.register(spec, dep)
+        tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        assert(tracker.next_for() is not None)
+        assert(tracker.next_for(wait=True, timeout=0.05) is None)
+
+    def test_wait_woken_by_other_thread(self, tracker):
+        spec = tracker._factory.build({"name":"basic::alpha", "depends_on":["basic::dep"]})
+        dep  = tracker._factory.build({"name":"basic::dep"})
+        tracker.register(spec, dep)
+        tracker.queue(spec.name, from_user=True)
+        tracker.build()
+        dep_inst = tracker.next_for()
+        worker   = threading.Timer(0.05, tracker.set_status, args=(dep_inst.name, TaskStatus_e.SUCCESS))
+        worker.start()
+        match tracker.next_for(wait=True, timeout=5):
+            case Task_p() as result:
+                assert(spec.name < result.name)
+            case x:
+                assert(False), x
+        worker.join()
@@ -234,6 +234,50 @@ class TestRegistration:
         assert("basic::task" in registry.specs["basic::other"].blocked_by)
 
 
+class TestRegistration_Bulk:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_register_many(self, registry):
+        specs = [registry._tracker._factory.build({"name":"basic::task"}),
+                 registry._tracker._factory.build({"name":"basic::+.job"})]
+        added = registry.register_many(specs)
+        assert(len(registry.specs) == 5)
+        assert(set(added) == set(registry.specs.keys()))
+        assert(added[0] == specs[0].name)
+
+    def test_register_many_skips_registered_and_disabled(self, registry):
+        spec      = registry._tracker._factory.build({"name":"basic::task"})
+        disabled  = registry._tracker._factory.build({"name":"basic::disabled", "disabled":True})
+        registry.register_spec(spec)
+        added = registry.register_many([spec, disabled])
+        assert(not bool(added))
+        assert("basic::disabled" not in registry.specs)
+
+    def test_register_many_resolves_delayed_blockers(self, registry):
+        spec = registry._tracker._factory.build({"name":"basic::task",
+                                                 "required_for": ["basic::other"],
+                                                 })
+        spec2 = registry._tracker._factory.build({"name":"basic::other"})
+        registry.register_many([spec, spec2])
+        assert(len(registry.specs) == 4)
+        assert("basic::other" not in registry._delayed_blockers)
+        assert("basic::task" in registry.specs["basic::other"].blocked_by)
+
+    def test_register_many_matches_sequential(self):
+        bulk, seq = NaiveTracker()._registry, NaiveTracker()._registry
+        data = [{"name":"basic::a", "required_for": ["basic::b", "basic::c"]},
+                {"name":"basic::b", "required_for": ["basic::c"]},
+                {"name":"basic::+.job"},
+                {"name":"basic::c"}]
+        bulk.register_many([bulk._tracker._factory.build(x) for x in data])
+        for x in data:
+            seq.register_spec(seq._tracker._factory.build(x))
+        assert(list(bulk.specs.keys()) == list(seq.specs.keys()))
+        for name, meta in seq.specs.items():
+            assert(bulk.specs[name].blocked_by == meta.blocked_by)
+
 class TestInstantiation_Specs:
 
     def test_sanity(self):
@@ -569,6 +613,53 @@ class TestInstantiation_Relations:
             case x:
                  assert(False), x
 
+    def test_relation_constraints_use_index(self, registry):
+        relation      = {"task":"basic::dep", "constraints":["blah"]}
+        basic_dep     = registry._tracker._factory.build({"name":"basic::dep"})
+        control_spec  = registry._tracker._factory.build({"name":"basic::task", "blah": "val_50", "depends_on": [relation]})
+        registry.register_spec(control_spec)
+        registry.register_spec(basic_dep)
+        control_inst  = registry.instantiate_spec(control_spec.name)
+        instances     = [registry.instantiate_spec(basic_dep.name, extra={"blah":f"val_{i}"}) for i in range(100)]
+        keys, vals    = control_spec.depends_on[0].constraint_key(registry.specs[control_inst].spec)
+        assert(keys == ("blah",))
+        related       = registry.specs[basic_dep.name].related
+        assert(registry.constraint_index.candidates(basic_dep.name, keys, vals, related) == [instances[50]])
+        match registry.instantiate_relation(control_spec.depends_on[0], control=control_inst):
+            case TaskName() as dep_name:
+                assert(dep_name == instances[50])
+            case x:
+                 assert(False), x
+
+        # New instances are indexed as they are registered
+        later = registry.instantiate_spec(basic_dep.name, extra={"blah":"val_50"})
+        assert(later in registry.constraint_index.candidates(basic_dep.name, keys, vals, []))
+
+    def test_relation_constraints_use_index_with_tasks(self, registry):
+        """ Instances with tasks stay keyed by their spec's values.
+        A task is only reused if its spec and its state both match.
+        """
+        relation      = {"task":"basic::dep", "constraints":["blah"]}
+        basic_dep     = registry._tracker._factory.build({"name":"basic::dep"})
+        control_spec  = registry._tracker._factory.build({"name":"basic::task", "blah": "val_50", "depends_on": [relation]})
+        registry.register_spec(control_spec)
+        registry.register_spec(basic_dep)
+        control_inst  = registry.instantiate_spec(control_spec.name)
+        instances     = [registry.instantiate_spec(basic_dep.name, extra={"blah":f"val_{i}"}) for i in range(100)]
+        for inst in instances:
+            registry.make_task(inst)
+
+        keys, vals    = control_spec.depends_on[0].constraint_key(registry.specs[control_inst].spec)
+        related       = registry.specs[basic_dep.name].related
+        assert(registry.constraint_index.candidates(basic_dep.name, keys, vals, related) == [instances[50]])
+        registry.specs[instances[3]].task.internal_state["blah"] = "val_50"
+        registry.specs[instances[50]].task.internal_state["blah"] = "val_0"
+        match registry.instantiate_relation(control_spec.depends_on[0], control=control_inst):
+            case TaskName() as dep_name:
+                assert(dep_name not in instances)
+            case x:
+                 assert(False), x
+
     def test_relation_with_no_matching_spec_errors(self, registry):
         control_spec = registry._tracker._factory.build({"name":"basic::task",
                                        "blah": "bloo", "aweg":"qqqq",
@@ -776,6 +867,29 @@ class TestInstantiation_Tasks:
         name = TaskName("basic::task")
         assert(registry.set_status(name, TaskStatus_e.SUCCESS) is False)
 
+    def test_set_status_notifies(self, registry):
+        seen = []
+        spec = registry._tracker._factory.build({"name":"basic::task"})
+        registry.register_spec(spec)
+        instance = registry.instantiate_spec(spec.name)
+        result = registry.make_task(instance)
+        registry.subscribe(lambda *args: seen.append(args))
+        registry.set_status(result, TaskStatus_e.SUCCESS)
+        registry.set_status(result, TaskStatus_e.SUCCESS)
+        assert(seen == [(result, TaskStatus_e.INIT, TaskStatus_e.SUCCESS)])
+
+    def test_unsubscribe(self, registry):
+        seen = []
+        spec = registry._tracker._factory.build({"name":"basic::task"})
+        registry.register_spec(spec)
+        instance = registry.instantiate_spec(spec.name)
+        result   = registry.make_task(instance)
+        listener = lambda *args: seen.append(args)  # noqa: E731
+        registry.subscribe(listener)
+        registry.unsubscribe(listener)
+        registry.set_status(result, TaskStatus_e.SUCCESS)
+        assert(not bool(seen))
+
     def test_spec_retrieval(self, registry):
         spec = registry._tracker._factory.build({"name":"basic::task"})
         name = spec.name
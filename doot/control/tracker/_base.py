@@ -15,6 +15,7 @@ from __future__ import annotations
 import datetime
 import enum
 import functools as ftz
+import heapq
 import itertools as itz
 import logging as logmod
 import pathlib as pl
@@ -42,7 +43,7 @@ from doot.workflow import (ActionSpec, DootTask, InjectSpec, RelationSpec,
 from doot.workflow._interface import (CLI_K, Artifact_i, ArtifactStatus_e,
                                       InjectSpec_i, RelationSpec_i, Task_i,
                                       TaskName_p, TaskSpec_i, TaskStatus_e,
-                                      DelayedSpec,
+                                      DelayedSpec, TaskMeta_e,
                                       MUST_INJECT_K)
 
 # ##-- end 1st party imports
@@ -104,9 +105,11 @@ class Tracker_abs:
     _registry                : API.Registry_p
     _network                 : API.Network_p
     _queue                   : API.Queue_p
+    _spec_source             : Maybe[API.SpecSource_p]
 
     _declare_priority        : int
     _min_priority            : int
+    _plans                   : dict[tuple, list[API.PlanEntry_d]]
 
     def __init__(self, **kwargs:Any) -> None:
         factory                       = kwargs.pop("factory", TaskFactory)
@@ -114,6 +117,7 @@ class Tracker_abs:
         registry                      = kwargs.pop("registry", TrackRegistry)
         network                       = kwargs.pop("network", TrackNetwork)
         queue                         = kwargs.pop("queue", TrackQueue)
+        self._spec_source             = kwargs.pop("spec_source", None)
         self._declare_priority        = API.DECLARE_PRIORITY
         self._min_priority            = API.MIN_PRIORITY
         self._root_node               = TaskName(API.ROOT)
@@ -122,6 +126,7 @@ class Tracker_abs:
         self._registry                = registry(tracker=self)
         self._network                 = network(tracker=self)
         self._queue                   = queue(tracker=self)
+        self._plans                   = {}
 
     ##--| properties
 
@@ -161,29 +166,56 @@ class Tracker_abs:
 
     ##--| public
 
+    def set_spec_source(self, source:Maybe[API.SpecSource_p]) -> None:
+        """ Set where to get unregistered specs from, when they are queued or needed by registered specs """
+        self._spec_source = source
+
     def register(self, *specs:TaskSpec_i|Artifact_i|DelayedSpec)-> None:
+        """ Register specs and artifacts, in order.
+
+        Runs of plain specs are registered in bulk.
+        Delayed and partial specs need their base registered first,
+        so the pending run is registered before they are upgraded.
+
+        With a spec source, the specs the registered specs need are then registered,
+        until nothing more is needed.
+        """
+        pending : list = list(specs)
+        while bool(pending):
+            self._register_batch(pending)
+            pending = self._materialise_wanted()
+
+    def _register_batch(self, specs:list[TaskSpec_i|Artifact_i|DelayedSpec]) -> None:
         actual  : TaskSpec_i
-        queue   : list = [*specs]
-        while bool(queue):
-            x = queue.pop()
+        batch   : list[TaskSpec_i] = []
+        for x in specs:
             match x:
                 case DelayedSpec():
+                    self._registry.register_many(batch) # type: ignore[attr-defined]
+                    batch  = []
                     actual = self._upgrade_delayed_to_actual(x)
                     self._registry.register_spec(actual)
                 case TaskSpec_i() if TaskName.Marks.partial in x.name:
+                    self._registry.register_many(batch) # type: ignore[attr-defined]
+                    batch  = []
+                    self._materialise(x.sources[-1])
                     actual = self._reify_partial_spec(x)
                     self._registry.register_spec(actual)
                 case TaskSpec_i():
-                    self._registry.register_spec(x)
+                    batch.append(x)
                 case Artifact_i():
                     self._registry._register_artifact(x) # type: ignore[attr-defined]
                 case x:
                     raise TypeError(type(x))
+        else:
+            self._registry.register_many(batch) # type: ignore[attr-defined]
 
     def queue(self, name:str|TaskName_p|TaskSpec_i|Artifact_i|DelayedSpec, *, from_user:int|bool=False, status:Maybe[TaskStatus_e]=None, **kwargs:Any) -> Maybe[Concrete[TaskName_p|Artifact_i]]:  # noqa: ARG002
         queued  : TaskName_p|Artifact_i
         ##--|
         match name:
+            case str() | TaskName_p() if self._spec_source is not None:
+                self._materialise(name)
             case str() | TaskName_p() | Artifact_i():
                 pass
             case DelayedSpec() as dspec:
@@ -214,12 +246,48 @@ class Tracker_abs:
     def validate(self) -> None:
         self._network.validate_network()
 
-    def plan(self, *args:Any) -> list:
-        raise NotImplementedError()
+    def plan(self, *, policy:Maybe[API.ExecutionPolicy_e]=None) -> list[API.PlanEntry_d]:
+        """ Generate a static execution order of the built network.
+        Dependencies always come before their dependents.
+        The policy decides the order of otherwise independent nodes:
+
+        PRIORITY : higher priority specs first
+        DEPTH    : depth first, completing each target's dependencies before the next target
+        BREADTH  : breadth first, every node of a depth before the next depth
+
+        Plans are cached until the network changes.
+        Jobs can add tasks as they run, so a plan containing jobs is only a prediction.
+        """
+        order   : Iterable
+        nodes   : list[TaskName_p|Artifact_i]
+        policy  = policy or API.ExecutionPolicy_e.default
+        key     = (policy, self._network.version) # type: ignore[attr-defined]
+        if key in self._plans:
+            return list(self._plans[key])
+
+        nodes   = [x for x in self._network.topological_order() if x != self._root_node] # type: ignore[attr-defined]
+        depths  = self._plan_depths(nodes)
+        match policy:
+            case API.ExecutionPolicy_e.PRIORITY:
+                order = self._plan_by_priority(nodes)
+            case API.ExecutionPolicy_e.DEPTH:
+                order = self._plan_depth_first(nodes)
+            case API.ExecutionPolicy_e.BREADTH:
+                order = sorted(nodes, key=lambda x: (depths[x], self._plan_sort_key(x)))
+            case x:
+                raise TypeError(type(x))
+
+        result = [API.PlanEntry_d(depth=depths[x], node=x, desc=self._plan_desc(x)) for x in order]
+        self._plans[key] = result
+        return list(result)
 
     def clear(self) -> None:
         self._queue.clear_queue()
 
+    def finish(self) -> None:
+        """ Called by the runner when it exits, whether the run succeeded or not """
+        pass
+
     def report(self, target:TaskName_p) -> dict:
         result : dict
         ##--|
@@ -249,6 +317,118 @@ class Tracker_abs:
     def _connect(self, left:Concrete[TaskName_p]|Artifact_i, right:Maybe[Literal[False]|Concrete[TaskName_p]|Artifact_i]=None, **kwargs:Any) -> None:
         self._network.connect(left, right, **kwargs)
 
+    def _plan_depths(self, nodes:list[TaskName_p|Artifact_i]) -> dict[TaskName_p|Artifact_i, int]:
+        """ The length of the longest chain of dependencies of each node.
+        Nodes are given in topological order, so their dependencies already have a depth.
+        """
+        depths  : dict[TaskName_p|Artifact_i, int]  = {}
+        pred    = self._network.pred
+        for node in nodes:
+            depths[node] = 1 + max((depths[x] for x in pred[node]), default=-1)
+        else:
+            return depths
+
+    def _plan_by_priority(self, nodes:list[TaskName_p|Artifact_i]) -> list[TaskName_p|Artifact_i]:
+        """ Kahn's algorithm, taking the highest priority node whose dependencies are done """
+        waiting  : dict[TaskName_p|Artifact_i, int]
+        ready    : list[tuple[tuple[int, str], int, TaskName_p|Artifact_i]]
+        order    : list[TaskName_p|Artifact_i]  = []
+        count    = itz.count()
+        pred     = self._network.pred
+        succ     = self._network.succ
+        waiting  = {x:len(pred[x]) for x in nodes}
+        ready    = [(self._plan_sort_key(x), next(count), x) for x in nodes if waiting[x] == 0]
+        heapq.heapify(ready)
+        while bool(ready):
+            node = heapq.heappop(ready)[-1]
+            order.append(node)
+            for other in succ[node]:
+                if other not in waiting:
+                    continue
+                waiting[other] -= 1
+                if waiting[other] == 0:
+                    heapq.heappush(ready, (self._plan_sort_key(other), next(count), other))
+        else:
+            return order
+
+    def _plan_depth_first(self, nodes:list[TaskName_p|Artifact_i]) -> list[TaskName_p|Artifact_i]:
+        """ Post order DFS of each node's dependencies, starting from the highest priority node """
+        seen   : set[TaskName_p|Artifact_i]        = set()
+        order  : list[TaskName_p|Artifact_i]       = []
+        stack  : list[tuple[TaskName_p|Artifact_i, Iterator]]
+        pred   = self._network.pred
+        for source in sorted(nodes, key=self._plan_sort_key):
+            if source in seen:
+                continue
+            seen.add(source)
+            stack = [(source, iter(sorted(pred[source], key=self._plan_sort_key)))]
+            while bool(stack):
+                node, deps = stack[-1]
+                match next((x for x in deps if x not in seen), None):
+                    case None:
+                        stack.pop()
+                        order.append(node)
+                    case dep:
+                        seen.add(dep)
+                        stack.append((dep, iter(sorted(pred[dep], key=self._plan_sort_key))))
+        else:
+            return order
+
+    def _plan_sort_key(self, node:TaskName_p|Artifact_i) -> tuple[int, str]:
+        """ Higher priority first, then by name, for a stable order """
+        match self.specs.get(node, None): # type: ignore[call-overload]
+            case API.SpecMeta_d(spec=spec):
+                return -spec.priority, str(node)
+            case _:
+                return -self._declare_priority, str(node)
+
+    def _plan_desc(self, node:TaskName_p|Artifact_i) -> str:
+        match node:
+            case Artifact_i():
+                return "Artifact"
+            case TaskName_p() if node.is_cleanup():
+                return "Cleanup"
+            case TaskName_p() if TaskMeta_e.JOB in self.specs[node].spec.meta:
+                return "Job"
+            case _:
+                return "Task"
+
+    def _materialise(self, name:Maybe[str|TaskName_p|pl.Path]) -> None:
+        """ Register a spec from the spec source, if it isn't registered """
+        match name:
+            case _ if self._spec_source is None:
+                return
+            case str() if name not in self._registry.specs: # type: ignore[attr-defined]
+                pass
+            case _:
+                return
+
+        match self._spec_source.materialise(name):
+            case None:
+                pass
+            case spec if spec.name not in self._registry.specs: # type: ignore[attr-defined]
+                self.register(spec)
+            case _:
+                pass
+
+    def _materialise_wanted(self) -> list[TaskSpec_i]:
+        """ Get the specs the registry has asked for from the spec source """
+        result  : dict[TaskName_p, TaskSpec_i]
+        if self._spec_source is None:
+            return []
+
+        result = {}
+        for name in self._registry.take_wanted(): # type: ignore[attr-defined]
+            match self._spec_source.materialise(name):
+                case None:
+                    pass
+                case spec if spec.name in self._registry.specs or spec.name in result: # type: ignore[attr-defined]
+                    pass
+                case spec:
+                    result[spec.name] = spec
+        else:
+            return list(result.values())
+
     def _upgrade_delayed_to_actual(self, spec:DelayedSpec) -> TaskSpec_i:
         """
         can't be in taskfactory, as it requires the registered specs
@@ -324,4 +504,4 @@ class Tracker_abs:
     def _generate_implicit_tasks(self, spec:TaskSpec_i) -> list[TaskSpec_i]:
         """ Generate implicit subtasks for a concrete spec """
         assert(spec.name.uuid())
-        return [self._factory.build(x) for x in  self._subfactory.generate_specs(spec)]
+        return [self._factory.build_trusted(x) for x in  self._subfactory.generate_specs(spec)]
@@ -61,6 +61,7 @@ if TYPE_CHECKING:
 
     type Abstract[T] = T
     type Concrete[T] = T
+    type StatusListener = Callable[[Concrete[TaskName_p], TaskStatus_e, TaskStatus_e], None]
 ##--|
 
 # isort: on
@@ -146,6 +147,29 @@ class SpecMeta_d:
         self.injection_source   = None
         self.injection_targets  = set()
 
+class PlanEntry_d:
+    """
+    A step of a precomputed execution plan.
+    depth is the node's distance from the furthest node it depends on.
+    """
+    __slots__ = ("depth", "desc", "node")
+
+    depth  : int
+    node   : TaskName_p|Artifact_i
+    desc   : str
+
+    def __init__(self, *, depth:int, node:TaskName_p|Artifact_i, desc:str) -> None:
+        self.depth  = depth
+        self.node   = node
+        self.desc   = desc
+
+    def __iter__(self) -> Iterator:
+        return iter((self.depth, self.node, self.desc))
+
+    @override
+    def __repr__(self) -> str:
+        return f"<PlanEntry: {self.depth} : {self.node} ({self.desc})>"
+
 class ArtifactMeta_d:
     __slots__ = ("artifact", "blocked_by", "builders", "consumers")
 
@@ -183,6 +207,8 @@ class Registry_p(Protocol):
 
     def register_spec(self, *specs:TaskSpec_i) -> None: ...
 
+    def register_many(self, specs:Iterable[TaskSpec_i]) -> list[TaskName_p]: ...
+
     def instantiate_spec(self, name:Abstract[TaskName_p], *, force:Maybe[bool|int]=None, extra:Maybe[dict|ChainGuard|bool]=None) -> Maybe[Concrete[TaskName_p]]: ...
 
     def instantiate_relation(self, rel:RelationSpec_i, *, control:Concrete[TaskName_p]) -> Concrete[TaskName_p]: ...
@@ -191,6 +217,10 @@ class Registry_p(Protocol):
 
     def verify(self, *, strict:bool=True) -> bool: ...
 
+    def subscribe(self, listener:StatusListener) -> None: ...
+
+    def unsubscribe(self, listener:StatusListener) -> None: ...
+
 class Network_p(Protocol):
     _graph        : Any
     _root_node    : TaskName_p
@@ -213,6 +243,18 @@ class Queue_p(Protocol):
 
     def clear_queue(self) -> None: ...
 
+@runtime_checkable
+class SpecSource_p(Protocol):
+    """ Somewhere a tracker can get specs from on demand, instead of registering everything up front """
+
+    def __contains__(self, name:TaskName_p) -> bool: ...
+
+    def materialise(self, name:str|TaskName_p) -> Maybe[TaskSpec_i]: ...
+
+    def blockers_of(self, name:TaskName_p) -> list[TaskName_p]: ...
+
+    def producers_of(self, artifact:Artifact_i) -> list[TaskName_p]: ...
+
 ##--| Tracker
 
 @runtime_checkable
@@ -249,15 +291,19 @@ class WorkflowTracker_p(Protocol):
 
     def register(self, *specs:TaskSpec_i|Artifact_i|DelayedSpec)-> None: ...
 
+    def set_spec_source(self, source:Maybe[SpecSource_p]) -> None: ...
+
     def queue(self, name:str|Ident|Concrete[TaskSpec_i]|DelayedSpec, *, from_user:int|bool=False, status:Maybe[TaskStatus_e]=None) -> Maybe[Concrete[Ident]]: ...
 
     def build(self, *, sources:Maybe[Literal[True]|list[Concrete[TaskName_p]|Artifact_i]]=None) -> None: ...
 
-    def plan(self, *, policy:Maybe[ExecutionPolicy_e]=None) -> list[TaskName_p|Artifact_i]: ...
+    def plan(self, *, policy:Maybe[ExecutionPolicy_e]=None) -> list[PlanEntry_d]: ...
 
     def next_for(self, target:Maybe[str|Concrete[Ident]]=None) -> Maybe[Task_p|Artifact_i]: ...
 
     def clear(self) -> None: ...
+
+    def finish(self) -> None: ...
     ##--| inspection. TODO to remove
 
     ##--| internal
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+An index of the registry's artifacts, by path,
+for matching concrete artifacts to the abstract artifacts they are in, and vice versa.
+
+Abstract artifacts are stored in a trie by the literal segments of their path,
+up to the first wildcard.
+Concrete artifacts are stored in a trie by the segments of their expanded path.
+
+So a match only walks the path of the artifact being matched,
+and only candidates sharing its leading segments are checked with Location's containment test.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv.structs.dkey import DKey
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow import TaskArtifact
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.workflow._interface import Artifact_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+class _PathTrie:
+    """ A trie of path segments, holding artifacts at each node """
+    __slots__ = ("children", "items")
+
+    children  : dict[str, _PathTrie]
+    items     : list[Artifact_i]
+
+    def __init__(self) -> None:
+        self.children  = {}
+        self.items     = []
+
+    def insert(self, parts:Iterable[str], item:Artifact_i) -> None:
+        node = self
+        for part in parts:
+            node = node.children.setdefault(part, _PathTrie())
+        else:
+            node.items.append(item)
+
+    def along(self, parts:Iterable[str]) -> Iterator[Artifact_i]:
+        """ The items on the nodes along a path,
+        and every item below the node the path ends at.
+        """
+        node = self
+        for part in parts:
+            yield from node.items
+            match node.children.get(part, None):
+                case None:
+                    return
+                case _PathTrie() as node:
+                    pass
+        else:
+            yield from node.subtree()
+
+    def subtree(self) -> Iterator[Artifact_i]:
+        queue = [self]
+        while bool(queue):
+            node = queue.pop()
+            yield from node.items
+            queue += node.children.values()
+
+class ArtifactIndex:
+    """ Matches concrete and abstract artifacts, in roughly O(path depth).
+
+    Concrete artifacts are expanded to their path lazily,
+    so locations can be registered after the artifacts that use them.
+    Artifacts that can't be expanded yet match no abstract by path, and stay pending.
+
+    _abstract : abstract artifacts, by the literal prefix of their path
+    _concrete : concrete artifacts, by their expanded path
+    _paths    : concrete artifact -> its expanded relative path
+    _pending  : concrete artifacts not yet expanded and inserted
+    """
+
+    _abstract  : _PathTrie
+    _concrete  : _PathTrie
+    _paths     : dict[Artifact_i, pl.Path]
+    _pending   : list[Artifact_i]
+    _known     : set[Artifact_i]
+
+    def __init__(self) -> None:
+        self._abstract  = _PathTrie()
+        self._concrete  = _PathTrie()
+        self._paths     = {}
+        self._pending   = []
+        self._known     = set()
+
+    def __contains__(self, art:Artifact_i) -> bool:
+        return art in self._known
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    def add(self, art:Artifact_i) -> None:
+        if art in self._known:
+            return
+
+        self._known.add(art)
+        match art.is_concrete():
+            case True:
+                self._pending.append(art)
+            case False:
+                self._abstract.insert(self._literal_prefix(art), art)
+
+    def path_of(self, art:Artifact_i) -> Maybe[pl.Path]:
+        """ The expanded relative path of a concrete artifact,
+        or None if its keys can't be expanded (yet)
+        """
+        match self._paths.get(art, None):
+            case pl.Path() as x:
+                return x
+            case None:
+                pass
+
+        match DKey[pl.Path](art[1,:])(relative=True): # type: ignore[operator]
+            case pl.Path() as path:
+                self._paths[art] = path
+                return path
+            case _:
+                return None
+
+    def abstracts_of(self, art:Artifact_i) -> list[Artifact_i]:
+        """ The abstract artifacts a concrete artifact is in """
+        match self.path_of(art):
+            case pl.Path() as path:
+                candidates = dict.fromkeys(itz.chain(self._abstract.along(path.parts),
+                                                     self._abstract.along(str(x) for x in art.body_parent)))
+                return [x for x in candidates if path in x or art in x]
+            case None:
+                candidates = dict.fromkeys(self._abstract.along(str(x) for x in art.body_parent))
+                return [x for x in candidates if art in x]
+
+    def concretes_in(self, art:Artifact_i) -> list[Artifact_i]:
+        """ The concrete artifacts which are in an abstract artifact """
+        self._flush()
+        candidates = dict.fromkeys(self._concrete.along(self._literal_prefix(art)))
+        return [x for x in candidates if x in self._paths and self._paths[x] in art]
+
+    def _flush(self) -> None:
+        """ Insert the pending concrete artifacts which can be expanded """
+        unexpanded : list[Artifact_i] = []
+        for art in self._pending:
+            match self.path_of(art):
+                case pl.Path() as path:
+                    self._concrete.insert(path.parts, art)
+                case None:
+                    unexpanded.append(art)
+        else:
+            self._pending = unexpanded
+
+    def _literal_prefix(self, art:Artifact_i) -> list[str]:
+        """ The segments of an abstract artifact's path, up to the first wildcard """
+        return list(itz.takewhile(lambda x: x not in TaskArtifact.Wild, (str(x) for x in art.body_parent)))
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+A compact directed graph, for large task networks.
+
+Nodes are given dense integer ids, in the order they are added.
+Edges are stored in flat growable arrays,
+with each node's outgoing and incoming edges chained through them, in the order they were added.
+Finding an edge walks its source's outgoing chain,
+unless the source has more than SCAN_MAX outgoing edges.
+Then, its edges are also kept in an array sorted by destination, which is bisected.
+Boolean node attributes (eg: API.EXPANDED) are stored in bit arrays.
+
+So a node costs a few array slots instead of several dicts,
+and walking a node's neighbours is walking integer arrays.
+
+The nx.DiGraph surface the network relies on is provided as Mapping views:
+graph.nodes[x][attr], graph.pred[x], graph.succ[x], graph.adj[x], graph.edges[x,y].
+The tracker's algorithms only use those views,
+so the graph is only materialised as an nx.DiGraph to draw it.
+
+Select it with::
+
+    [settings.commands.run]
+    network = "compact"
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from array import array
+from bisect import bisect_left, insort
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import networkx as nx
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API  # noqa: N812
+from ._interface import EdgeType_e
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+NO_EDGE      : Final[int]              = -1
+ID_CODE      : Final[str]              = "i"
+SCAN_MAX     : Final[int]              = 8
+TYPE_KEY     : Final[str]              = "type"
+FLAGS        : Final[tuple[str, ...]]  = (API.EXPANDED, API.REACTIVE_ADD)
+EDGE_TYPES   : Final[list[EdgeType_e]] = list(EdgeType_e)
+##--|
+
+class _Bits:
+    """ A growable array of booleans, packed 8 to a byte """
+    __slots__ = ("_data",)
+
+    _data : bytearray
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+
+    def __getitem__(self, idx:int) -> bool:
+        byte = idx >> 3
+        if len(self._data) <= byte:
+            return False
+        return bool(self._data[byte] & (1 << (idx & 7)))
+
+    def __setitem__(self, idx:int, val:bool) -> None:
+        byte = idx >> 3
+        if len(self._data) <= byte:
+            self._data.extend(bytes(byte + 1 - len(self._data)))
+        match bool(val):
+            case True:
+                self._data[byte] |= (1 << (idx & 7))
+            case False:
+                self._data[byte] &= ~(1 << (idx & 7)) & 0xFF
+
+##--| Views
+
+class _NodeAttrs(collections.abc.MutableMapping):
+    """ The attributes of a single node.
+    Flags are always present, and False until set.
+    """
+    __slots__ = ("_graph", "_id")
+
+    def __init__(self, graph:CompactDiGraph, nid:int) -> None:
+        self._graph  = graph
+        self._id     = nid
+
+    def __getitem__(self, key:str) -> Any:
+        if key in self._graph._flags:
+            return self._graph._flags[key][self._id]
+        return self._graph._node_attrs[self._id][key]
+
+    def __setitem__(self, key:str, val:Any) -> None:
+        if key in self._graph._flags:
+            self._graph._flags[key][self._id] = val
+        else:
+            self._graph._node_attrs.setdefault(self._id, {})[key] = val
+
+    def __delitem__(self, key:str) -> None:
+        if key in self._graph._flags:
+            self._graph._flags[key][self._id] = False
+        else:
+            del self._graph._node_attrs[self._id][key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._graph._flags
+        yield from self._graph._node_attrs.get(self._id, {})
+
+    def __len__(self) -> int:
+        return len(self._graph._flags) + len(self._graph._node_attrs.get(self._id, {}))
+
+class _NodesView(collections.abc.Mapping):
+    """ node -> its attributes """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph:CompactDiGraph) -> None:
+        self._graph = graph
+
+    def __getitem__(self, node:Hashable) -> _NodeAttrs:
+        return _NodeAttrs(self._graph, self._graph._ids[node])
+
+    def __contains__(self, node:object) -> bool:
+        return node in self._graph._ids
+
+    def __iter__(self) -> Iterator:
+        return iter(self._graph._names)
+
+    def __len__(self) -> int:
+        return len(self._graph._names)
+
+class _Neighbours(collections.abc.Mapping):
+    """ The predecessors or successors of a single node -> the attributes of the connecting edge.
+    Iterates in the order the edges were added.
+    """
+    __slots__ = ("_graph", "_id", "_out")
+
+    def __init__(self, graph:CompactDiGraph, nid:int, *, out:bool) -> None:
+        self._graph  = graph
+        self._id     = nid
+        self._out    = out
+
+    def _edges(self) -> Iterator[tuple[int, int]]:
+        """ Yields (edge, neighbour) ids """
+        graph = self._graph
+        if self._out:
+            edge, chain, ends = graph._out_head[self._id], graph._out_next, graph._dst
+        else:
+            edge, chain, ends = graph._in_head[self._id], graph._in_next, graph._src
+
+        while edge != NO_EDGE:
+            yield edge, ends[edge]
+            edge = chain[edge]
+
+    def _edge_to(self, node:object) -> int:
+        match self._graph._ids.get(node, None):
+            case None:
+                return NO_EDGE
+            case int() as other if self._out:
+                return self._graph._find_edge(self._id, other)
+            case int() as other:
+                return self._graph._find_edge(other, self._id)
+
+    def __getitem__(self, node:Hashable) -> dict:
+        match self._edge_to(node):
+            case int() as edge if edge != NO_EDGE:
+                return self._graph._edge_data(edge)
+            case _:
+                raise KeyError(node)
+
+    def __contains__(self, node:object) -> bool:
+        return self._edge_to(node) != NO_EDGE
+
+    def __iter__(self) -> Iterator:
+        names = self._graph._names
+        for _, other in self._edges():
+            yield names[other]
+
+    def __len__(self) -> int:
+        degree = self._graph._out_degree if self._out else self._graph._in_degree
+        return degree[self._id]
+
+    def __bool__(self) -> bool:
+        head = self._graph._out_head if self._out else self._graph._in_head
+        return head[self._id] != NO_EDGE
+
+class _AdjacencyView(collections.abc.Mapping):
+    """ node -> its predecessors or successors """
+    __slots__ = ("_graph", "_out")
+
+    def __init__(self, graph:CompactDiGraph, *, out:bool) -> None:
+        self._graph  = graph
+        self._out    = out
+
+    def __getitem__(self, node:Hashable) -> _Neighbours:
+        return _Neighbours(self._graph, self._graph._ids[node], out=self._out)
+
+    def __contains__(self, node:object) -> bool:
+        return node in self._graph._ids
+
+    def __iter__(self) -> Iterator:
+        return iter(self._graph._names)
+
+    def __len__(self) -> int:
+        return len(self._graph._names)
+
+class _EdgesView(collections.abc.Mapping):
+    """ (left, right) -> the attributes of the edge """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph:CompactDiGraph) -> None:
+        self._graph = graph
+
+    def __getitem__(self, pair:tuple[Hashable, Hashable]) -> dict:
+        left, right = pair
+        return self._graph.succ[left][right]
+
+    def __contains__(self, pair:object) -> bool:
+        match pair:
+            case (left, right):
+                return self._graph.has_edge(left, right)
+            case _:
+                return False
+
+    def __iter__(self) -> Iterator[tuple[Hashable, Hashable]]:
+        """ By source node, as nx.DiGraph.edges does """
+        graph = self._graph
+        for src, node in enumerate(graph._names):
+            edge = graph._out_head[src]
+            while edge != NO_EDGE:
+                yield node, graph._names[graph._dst[edge]]
+                edge = graph._out_next[edge]
+
+    def __len__(self) -> int:
+        return len(self._graph._src)
+
+##--|
+
+class CompactDiGraph:
+    """ A directed graph of integer ids, with an nx.DiGraph-like interface.
+    Nodes and edges can be added, not removed.
+
+    _ids        : node -> its id
+    _names      : id -> node
+    _out_head   : id -> its first outgoing edge
+    _out_tail   : id -> its last outgoing edge
+    _in_head    : id -> its first incoming edge
+    _in_tail    : id -> its last incoming edge
+    _out_degree : id -> its number of outgoing edges
+    _in_degree  : id -> its number of incoming edges
+    _src, _dst  : edge -> its end node ids
+    _out_next   : edge -> the next outgoing edge of its source
+    _in_next    : edge -> the next incoming edge of its destination
+    _sorted     : sparse, id -> its outgoing edges, sorted by destination, if it has more than SCAN_MAX
+    _types      : edge -> 1 + its EdgeType_e index, or 0
+    _flags      : flag name -> bits, by node id
+    _node_attrs : sparse, id -> any other node attributes
+    _edge_attrs : sparse, edge -> any other edge attributes
+    """
+
+    _ids         : dict[Hashable, int]
+    _names       : list[Hashable]
+    _out_head    : array[int]
+    _out_tail    : array[int]
+    _in_head     : array[int]
+    _in_tail     : array[int]
+    _out_degree  : array[int]
+    _in_degree   : array[int]
+    _src         : array[int]
+    _dst         : array[int]
+    _out_next    : array[int]
+    _in_next     : array[int]
+    _sorted      : dict[int, array[int]]
+    _types       : array[int]
+    _flags       : dict[str, _Bits]
+    _node_attrs  : dict[int, dict]
+    _edge_attrs  : dict[int, dict]
+
+    def __init__(self, *, flags:Iterable[str]=FLAGS) -> None:
+        self._ids         = {}
+        self._names       = []
+        self._out_head    = array(ID_CODE)
+        self._out_tail    = array(ID_CODE)
+        self._in_head     = array(ID_CODE)
+        self._in_tail     = array(ID_CODE)
+        self._out_degree  = array(ID_CODE)
+        self._in_degree   = array(ID_CODE)
+        self._src         = array(ID_CODE)
+        self._dst         = array(ID_CODE)
+        self._out_next    = array(ID_CODE)
+        self._in_next     = array(ID_CODE)
+        self._sorted      = {}
+        self._types       = array("B")
+        self._flags       = {x:_Bits() for x in flags}
+        self._node_attrs  = {}
+        self._edge_attrs  = {}
+
+    ##--| dunders
+
+    def __contains__(self, node:object) -> bool:
+        return node in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._names)
+
+    ##--| views
+
+    @property
+    def nodes(self) -> _NodesView:
+        return _NodesView(self)
+
+    @property
+    def edges(self) -> _EdgesView:
+        return _EdgesView(self)
+
+    @property
+    def pred(self) -> _AdjacencyView:
+        return _AdjacencyView(self, out=False)
+
+    @property
+    def succ(self) -> _AdjacencyView:
+        return _AdjacencyView(self, out=True)
+
+    @property
+    def adj(self) -> _AdjacencyView:
+        return _AdjacencyView(self, out=True)
+
+    ##--| public
+
+    def add_node(self, node:Hashable, **attrs:Any) -> int:
+        """ Add a node, if it is new, returning its id """
+        nid : int
+        match self._ids.get(node, None):
+            case int() as nid:
+                pass
+            case None:
+                nid              = len(self._names)
+                self._ids[node]  = nid
+                self._names.append(node)
+                self._out_head.append(NO_EDGE)
+                self._out_tail.append(NO_EDGE)
+                self._in_head.append(NO_EDGE)
+                self._in_tail.append(NO_EDGE)
+                self._out_degree.append(0)
+                self._in_degree.append(0)
+
+        node_attrs = _NodeAttrs(self, nid)
+        for key, val in attrs.items():
+            node_attrs[key] = val
+        else:
+            return nid
+
+    def add_edge(self, left:Hashable, right:Hashable, **attrs:Any) -> None:
+        """ Add an edge, and its nodes if they are new.
+        Adding an existing edge updates its attributes.
+        """
+        edge_type  = attrs.pop(TYPE_KEY, None)
+        src, dst   = self.add_node(left), self.add_node(right)
+        match self._find_edge(src, dst):
+            case int() as edge if edge != NO_EDGE:
+                if edge_type is not None:
+                    self._types[edge] = 1 + EDGE_TYPES.index(edge_type)
+                if attrs:
+                    self._edge_attrs.setdefault(edge, {}).update(attrs)
+                return
+            case _:
+                pass
+
+        edge = len(self._src)
+        self._src.append(src)
+        self._dst.append(dst)
+        self._out_next.append(NO_EDGE)
+        self._in_next.append(NO_EDGE)
+        self._types.append(0 if edge_type is None else 1 + EDGE_TYPES.index(edge_type))
+        self._out_degree[src] += 1
+        self._in_degree[dst]  += 1
+        if attrs:
+            self._edge_attrs[edge] = dict(attrs)
+
+        # Append to the chains, so neighbours iterate in insertion order
+        if self._out_tail[src] == NO_EDGE:
+            self._out_head[src] = edge
+        else:
+            self._out_next[self._out_tail[src]] = edge
+        self._out_tail[src] = edge
+
+        if self._in_tail[dst] == NO_EDGE:
+            self._in_head[dst] = edge
+        else:
+            self._in_next[self._in_tail[dst]] = edge
+        self._in_tail[dst] = edge
+
+        match self._sorted.get(src, None):
+            case array() as edges:
+                insort(edges, edge, key=self._dst.__getitem__)
+            case None if SCAN_MAX < self._out_degree[src]:
+                edges = (x for x, _ in _Neighbours(self, src, out=True)._edges())
+                self._sorted[src] = array(ID_CODE, sorted(edges, key=self._dst.__getitem__))
+            case None:
+                pass
+
+    def has_edge(self, left:Hashable, right:Hashable) -> bool:
+        if left not in self._ids or right not in self._ids:
+            return False
+        return self._find_edge(self._ids[left], self._ids[right]) != NO_EDGE
+
+    def subgraph(self, nodes:Iterable[Hashable]) -> nx.DiGraph:
+        """ Materialise the nodes, and the edges between them, as an nx.DiGraph.
+        Node and edge order are preserved.
+        For drawing, or tests. The network doesn't need it.
+        """
+        graph  = nx.DiGraph()
+        keep   = bytearray(len(self._names))
+        for node in nodes:
+            keep[self._ids[node]] = 1
+
+        for nid, node in enumerate(self._names):
+            if keep[nid]:
+                graph.add_node(node, **self.nodes[node])
+
+        for edge, (src, dst) in enumerate(zip(self._src, self._dst, strict=True)):
+            if keep[src] and keep[dst]:
+                graph.add_edge(self._names[src], self._names[dst], **self._edge_data(edge))
+        else:
+            return graph
+
+    def to_networkx(self) -> nx.DiGraph:
+        return self.subgraph(self._names)
+
+    ##--| internal
+
+    def _find_edge(self, src:int, dst:int) -> int:
+        """ Bisect the source's sorted edges, or walk its few outgoing edges """
+        ends = self._dst
+        match self._sorted.get(src, None):
+            case array() as edges:
+                idx = bisect_left(edges, dst, key=ends.__getitem__)
+                if idx < len(edges) and ends[edges[idx]] == dst:
+                    return edges[idx]
+                return NO_EDGE
+            case None:
+                edge, chain = self._out_head[src], self._out_next
+                while edge != NO_EDGE:
+                    if ends[edge] == dst:
+                        return edge
+                    edge = chain[edge]
+                else:
+                    return NO_EDGE
+
+    def _edge_data(self, edge:int) -> dict:
+        data = dict(self._edge_attrs.get(edge, {}))
+        if (idx:=self._types[edge]):
+            data[TYPE_KEY] = EDGE_TYPES[idx - 1]
+        return data
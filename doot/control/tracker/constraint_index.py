@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+An index of the registry's concrete task instances,
+by the values of the keys that relations constrain.
+
+A relation with constraints reuses an existing instance of its target,
+if the instance's values match the control's.
+Instead of testing every instance, the index maps the tuple of an instance's values
+for a set of constrained keys, to the instances with those values.
+
+Tables are built lazily, the first time a set of keys is constrained for an abstract spec,
+and then kept up to date as instances are registered.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.workflow._interface import TaskName_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Keys   = tuple[str, ...]
+    type Table  = dict[Maybe[tuple], list[TaskName_p]]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+UNKEYED : Final[None] = None
+##--|
+
+class ConstraintIndex:
+    """ Instances of abstract specs, by their values for constrained keys.
+
+    Candidates still need testing with RelationSpec.accepts,
+    this only rules out instances whose values can't match.
+
+    Instances missing a key, or with unhashable values, are UNKEYED,
+    and are candidates for every lookup.
+
+    Values are read from specs, which don't change once built, so instances are never re-keyed.
+    The registry only reuses an instance if its spec accepts the control,
+    as well as its task, if it has one.
+    So the spec's values are needed for a match, and a task's state can only rule it out.
+
+    _values_of : instance -> its values
+    _tables    : abstract -> keys -> values -> instances
+    """
+
+    _values_of  : Callable[[TaskName_p], Mapping]
+    _tables     : dict[TaskName_p, dict[Keys, Table]]
+
+    def __init__(self, values_of:Callable[[TaskName_p], Mapping]) -> None:
+        self._values_of  = values_of
+        self._tables     = {}
+
+    def add(self, abstract:TaskName_p, instance:TaskName_p) -> None:
+        """ Index a new instance in every table of its abstract spec """
+        for keys, table in self._tables.get(abstract, {}).items():
+            self._insert(table, keys, instance)
+
+    def candidates(self, abstract:TaskName_p, keys:Keys, values:tuple, instances:Iterable[TaskName_p]) -> list[TaskName_p]:
+        """ The instances of an abstract spec which might match the values.
+        'instances' are all of its instances, used to build the table if it doesn't exist
+        """
+        table : Table
+        try:
+            hash(values)
+        except TypeError:
+            return list(instances)
+
+        tables = self._tables.setdefault(abstract, {})
+        match tables.get(keys, None):
+            case dict() as table:
+                pass
+            case None:
+                table = tables[keys] = {UNKEYED: []}
+                for inst in instances:
+                    self._insert(table, keys, inst)
+
+        return table.get(values, []) + table[UNKEYED]
+
+    def _insert(self, table:Table, keys:Keys, instance:TaskName_p) -> None:
+        key : Maybe[tuple]
+        vals = self._values_of(instance)
+        if not all(k in vals for k in keys):
+            key = UNKEYED
+        else:
+            key = tuple(vals[k] for k in keys)
+            try:
+                hash(key)
+            except TypeError:
+                key = UNKEYED
+
+        table.setdefault(key, []).append(instance)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+A ReadyTracker which orders its ready tasks by their critical path,
+instead of the order they became ready.
+
+Each node's remaining critical path is the longest chain of expected durations
+from it to the end of the network.
+With many workers, running the longest chains first reduces the total run time.
+
+Priorities are inherited backwards through the network,
+so a task blocking a high priority target runs before other tasks.
+
+Task durations are recorded from the RUNNING -> SUCCESS status changes,
+and are saved to DURATIONS_PATH when the runner exits,
+so estimates carry over between runs, whether they succeed or not.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import heapq
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Proto
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow._interface import Artifact_i, Task_p, TaskName_p, TaskStatus_e
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from ._interface import WorkflowTracker_p
+from .durations import TaskDurations
+from .ready_tracker import ReadyTracker
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Rank = tuple[int, float]
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+DURATIONS_PATH : Final[str|Literal[False]] = doot.config.on_fail("{temp}/durations.json", str|bool).settings.commands.run.durations()
+##--|
+
+@Proto(WorkflowTracker_p)
+class CriticalPathTracker(ReadyTracker):
+    """ A Tracker which runs the ready task with the highest inherited priority,
+    then the longest remaining critical path.
+
+    _ready     : a heap of (rank, count, task)
+    _ranks     : node -> (-inherited priority, -critical path length)
+    _started   : running task -> the time it started
+    _durations : expected run times of tasks
+
+    The queue is drained before choosing a ready task, so every ready task is a candidate.
+    """
+    _drain_queue = True
+
+    _ready      : list[tuple[Rank, int, TaskName_p]] # type: ignore[assignment]
+    _ranks      : dict[TaskName_p|Artifact_i, Rank]
+    _ranks_key  : int
+    _started    : dict[TaskName_p, float]
+    _counter    : Iterator[int]
+    _durations  : TaskDurations
+
+    def __init__(self, *, durations:Maybe[TaskDurations]=None, **kwargs:Any) -> None:
+        match durations:
+            case None:
+                self._durations = TaskDurations(path=self._durations_path())
+            case TaskDurations():
+                self._durations = durations
+            case x:
+                raise TypeError(type(x))
+        self._ranks      = {}
+        self._ranks_key  = -1
+        self._started    = {}
+        self._counter    = itz.count()
+        super().__init__(**kwargs)
+        self._registry.subscribe(self._on_timing)
+
+    @property
+    def durations(self) -> TaskDurations:
+        return self._durations
+
+    def critical_path(self, node:TaskName_p|Artifact_i) -> float:
+        """ The expected time from starting a node, to finishing the network """
+        self._update_ranks()
+        return -self._ranks[node][1]
+
+    def inherited_priority(self, node:TaskName_p|Artifact_i) -> int:
+        """ The highest priority of a node, and every node that depends on it """
+        self._update_ranks()
+        return -self._ranks[node][0]
+
+    @override
+    def finish(self) -> None:
+        """ Save the recorded durations, including those of a failed or interrupted run """
+        super().finish()
+        self._durations.save()
+
+    ##--| internal
+
+    def _durations_path(self) -> Maybe[pl.Path]:
+        """ Expand the configured durations path. False disables saving """
+        match DURATIONS_PATH:
+            case str() as x if bool(x):
+                return doot.locs[x] or None
+            case _:
+                return None
+
+    @override
+    def _reset_counts(self) -> None:
+        super()._reset_counts()
+        self._ready = []
+
+    @override
+    def _push_ready(self, focus:TaskName_p) -> None:
+        self._update_ranks()
+        heapq.heappush(self._ready, (self._ranks.get(focus, (0, 0.0)), next(self._counter), focus))
+
+    @override
+    def _take_ready(self) -> TaskName_p:
+        return heapq.heappop(self._ready)[-1]
+
+    def _on_timing(self, name:TaskName_p, prior:TaskStatus_e, status:TaskStatus_e) -> None:  # noqa: ARG002
+        """ The registry status subscription, timing tasks from RUNNING to SUCCESS """
+        match status:
+            case TaskStatus_e.RUNNING:
+                self._started[name] = time.monotonic()
+            case TaskStatus_e.SUCCESS if name in self._started:
+                self._durations.record(name, time.monotonic() - self._started.pop(name))
+            case x if x in {TaskStatus_e.FAILED, TaskStatus_e.HALTED, TaskStatus_e.SKIPPED}:
+                self._started.pop(name, None)
+            case _:
+                pass
+
+    def _update_ranks(self) -> None:
+        """ Recalculate ranks in reverse topological order, if the network has changed """
+        key    : int
+        path   : dict[TaskName_p|Artifact_i, float]
+        prior  : dict[TaskName_p|Artifact_i, int]
+
+        key = self._network.version # type: ignore[attr-defined]
+        if key == self._ranks_key:
+            return
+
+        path   = {}
+        prior  = {}
+        for node in reversed(self._network.topological_order()): # type: ignore[attr-defined]
+            if node == self._root_node:
+                continue
+            succs        = [x for x in self._network.succ[node] if x != self._root_node]
+            path[node]   = self._expected(node) + max((path[x] for x in succs), default=0.0)
+            prior[node]  = max([self._priority(node), *(prior[x] for x in succs)])
+        else:
+            self._ranks      = {x:(-prior[x], -path[x]) for x in path}
+            self._ranks_key  = key
+
+    def _expected(self, node:TaskName_p|Artifact_i) -> float:
+        match node:
+            case TaskName_p():
+                return self._durations.get(node)
+            case _:
+                return 0.0
+
+    def _priority(self, node:TaskName_p|Artifact_i) -> int:
+        match self.specs.get(node, None): # type: ignore[call-overload]
+            case API.SpecMeta_d(spec=spec):
+                return spec.priority
+            case _:
+                return self._declare_priority
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+A Record of how long tasks have taken to run,
+so schedulers can estimate how long they will take next time.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import json
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from doot.workflow._interface import TaskName_p
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+DEFAULT_DURATION  : Final[float]  = doot.config.on_fail(1.0, int|float).settings.commands.run.default_duration()
+SMOOTHING         : Final[float]  = 0.5
+##--|
+
+class TaskDurations:
+    """ Smoothed run times of tasks, keyed by their abstract name.
+
+    If given a path, durations are loaded from it, and can be saved back to it,
+    so estimates carry over between runs.
+    """
+
+    path      : Maybe[pl.Path]
+    _records  : dict[str, float]
+    _dirty    : bool
+
+    def __init__(self, *, path:Maybe[str|pl.Path]=None) -> None:
+        self.path      = None if path is None else pl.Path(path)
+        self._records  = {}
+        self._dirty    = False
+        self.load()
+
+    def __contains__(self, name:TaskName_p) -> bool:
+        return self._key(name) in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, name:TaskName_p, default:Maybe[float]=None) -> float:
+        """ The expected duration of a task, in seconds """
+        return self._records.get(self._key(name), DEFAULT_DURATION if default is None else default)
+
+    def record(self, name:TaskName_p, seconds:float) -> None:
+        """ Update a task's expected duration with an observed run time """
+        key = self._key(name)
+        match self._records.get(key, None):
+            case None:
+                self._records[key] = float(seconds)
+            case prior:
+                self._records[key] = (SMOOTHING * seconds) + ((1 - SMOOTHING) * prior)
+
+        self._dirty = True
+
+    def load(self) -> None:
+        match self.path:
+            case None:
+                return
+            case pl.Path() as x if not x.exists():
+                return
+            case pl.Path() as x:
+                pass
+
+        try:
+            self._records = {str(k):float(v) for k,v in json.loads(x.read_text()).items()}
+        except (ValueError, TypeError, AttributeError) as err:
+            logging.warning("Ignoring unreadable task durations: %s : %s", x, err)
+            self._records = {}
+
+    def save(self) -> None:
+        """ Write the durations to the path, if there is one and anything has changed """
+        if self.path is None or not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._records, indent=4, sort_keys=True))
+        self._dirty = False
+
+    def _key(self, name:TaskName_p) -> str:
+        return str(name.de_uniq() if name.uuid() else name)
@@ -2,11 +2,17 @@
 """
 The network of task relations.
 
-Uses an nx.Digraph internally.
+Uses an nx.Digraph internally, or a CompactDiGraph for large networks.
 Is build 'backwards', as this preserves the meaning
 of graph.pred[x]  = [y] as y.depends_on[x]
 and graph.succ[x] = [y] as y.required_for[x]
 
+A topological order is maintained as edges are added (Pearce-Kelly),
+so cycles are rejected by connect, instead of found by validation.
+
+The network's version increases whenever a node or edge is added,
+so results computed from the network can be cached against it.
+
 """
 # ruff: noqa: ERA001
 # Imports:
@@ -32,13 +38,13 @@ from uuid import UUID, uuid1
 from jgdv import Proto, Mixin
 import networkx as nx
 from jgdv.structs.chainguard import ChainGuard
-from jgdv.structs.dkey import DKey
 # ##-- end 3rd party imports
 
 # ##-- 1st party imports
 import doot
 import doot.errors
 from ._interface import EdgeType_e
+from .compact_graph import CompactDiGraph
 from doot.workflow import ActionSpec, TaskName, TaskSpec, DootTask, RelationSpec, TaskArtifact
 # ##-- end 1st party imports
 
@@ -87,6 +93,13 @@ logging.disabled = False
 
 show_graph : Final[bool] = doot.config.on_fail(False, bool).settings.commands.run.show() # type: ignore[attr-defined]  # noqa: FBT003
 
+NETWORK_BACKEND : Final[str] = doot.config.on_fail("networkx", str).settings.commands.run.network() # type: ignore[attr-defined]
+
+BACKENDS : Final[dict[str, Callable[[], nx.DiGraph|CompactDiGraph]]] = {
+    "networkx" : nx.DiGraph,
+    "compact"  : CompactDiGraph,
+}
+
 DRAW_OPTIONS : Final[dict]  = dict(
     with_labels=True,
     # arrowstyle="->",
@@ -104,6 +117,7 @@ class _Expansion_m:
     nodes     : Mapping
     edges     : Mapping
     _graph    : Any
+    _version  : int
     non_expanded : set
 
     def build_network(self, *, sources:Maybe[Literal[True]|list[Concrete[TaskName_p]|Artifact_i]]=None) -> None:
@@ -179,6 +193,9 @@ class _Expansion_m:
             # nothing to do
             return
 
+        self._order_edge(left, right)
+        self._version += 1
+
         # Add the edge, with metadata
         match left, right:
             case TaskName_p(), TaskName_p():
@@ -212,6 +229,7 @@ class _Expansion_m:
                 self._graph.add_node(name)
                 self.nodes[name][API.EXPANDED]     = True
                 self.nodes[name][API.REACTIVE_ADD] = False
+                self._order_node(name)
             case TaskName_p() as x if not x.uuid():
                 raise doot.errors.TrackingError("Nodes should only be instantiated spec names", x)
             case TaskName_p() as x if x not in self._tracker.specs:
@@ -224,15 +242,21 @@ class _Expansion_m:
                 self.nodes[name][API.EXPANDED]      = False
                 self.nodes[name][API.REACTIVE_ADD]  = False
                 self.non_expanded.add(name)
+                self._order_node(name)
+                self._unvalidated.add(name)
             case TaskName_p():  # Add node with metadata
                 logging.debug("[Network.Task.+] %s", name)
                 self._graph.add_node(name)
                 self.nodes[name][API.EXPANDED]      = False
                 self.nodes[name][API.REACTIVE_ADD]  = False
                 self.non_expanded.add(name)
+                self._order_node(name)
+                self._unvalidated.add(name)
             case x:
                 raise TypeError(type(x))
 
+        self._version += 1
+
     def _expand_task_node(self, name:Concrete[TaskName_p]) -> set[Concrete[TaskName_p]|Artifact_i]:
         """ expand a task node, instantiating and connecting to its dependencies and dependents,
         *without* expanding those new nodes.
@@ -346,57 +370,105 @@ class _Expansion_m:
             self.connect(instance, False)  # noqa: FBT003
             to_expand.add(instance)
 
+        index = self._tracker._registry.artifact_index # type: ignore[attr-defined]
         match artifact.is_concrete():
             case True:
                 logging.debug("-- Connecting concrete artifact to parent abstracts")
-                art_path = DKey[pl.Path](artifact[1,:])(relative=True) # type: ignore[operator]
-                for abstract in self._tracker.abstract:
-                    match abstract:
-                        case TaskName_p():
-                            continue
-                        case Artifact_i() as x if art_path not in x and artifact not in x:
-                            continue
-                        case _:
-                            self.connect(artifact, abstract)
-                            to_expand.add(abstract)
+                for abstract in index.abstracts_of(artifact):
+                    self.connect(artifact, abstract)
+                    to_expand.add(abstract)
             case False:
                 logging.debug("-- Connecting abstract task to child concrete _tracker._registry.artifacts")
-                for conc in self._tracker.concrete:
-                    match conc:
-                        case TaskName_p():
-                            continue
-                        case Artifact_i():
-                            assert(conc.is_concrete())
-                            conc_path = DKey[pl.Path](conc[1,:])(relative=True) # type: ignore[operator]
-                            if conc_path not in artifact:
-                                continue
-                            self.connect(conc, artifact)
-                            to_expand.add(conc)
+                for conc in index.concretes_in(artifact):
+                    assert(conc.is_concrete())
+                    self.connect(conc, artifact)
+                    to_expand.add(conc)
 
         logging.info("[Build.Expand.Artifact] <-- %s -> %s", artifact, to_expand)
         self.nodes[artifact][API.EXPANDED] = True
         self.non_expanded.remove(artifact)
         return to_expand
 
+class _Ordering_m:
+    """ Incremental topological ordering, using Pearce and Kelly's algorithm.
+
+    Every node has an order, and every edge goes from a lower to a higher order.
+    Adding an edge that breaks that reorders only the nodes between its ends,
+    or raises if the edge would make a cycle.
+
+    New nodes are ordered before every existing node,
+    as expansion mostly connects new dependencies to existing tasks.
+
+    _order : node -> its position in the topological order
+    """
+
+    _order       : dict[TaskName_p|Artifact_i, int]
+    _next_order  : int
+    pred         : Mapping
+    succ         : Mapping
+
+    def topological_order(self) -> list[Concrete[TaskName_p]|Artifact_i]:
+        """ Every node, after the nodes it depends on """
+        return sorted(self._order, key=self._order.__getitem__)
+
+    def _order_node(self, node:Concrete[TaskName_p]|Artifact_i) -> None:
+        self._order[node]  = self._next_order
+        self._next_order  -= 1
+
+    def _order_edge(self, left:Concrete[TaskName_p]|Artifact_i, right:Concrete[TaskName_p]|Artifact_i) -> None:
+        """ Update the order for a new edge left -> right, before it is added """
+        lower, upper = self._order[right], self._order[left]
+        if upper < lower:
+            return
+        if upper == lower:
+            raise doot.errors.TrackingError("Connecting would create a cycle", left, right)
+
+        forward   = self._ordering_region(right, self.succ, lambda x: x <= upper, cycle_on=left)
+        backward  = self._ordering_region(left, self.pred, lambda x: lower <= x)
+        moved     = sorted(backward, key=self._order.__getitem__) + sorted(forward, key=self._order.__getitem__)
+        slots     = sorted(self._order[x] for x in moved)
+        logging.debug("[Network.Order] Reordering %s nodes for: %s -> %s", len(moved), left, right)
+        for node, slot in zip(moved, slots, strict=True):
+            self._order[node] = slot
+
+    def _ordering_region(self, start:Concrete[TaskName_p]|Artifact_i, adj:Mapping, bounded:Callable[[int], bool], *, cycle_on:Maybe[Concrete[TaskName_p]|Artifact_i]=None) -> list:
+        """ Depth first search from start, through nodes whose order is in bounds """
+        found  = {start}
+        queue  = [start]
+        while bool(queue):
+            for other in adj[queue.pop()]:
+                if cycle_on is not None and other == cycle_on:
+                    raise doot.errors.TrackingError("Connecting would create a cycle", cycle_on, start)
+                if other in found or not bounded(self._order[other]):
+                    continue
+                found.add(other)
+                queue.append(other)
+        else:
+            return list(found)
+
 class _Validation_m:
 
-    _tracker  : API.WorkflowTracker_i
-    _graph    : Any
-    nodes     : Mapping
-    edges     : Mapping
-    pred      : Mapping
-    succ      : Mapping
+    _tracker      : API.WorkflowTracker_i
+    _graph        : Any
+    _unvalidated  : set
+    nodes         : Mapping
+    edges         : Mapping
+    pred          : Mapping
+    succ          : Mapping
 
     def validate_network(self, *, strict:bool=True) -> bool:            # noqa: PLR0912
         """ Finalise and ensure consistence of the task _graph.
         run tests to check the dependency graph is acceptable
-        """
-        logging.info("Validating Task Network")
-        if not nx.is_directed_acyclic_graph(self._graph):
-            raise doot.errors.TrackingError("Network isn't a DAG")
 
-        failures = []
-        for node, data in self.nodes.items():
+        Connecting keeps the network acyclic,
+        so only nodes added since the last validation, or which failed it, are checked.
+        """
+        logging.info("Validating Task Network: %s new nodes", len(self._unvalidated))
+        failures  = []
+        failed    = set()
+        for node in self._unvalidated:
+            data   = self.nodes[node]
+            count  = len(failures)
             match node:
                 case TaskName_p() as x if x == self._tracker._root_node:  # Ignore the root
                     pass
@@ -413,10 +485,13 @@ class _Validation_m:
                     if (TaskArtifact.Wild.glob in node
                         and not bool(self._graph.pred[node])):
                         failures.append(f"{node} has no concrete predecessors")
+            if count < len(failures):
+                failed.add(node)
         else:
             if not self._tracker.is_valid:
                 raise doot.errors.TrackingError("Network is not marked as valid")
 
+            self._unvalidated = failed
             if not bool(failures):
                 return True
 
@@ -444,48 +519,72 @@ class _Validation_m:
             })
 
     def report_tree(self) -> None:
-        """ Use networkx + plt's graph drawing to inspect the constructed graph """
-        mapping : dict[TaskName_p|Artifact_i, str]
+        """ Use networkx + plt's graph drawing to inspect the constructed graph.
+        Only the part of the graph connected to the root is copied for drawing.
+        """
+        mapping  : dict[TaskName_p|Artifact_i, str]
+        root     : TaskName_p
         if not show_graph:
             return
 
+        root     = self._tracker._root_node
+        found    = {root}
+        queue    = [root]
+        while bool(queue):
+            current = queue.pop()
+            for other in itz.chain(self.pred[current], self.succ[current]):
+                if other not in found:
+                    found.add(other)
+                    queue.append(other)
+
         mapping = {}
         count = 0
-        for x in self._graph.nodes:
+        for x in self.nodes:
             match x:
+                case _ if x not in found:
+                    pass
                 case Artifact_i():
                     mapping[x] = str(x)
                 case TaskName_p():
                     mapping[x] = f"{x[:]}.{count}"
                     count += 1
 
-        mapping[self._tracker._root_node] = cast("str", self._tracker._root_node)
-        undir = nx.Graph(self._graph)
-        undir = nx.relabel_nodes(undir, mapping)
-
-        sub = undir.subgraph(nx.node_connected_component(undir, self._tracker._root_node))
-        nx.draw(sub, pos=nx.bfs_layout(sub, self._tracker._root_node), **DRAW_OPTIONS)
+        mapping[root] = cast("str", root)
+        undir = nx.Graph()
+        undir.add_nodes_from(mapping.values())
+        undir.add_edges_from((mapping[x], mapping[y]) for x in mapping for y in self.succ[x])
+        nx.draw(undir, pos=nx.bfs_layout(undir, mapping[root]), **DRAW_OPTIONS)
         plt.show()
 
 ##--|
 
-@Mixin(_Expansion_m, _Validation_m)
+@Mixin(_Expansion_m, _Ordering_m, _Validation_m)
 class TrackNetwork:
     """ The _graph of concrete tasks and their dependencies """
     # TODO use this instaed of _tracker._registry
     _tracker      : API.WorkflowTracker_p
-    _graph        : nx.DiGraph[Concrete[TaskName_p]|TaskArtifact]
+    _graph        : nx.DiGraph[Concrete[TaskName_p]|TaskArtifact]|CompactDiGraph
 
     non_expanded  : set[TaskName_p|Artifact_i]
+    _unvalidated  : set[TaskName_p|Artifact_i]
+    _version      : int
 
-    def __init__(self, *, tracker:API.WorkflowTracker_p) -> None:
+    def __init__(self, *, tracker:API.WorkflowTracker_p, backend:Maybe[str]=None) -> None:
         match tracker:
             case API.WorkflowTracker_p():
                 self._tracker = tracker
             case x:
                 raise TypeError(type(x))
-        self._graph        = nx.DiGraph()
+        match BACKENDS.get(backend or NETWORK_BACKEND, None):
+            case None:
+                raise doot.errors.ConfigError("Unknown network backend", backend or NETWORK_BACKEND, list(BACKENDS))
+            case ctor:
+                self._graph = ctor()
         self.non_expanded  = set()
+        self._unvalidated  = set()
+        self._order        = {}
+        self._next_order   = 0
+        self._version      = 0
         self._add_node(self._tracker._root_node)  # type: ignore[attr-defined]
 
     ##--| properties
@@ -510,6 +609,11 @@ class TrackNetwork:
     def succ(self) -> dict:
         return self._graph.succ
 
+    @property
+    def version(self) -> int:
+        """ Increases on every change to the network's nodes or edges """
+        return self._version
+
     ##--| dunders
 
     def __len__(self) -> int:
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+A Tracker which counts each waiting node's unfinished predecessors,
+instead of repeatedly requeuing them.
+
+Entries are advanced through DECLARED -> DEFINED -> INIT -> WAIT in one step.
+A waiting task records how many of its predecessors haven't succeeded.
+When a task succeeds, its successors' counts are decremented,
+and any that reach zero are moved to the ready set.
+So next_for never spins on blocked tasks.
+
+Finished tasks are pushed to the tracker by the registry's status subscription,
+and next_for(wait=True) can block until another thread reports a task as finished.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import threading
+import time
+import types
+from collections import deque
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv import Proto
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+from doot.workflow import TaskName
+from doot.workflow._interface import (Artifact_i, ArtifactStatus_e, Task_p,
+                                      TaskName_p, TaskStatus_e)
+
+# ##-- end 1st party imports
+
+# ##-| Local
+from . import _interface as API # noqa: N812
+from ._interface import WorkflowTracker_p
+from .naive_tracker import NaiveTracker
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Concrete[T] = T
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+FINISHED_STATUSES : Final[set[TaskStatus_e]] = {
+    TaskStatus_e.SUCCESS,
+    TaskStatus_e.SKIPPED,
+    TaskStatus_e.FAILED,
+    TaskStatus_e.HALTED,
+}
+FAILED_STATUSES   : Final[set[TaskStatus_e]] = {TaskStatus_e.FAILED, TaskStatus_e.HALTED}
+##--|
+
+@Proto(WorkflowTracker_p)
+class ReadyTracker(NaiveTracker):
+    """ A Tracker which schedules from a set of ready tasks,
+    using per node counts of unfinished predecessors.
+
+    _blocking  : waiting node -> the number of predecessors it is waiting on
+    _ready     : tasks whose predecessors have all succeeded, in the order they became ready
+    _running   : tasks given to the runner, which haven't been reported on yet
+    _finished  : tasks reported as finished, which haven't been settled yet
+    _released  : tasks whose success has been passed on to their successors
+    _satisfied : artifacts which have been found to exist
+    _failed    : tasks which failed or were halted
+    _cond      : signalled when a task finishes, for next_for(wait=True)
+    """
+
+    _blocking     : dict[TaskName_p, int]
+    _ready        : deque[TaskName_p]
+    _ready_set    : set[TaskName_p]
+    _running      : set[TaskName_p]
+    _finished     : deque[TaskName_p]
+    _released     : set[TaskName_p]
+    _satisfied    : set[Artifact_i]
+    _failed       : set[TaskName_p]
+    _cond         : threading.Condition
+    _drain_queue  : ClassVar[bool]       = False
+
+    def __init__(self, **kwargs:Any) -> None:
+        super().__init__(**kwargs)
+        self._cond = threading.Condition(threading.RLock())
+        self._reset_counts()
+        self._registry.subscribe(self._on_status)
+
+    ##--| dunders
+
+    @override
+    def __bool__(self) -> bool:
+        return any([bool(self._queue), bool(self._ready), bool(self._running), bool(self._finished)])
+
+    ##--| public
+
+    @override
+    def next_for(self, target:Maybe[str|TaskName_p]=None, *, wait:bool=False, timeout:Maybe[float]=None) -> Maybe[Task_p|Artifact_i]:
+        """ Get the next ready task.
+
+        Settles any tasks which have been reported as finished,
+        then returns from the ready set, advancing queued entries only until something is ready.
+        Returns None if nothing is ready.
+
+        With wait=True, while tasks are still running, blocks until one of them finishes
+        (or the timeout passes), instead of returning None.
+        So the statuses of running tasks must be set from another thread.
+        """
+        result  : Maybe[Task_p|Artifact_i]
+        with self._cond:
+            while (result:=self._next_ready(target)) is None and wait and bool(self._running):
+                if not self._cond.wait(timeout=timeout):
+                    break
+
+            return result
+
+    @override
+    def set_status(self, task:Concrete[TaskName_p]|Artifact_i|Task_p, internal_state:TaskStatus_e) -> bool:
+        """ Update a status, accepting Task objects as well as names """
+        match task:
+            case Task_p():
+                task = task.name
+            case _:
+                pass
+
+        with self._cond:
+            return super().set_status(task, internal_state)
+
+    @override
+    def clear(self) -> None:
+        with self._cond:
+            super().clear()
+            self._reset_counts()
+
+    ##--| internal
+
+    def _next_ready(self, target:Maybe[str|TaskName_p]=None) -> Maybe[Task_p|Artifact_i]:
+        focus   : TaskName_p|Artifact_i
+        result  : Maybe[Task_p|Artifact_i]
+
+        logging.info("[Next.For] (Active: %s, Ready: %s, Blocked: %s)", len(self.active), len(self._ready), len(self._blocking))
+        if not self.is_valid:
+            raise doot.errors.TrackingError("Network is in an invalid internal_state")
+
+        if target and target not in self.active:
+            self.queue(target, silent=True)
+
+        result = None
+        while result is None:
+            while bool(self._finished):
+                self._settle(self._finished.popleft())
+
+            if bool(self._ready) and not (self._drain_queue and bool(self._queue)):
+                result = self._pop_ready()
+                continue
+
+            if not bool(self._queue):
+                break
+
+            match (focus:=self._queue.deque_entry()):
+                case x if x not in self.active:
+                    continue
+                case TaskName_p():
+                    self._advance(focus)
+                case Artifact_i():
+                    result = self._advance_artifact(focus)
+                case x:
+                    raise doot.errors.TrackingError("Unknown task focus", x)
+
+        logging.info("[Next.For] <- %s", result)
+        return result
+
+    def _on_status(self, name:TaskName_p, prior:TaskStatus_e, status:TaskStatus_e) -> None:  # noqa: ARG002
+        """ The registry's status subscription. Notes finished tasks, so they can be settled """
+        if status not in FINISHED_STATUSES:
+            return
+
+        with self._cond:
+            self._running.discard(name)
+            self._finished.append(name)
+            self._cond.notify_all()
+
+    def _reset_counts(self) -> None:
+        self._blocking   = {}
+        self._ready      = deque()
+        self._ready_set  = set()
+        self._running    = set()
+        self._finished   = deque()
+        self._released   = set()
+        self._satisfied  = set()
+        self._failed     = set()
+
+    def _pop_ready(self) -> Maybe[Task_p]:
+        focus = self._take_ready()
+        self._ready_set.discard(focus)
+        match self.get_status(target=focus):
+            case TaskStatus_e.READY, _ if focus in self.active:
+                pass
+            case _:
+                return None
+
+        self.set_status(focus, TaskStatus_e.RUNNING)
+        self._running.add(focus)
+        return cast("Task_p", self.specs[focus].task)
+
+    def _advance(self, focus:TaskName_p) -> None:  # noqa: PLR0912
+        """ Move a task through as many statuses as it can, without requeuing it """
+        x : Any
+        while True:
+            status, _ = self.get_status(target=focus)
+            logging.debug("[Advance] %s : %s", status, focus)
+            match status:
+                case TaskStatus_e.DECLARED:
+                    self.set_status(focus, TaskStatus_e.DEFINED)
+                case TaskStatus_e.DEFINED:
+                    self._instantiate(focus, task=True)
+                case TaskStatus_e.INIT:
+                    self.set_status(focus, TaskStatus_e.WAIT)
+                case TaskStatus_e.WAIT if focus in self._blocking:
+                    return
+                case TaskStatus_e.WAIT:
+                    match self._count_blockers(focus):
+                        case None:
+                            return
+                        case 0:
+                            self._make_ready(focus)
+                        case int() as count:
+                            logging.debug("[Advance] Task Blocked: %s on %s", focus, count)
+                            self._blocking[focus] = count
+                    return
+                case TaskStatus_e.READY:
+                    self._make_ready(focus)
+                    return
+                case TaskStatus_e.RUNNING:
+                    return
+                case TaskStatus_e.SUCCESS | TaskStatus_e.SKIPPED:
+                    self._release(focus)
+                    self.set_status(focus, TaskStatus_e.TEARDOWN)
+                case TaskStatus_e.FAILED | TaskStatus_e.HALTED:
+                    self._propagate_failure(focus)
+                    self.set_status(focus, TaskStatus_e.TEARDOWN)
+                case TaskStatus_e.TEARDOWN:
+                    for succ, _ in self._successor_states_of(focus):
+                        match self.queue(succ):
+                            case TaskName() as x if x.is_cleanup() and x.uuid() == focus.uuid():
+                                # make the task's own cleanup early, to apply shared internal_state.
+                                # Other cleanups this task blocks get their state from their own task
+                                self._instantiate(x, parent=focus, task=True)
+                            case _:
+                                pass
+                    else:
+                        self.set_status(focus, TaskStatus_e.DEAD)
+                case TaskStatus_e.DEAD:
+                    self._blocking.pop(focus, None)
+                    self.specs[focus].task = TaskStatus_e.DEAD
+                    self.active.discard(focus)
+                    return
+                case TaskStatus_e.DISABLED:
+                    self.active.discard(focus)
+                    return
+                case TaskStatus_e.NAMED:
+                    logging.warning("A Name only was queued, it has no backing in the tracker: %s", focus)
+                    return
+                case x:
+                    raise doot.errors.TrackingError("Unknown task internal_state", x)
+
+    def _advance_artifact(self, focus:Artifact_i) -> Maybe[Artifact_i]:
+        """ Check an artifact, passing it on to its dependents if it exists """
+        status, _ = self.get_status(target=focus)
+        match status:
+            case ArtifactStatus_e.EXISTS:
+                self._satisfy(focus)
+            case ArtifactStatus_e.DECLARED if bool(focus):
+                self._satisfy(focus)
+            case ArtifactStatus_e.STALE:
+                for pred, _ in self._dependency_states_of(focus):
+                    self._activate(pred)
+            case ArtifactStatus_e.DECLARED:
+                waiting = [x for x, y in self._dependency_states_of(focus) if y not in API.SUCCESS_STATUSES]
+                match waiting:
+                    case [] if not focus.is_concrete():
+                        logging.warning("[Next.For] Abstract Artifact has no unfinished producers: %s", focus)
+                        self.active.discard(focus)
+                    case []:
+                        # Returns the artifact, the runner can try to create it
+                        return focus
+                    case [*xs]:
+                        # The artifact is requeued when a producer succeeds
+                        logging.info("[Next.For] Artifact Blocked, queuing producer tasks, count: %s", len(xs))
+                        for dep in xs:
+                            self._activate(dep)
+            case x:
+                raise doot.errors.TrackingError("Unknown artifact status", x)
+
+        return None
+
+    def _count_blockers(self, focus:TaskName_p) -> Maybe[int]:
+        """ Count the predecessors of a task which haven't succeeded, queuing them if necessary.
+        Returns None if a predecessor has failed, and the task has been halted.
+        """
+        count : int = 0
+        for pred in self._network.pred[focus]:
+            status, _ = self.get_status(target=pred)
+            match pred:
+                case Artifact_i() if pred in self._satisfied:
+                    continue
+                case Artifact_i() if status in API.SUCCESS_STATUSES or bool(pred):
+                    self._satisfy(pred)
+                    continue
+                case TaskName_p() if pred in self._failed and not focus.is_cleanup():
+                    self.set_status(focus, TaskStatus_e.HALTED)
+                    return None
+                case TaskName_p() if pred in self._released or pred in self._failed:
+                    continue
+                case TaskName_p() if status in API.SUCCESS_STATUSES:
+                    self._release(pred)
+                    continue
+                case _:
+                    pass
+
+            count += 1
+            self._activate(pred)
+        else:
+            return count
+
+    def _settle(self, focus:TaskName_p) -> None:
+        """ Handle a task which has been reported as finished.
+        Its dependents are updated immediately,
+        but its teardown is queued, so newly ready tasks run first
+        """
+        status, _ = self.get_status(target=focus)
+        match status:
+            case x if x in FAILED_STATUSES:
+                self._propagate_failure(focus)
+            case _:
+                self._release(focus)
+
+        if focus in self.active:
+            self.queue(focus)
+
+    def _release(self, focus:TaskName_p|Artifact_i) -> None:
+        """ Pass on the success of a node, to the nodes that depend on it """
+        if focus in self._released:
+            return
+
+        self._released.add(focus) # type: ignore[arg-type]
+        for succ in self._network.succ[focus]:
+            match succ:
+                case TaskName_p() if succ in self._blocking:
+                    self._decrement(succ)
+                case Artifact_i() if succ not in self._satisfied and succ in self.active:
+                    # re-check the artifact now a producer has finished
+                    self.queue(succ)
+                case _:
+                    pass
+
+    def _satisfy(self, artifact:Artifact_i) -> None:
+        if artifact in self._satisfied:
+            return
+
+        self._satisfied.add(artifact)
+        self.active.discard(artifact)
+        self._release(artifact)
+
+    def _propagate_failure(self, focus:TaskName_p) -> None:
+        """ Halt the blocked dependents of a failed task. Cleanup tasks are still run """
+        if focus in self._failed:
+            return
+
+        self._failed.add(focus)
+        for succ in self._network.succ[focus]:
+            match succ:
+                case TaskName_p() if succ not in self._blocking:
+                    pass
+                case TaskName_p() if succ.is_cleanup():
+                    self._decrement(succ)
+                case TaskName_p():
+                    del self._blocking[succ]
+                    self.set_status(succ, TaskStatus_e.HALTED)
+                case _:
+                    pass
+
+    def _decrement(self, focus:TaskName_p) -> None:
+        self._blocking[focus] -= 1
+        if 0 < self._blocking[focus]:
+            return
+
+        del self._blocking[focus]
+        self._make_ready(focus)
+
+    def _make_ready(self, focus:TaskName_p) -> None:
+        if focus in self._ready_set:
+            return
+
+        self.set_status(focus, TaskStatus_e.READY)
+        self._push_ready(focus)
+        self._ready_set.add(focus)
+
+    def _push_ready(self, focus:TaskName_p) -> None:
+        """ Add a task to the ready set. Ready tasks are run in the order they became ready """
+        self._ready.append(focus)
+
+    def _take_ready(self) -> TaskName_p:
+        return self._ready.popleft()
+
+    def _activate(self, target:TaskName_p|Artifact_i) -> None:
+        """ Queue a node if it isn't already being tracked """
+        if target in self.active:
+            return
+
+        self.queue(target)
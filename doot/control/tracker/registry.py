@@ -39,6 +39,8 @@ from doot.workflow._interface import (ActionSpec_i, ArtifactStatus_e, RelationMe
 
 # ##-| Local
 from . import _interface as API # noqa: N812
+from .artifact_index import ArtifactIndex
+from .constraint_index import ConstraintIndex
 
 # # End of Imports.
 
@@ -67,6 +69,7 @@ if TYPE_CHECKING:
     type Concrete[T] = T
     type ActionElem  = ActionSpec_i|RelationSpec_i
     type ActionGroup = list[ActionElem]
+    from ._interface import StatusListener
 ##--|
 ##
 from doot.workflow._interface import Task_i
@@ -87,17 +90,47 @@ class _Registration_m(API.Registry_d):
 
         Does *not* handle any taskspec generation logic
         """
+        self.register_many([spec])
+
+    def register_many(self, specs:Iterable[TaskSpec_i]) -> list[TaskName_p]:
+        """ Register specs in bulk, in order, along with their implicit specs.
+
+        Each spec is classified and has its relations registered in a single pass,
+        then delayed blockers are resolved for all the new specs at the end.
+
+        returns the names of the newly registered specs
+        """
+        added  : list[TaskSpec_i]  = []
+        queue  : list[TaskSpec_i]  = list(specs)
+        queue.reverse()
+        while bool(queue):
+            spec = queue.pop()
+            if not self._add_spec(spec):
+                continue
+            added.append(spec)
+            # Depth first, so implicit specs are registered straight after their source
+            queue += reversed(self._implicit_specs(spec))
+        else:
+            for spec in added:
+                self._register_delayed_blockers(spec)
+            else:
+                return [x.name for x in added]
+
+    def _add_spec(self, spec:TaskSpec_i) -> bool:
+        """ Classify and store a spec, and register its relations.
+        returns False if the spec was not added
+        """
         x           : Any
         ##--|
         if TaskMeta_e.DISABLED in spec.meta:
             logging.info("[Disabled] task: %s", spec.name[:])
-            return
+            return False
 
         match spec.name:
             case TaskName_p() as x if x in self.specs:
                 if self.specs[x].spec is not spec:
                     raise ValueError("Tried to overwrite a spec", spec.name)
-                return
+                return False
             case TaskName_p() as x if TaskName.Marks.partial in x:
                 raise ValueError("By this point a partial spec should have been reified", x)
 
@@ -109,30 +142,46 @@ class _Registration_m(API.Registry_d):
                 if x.uuid() and (originator:=x.pop_generated()) in self.specs:
                     self.specs[originator].related.add(spec.name)
                 self.specs[spec.name] = API.SpecMeta_d(spec=spec)
-                self._register_spec_artifacts(spec)
-                self._register_blocking_relations(spec)
-                self._register_delayed_blockers(spec)
-                self._register_implicit_tasks(spec)
+                self.constraint_index.add(gen_base, spec.name)
             case TaskName_p() if x.uuid():
                 logging.info("[+.Concrete] : %s", spec.name)
                 self.concrete.add(spec.name.de_uniq())
                 self.specs[spec.name] = API.SpecMeta_d(spec=spec)
-                self._register_spec_artifacts(spec)
-                self._register_blocking_relations(spec)
-                self._register_delayed_blockers(spec)
-                self._register_implicit_tasks(spec)
                 self.specs[spec.name.de_uniq()].related.add(spec.name)
+                self.constraint_index.add(spec.name.de_uniq(), spec.name)
             case TaskName_p():
                 logging.info("[+.Abstract] : %s", spec.name)
                 self.abstract.add(spec.name)
                 self.specs[spec.name] = API.SpecMeta_d(spec=spec)
-                self._register_spec_artifacts(spec)
-                self._register_blocking_relations(spec)
-                self._register_delayed_blockers(spec)
-                self._register_implicit_tasks(spec)
             case x:
                 raise TypeError(type(x))
 
+        self._register_relations(spec)
+        self._want_related(spec)
+        return True
+
+    def take_wanted(self) -> list[TaskName_p]:
+        """ The unregistered names registered specs need, for a tracker's spec source """
+        wanted, self._wanted = self._wanted, []
+        return wanted
+
+    def _want_related(self, spec:TaskSpec_i) -> None:
+        """ With a spec source, note the unregistered specs an abstract spec relates to,
+        the specs which block it, and the specs which produce the artifacts it depends on
+        """
+        if getattr(self._tracker, "_spec_source", None) is None or spec.name.uuid():
+            return
+
+        for rel in self._tracker._factory.action_group_elements(spec): # type: ignore[attr-defined]
+            match rel:
+                case RelationSpec_i(target=TaskName_p() as target) if target not in self.specs:
+                    self._wanted.append(target)
+                case RelationSpec_i(target=Artifact_i() as target) if not rel.forward_dir_p():
+                    self._wanted += self._tracker._spec_source.producers_of(target) # type: ignore[attr-defined]
+                case _:
+                    pass
+        else:
+            self._wanted += self._tracker._spec_source.blockers_of(spec.name) # type: ignore[attr-defined]
 
     def _register_artifact(self, art:Artifact_i, *tasks:TaskName_p, relation:Maybe[S_API.RelationMeta_e]=None) -> None:
         logging.info("[+] Artifact: %s, %s", art, tasks)
@@ -145,13 +194,15 @@ class _Registration_m(API.Registry_d):
                 obj = API.ArtifactMeta_d(artifact=art)
                 self.artifacts[art] = obj
 
-        # Add it to the relevant abstract/concrete set
+        # Add it to the relevant abstract/concrete set, and the path index
         match art.is_concrete():
             case True:
                 self.concrete.add(art)
             case False:
                 self.abstract.add(art)
 
+        self.artifact_index.add(art)
+
         match relation:
             case None:
                 pass
@@ -160,35 +211,26 @@ class _Registration_m(API.Registry_d):
             case S_API.RelationMeta_e.blocks:
                 obj.builders.update(tasks)
 
-    def _register_spec_artifacts(self, spec:TaskSpec_i) -> None:
-        """ Register the artifacts a spec produces """
-        assert(hasattr(self._tracker, "_factory"))
-        for rel in self._tracker._factory.action_group_elements(spec):
-            match rel:
-                case RelationSpec_i(target=Artifact_i() as art, relation=reltype):
-                    self._register_artifact(art, spec.name, relation=reltype)
-                case _:
-                    pass
+    def _register_relations(self, spec:TaskSpec_i) -> None:
+        """ Register the artifacts a spec mentions, and what it blocks, in one pass.
 
-    def _register_blocking_relations(self, spec:TaskSpec_i) -> None:
-        """ a Task[required_for=[x,y,z] blocks x,y,z,
+        a Task[required_for=[x,y,z] blocks x,y,z,
         but if you just look at x,y,z, you can't know that.
-        This is the reverse mapping to allow for that
-
+        This is the reverse mapping to allow for that.
+        If x,y,z aren't registered yet, the mapping is delayed until they are.
         """
-        # assert(not spec.name.uuid())
         assert(hasattr(self._tracker, "_factory"))
-        # Register Indirect dependencies:
-        # So if spec blocks target,
-        # record that target needs spec
         for rel in self._tracker._factory.action_group_elements(spec):
             match rel:
+                case RelationSpec_i(target=Artifact_i() as target, relation=RelationMeta_e.blocks as reltype):
+                    self._register_artifact(target, spec.name, relation=reltype)
+                    logging.info("[Requirement]: %s : %s", target, spec.name)
+                    self.artifacts[target].blocked_by.add(spec.name)
+                case RelationSpec_i(target=Artifact_i() as target, relation=reltype):
+                    self._register_artifact(target, spec.name, relation=reltype)
                 case RelationSpec_i(target=TaskName_p() as target, relation=RelationMeta_e.blocks) if target in self.specs: # type: ignore[attr-defined]
                     logging.info("[Requirement]: %s : %s", target, spec.name)
                     self.specs[target].blocked_by.add(spec.name)
-                case RelationSpec_i(target=Artifact_i() as target, relation=RelationMeta_e.blocks) if target in self.artifacts: # type: ignore[attr-defined]
-                    logging.info("[Requirement]: %s : %s", target, spec.name)
-                    self.artifacts[target].blocked_by.add(spec.name)
                 case RelationSpec_i(target=target, relation=RelationMeta_e.blocks):
                     logging.info("[Delayed.Requirement]: %s : %s", target, spec.name)
                     self._delayed_blockers[target].append(spec.name)
@@ -222,12 +264,16 @@ class _Registration_m(API.Registry_d):
         assert(task.uuid())
         self.specs[task].injection_source = (parent, inject)
 
-    def _register_implicit_tasks(self, spec:TaskSpec_i) -> None:
+    def _implicit_specs(self, spec:TaskSpec_i) -> list[TaskSpec_i]:
+        """ Build the unregistered specs a spec implies, eg: job heads and cleanup tasks """
+        result = []
         for data in self._tracker._subfactory.generate_specs(spec): # type: ignore[attr-defined]
             logging.debug("[Implicit]: %s -> %s", spec.name, data["name"])
-            implicit = self._tracker._factory.build(data) # type: ignore[attr-defined]
+            implicit = self._tracker._factory.build_trusted(data) # type: ignore[attr-defined]
             if implicit.name not in self.specs:
-                self._tracker.register(implicit)
+                result.append(implicit)
+        else:
+            return result
 
     
 class _Instantiation_m(API.Registry_d):
@@ -316,7 +362,7 @@ class _Instantiation_m(API.Registry_d):
             case API.SpecMeta_d(spec=_spec) as control_meta:
                 control_obj  = _spec
         ##--| reuse
-        potentials   = list(self.specs[target].related)
+        potentials   = self.constraint_index.candidates(target, *rel.constraint_key(control_obj), self.specs[target].related)
         for existing in potentials:
             match self.specs[existing]:
                 case API.SpecMeta_d(task=Task_i() as _task) if not rel.accepts(control_obj, _task):
@@ -389,7 +435,7 @@ class _Instantiation_m(API.Registry_d):
     def _instantiate_implicit_tasks(self, name:TaskName_p) -> None:
         spec = self.specs[name].spec
         for data in self._tracker._subfactory.generate_specs(spec): # type: ignore[attr-defined]
-            implicit = self._tracker._factory.build(data) # type: ignore[attr-defined]
+            implicit = self._tracker._factory.build_trusted(data) # type: ignore[attr-defined]
             if implicit.name not in self.specs:
                 self._tracker.register(implicit)
             self._tracker._instantiate(implicit.name)
@@ -415,13 +461,35 @@ class _Verification_m(API.Registry_d):
 @Proto(API.Registry_p)
 @Mixin(_Registration_m, _Instantiation_m, _Verification_m)
 class TrackRegistry(API.Registry_d):
-    """ Stores and manipulates specs, tasks, and artifacts """
+    """ Stores and manipulates specs, tasks, and artifacts
+
+    Listeners can subscribe to status changes,
+    to be told of them as they happen, instead of polling.
+    """
+    _listeners        : list[StatusListener]
+    _wanted           : list[TaskName_p]
+    artifact_index    : ArtifactIndex
+    constraint_index  : ConstraintIndex
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._delayed_blockers = defaultdict(list)
+        self._wanted           = []
+        self._listeners        = []
+        self.artifact_index    = ArtifactIndex()
+        self.constraint_index  = ConstraintIndex(lambda x: self.specs[x].spec.extra)
+
+    def subscribe(self, listener:StatusListener) -> None:
+        """ Call listener(name, prior, status) whenever a task's status changes """
+        if listener in self._listeners:
+            return
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener:StatusListener) -> None:
+        if listener not in self._listeners:
+            return
+        self._listeners.remove(listener)
 
-    
     def get_status(self, target:Concrete[TaskName_p|Artifact_i]) -> tuple[TaskStatus_e|ArtifactStatus_e, int]:
         """ Get the status of a target or artifact """
         assert(hasattr(self._tracker, "_declare_priority"))
@@ -446,9 +514,13 @@ class TrackRegistry(API.Registry_d):
         """ update the state of a task in the dependency graph
           Returns True on status update,
           False on no task or artifact to update.
+
+          Subscribed listeners are notified of any change.
         """
         x         : Any
         instance  : TaskName_p
+        prior     : TaskStatus_e
+        result    : bool
         ##--|
         logging.debug("[Status.=] : %s : %s", target, status)
         match target:
@@ -463,11 +535,21 @@ class TrackRegistry(API.Registry_d):
         match self.specs.get(instance, None):
             case None:
                 return False
-            case API.SpecMeta_d(task=TaskStatus_e()) as _meta:
+            case API.SpecMeta_d(task=TaskStatus_e() as prior) as _meta:
                 _meta.task = status
-                return False
+                result     = False
             case API.SpecMeta_d(task=Task_p() as _task):
-                _task.status = status
-                return True
+                prior         = _task.status
+                _task.status  = status
+                result        = True
             case x:
                 raise TypeError(type(x))
+
+        if prior is not status:
+            self._notify(instance, prior, status)
+
+        return result
+
+    def _notify(self, name:Concrete[TaskName_p], prior:TaskStatus_e, status:TaskStatus_e) -> None:
+        for listener in tuple(self._listeners):
+            listener(name, prior, status)
@@ -15,12 +15,14 @@ import warnings
 
 # ##-- 3rd party imports
 import pytest
+from pydantic import ValidationError
 # ##-- end 3rd party imports
 
 ##--|
 import doot
 from doot.workflow import TaskSpec, TaskName
 from doot.workflow._interface import Task_p, TaskSpec_i, TaskName_p, RelationSpec_i
+from doot.workflow import _interface as API
 from ..factory import SubTaskFactory, TaskFactory
 ##--|
 
@@ -297,6 +299,120 @@ class TestTaskFactory_Instantiation:
             case x:
                 assert(False), x
 
+    def test_instantiation_with_extra(self, factory):
+        base_task     = factory.build({"name": "agroup::base", "a": 0, "actions": [{"do":"log", "msg":"blah"}]})
+        match factory.instantiate(base_task, extra={"a": 2, "b-val": 3}):
+            case TaskSpec() as inst:
+                assert(inst.name.uuid())
+                assert(inst.extra.a == 2)
+                assert(inst.extra.b_val == 3)
+                assert(base_task.extra.a == 0)
+                assert("b_val" not in base_task.extra)
+                assert(base_task.name in inst.sources)
+                assert(inst.actions is base_task.actions)
+            case x:
+                assert(False), x
+
+    def test_instantiation_doesnt_share_meta(self, factory):
+        base_task     = factory.build({"name": "agroup::base"})
+        inst          = factory.instantiate(base_task, extra={"a": 2})
+        assert(inst.meta == base_task.meta)
+        assert(inst.meta is not base_task.meta)
+        assert(inst.generated_names is not base_task.generated_names)
+
+    def test_instantiation_with_field_extra_merges(self, factory):
+        base_task     = factory.build({"name": "agroup::base", "depends_on": ["agroup::other"]})
+        inst          = factory.instantiate(base_task, extra={"depends_on": ["agroup::more"]})
+        assert(len(inst.depends_on) == 2)
+        assert(inst.depends_on is not base_task.depends_on)
+        assert(len(base_task.depends_on) == 1)
+
+class TestTaskFactory_Trusted:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    @pytest.mark.parametrize("data", [
+        {"name": "agroup::base", "a": 0},
+        {"name": "agroup::+.job", "head-actions": [{"do":"log", "msg":"blah"}], "meta": ["JOB"]},
+        {"name": "agroup::base", "depends_on": ["agroup::other", {"do":"log", "msg":"blah"}], "required_for": ["agroup::after"]},
+        {"name": "agroup::base", "sources": ["agroup::src"], "ctor": "doot.workflow:DootTask", "queue_behaviour": API.QueueMeta_e.reactive},
+        {"name": "agroup::base", "disabled": True},
+        {"name": "agroup::base", "doc": ("a doc", "string"), "version": "0.1", "priority": "5"},
+        {"name": "agroup::base", "doc": None, "generated_names": [TaskName("agroup::other")]},
+        ])
+    def test_trusted_matches_validated(self, data):
+        factory  = TaskFactory()
+        built    = factory.build(dict(data))
+        trusted  = factory.build_trusted(dict(data))
+        self._assert_same(trusted, built)
+
+    def test_trusted_coerces_fields(self):
+        factory  = TaskFactory()
+        trusted  = factory.build_trusted({"name": "agroup::base", "doc": ("a doc",), "priority": "5", "generated_names": [TaskName("agroup::other")]})
+        assert(trusted.doc == ["a doc"])
+        assert(trusted.priority == 5)
+        assert(trusted.generated_names == {TaskName("agroup::other")})
+
+    def test_trusted_rejects_bad_fields(self):
+        factory  = TaskFactory()
+        with pytest.raises(ValidationError):
+            factory.build_trusted({"name": "agroup::base", "priority": "high"})
+
+    @pytest.mark.parametrize(("bot", "top"), [
+        ({"name": "agroup::base", "a": 0, "doc": ["bot doc"]}, {"name": "agroup::top", "b": 0, "priority": 20}),
+        ({"name": "agroup::base", "depends_on": ["agroup::other"], "version": "0.1"}, {"name": "agroup::top", "depends_on": ["agroup::more"], "actions": [{"do":"log", "msg":"blah"}]}),
+        ({"name": "agroup::base", "sources": ["agroup::src"], "meta": ["TRANSFORMER"]}, {"name": "agroup::top", "ctor": "doot.workflow:DootTask", "queue_behaviour": API.QueueMeta_e.reactive}),
+        ])
+    def test_trusted_matches_validated_on_merge(self, mocker, bot, top):
+        factory  = TaskFactory(validate=False)
+        trusted  = mocker.spy(TaskSpec, "trusted")
+        result   = factory.merge(bot=factory.build(bot), top=factory.build(top))
+        trusted.assert_called_once()
+        data     = trusted.call_args.args[-1]
+        self._assert_same(result, factory.build(dict(data)))
+
+    @pytest.mark.parametrize("data", [
+        {"name": "agroup::base", "cleanup": [{"do":"log", "msg":"blah"}], "doc": ["a doc"], "priority": 20},
+        {"name": "agroup::+.job", "head-actions": [{"do":"log", "msg":"blah"}], "cleanup": ["agroup::other"], "meta": ["JOB"]},
+        ])
+    def test_trusted_matches_validated_on_generate(self, data):
+        factory     = TaskFactory(validate=False)
+        subfactory  = SubTaskFactory()
+        spec        = factory.build(data)
+        generated   = subfactory.generate_specs(factory.instantiate(spec))
+        assert(bool(generated))
+        for gen in generated:
+            self._assert_same(factory.build_trusted(dict(gen)), factory.build(dict(gen)))
+
+    def _assert_same(self, trusted:TaskSpec, built:TaskSpec) -> None:
+        assert(type(trusted) is type(built))
+        assert(trusted.model_dump() == built.model_dump())
+        assert(trusted.model_extra == built.model_extra)
+
+    def test_trusted_skips_validation(self, mocker):
+        factory  = TaskFactory(validate=False)
+        valid    = mocker.spy(TaskSpec, "__init__")
+        factory.build_trusted({"name": "agroup::base"})
+        valid.assert_not_called()
+
+    def test_validate_switch(self, mocker):
+        factory  = TaskFactory(validate=True)
+        trusted  = mocker.spy(TaskSpec, "trusted")
+        spec     = factory.build_trusted({"name": "agroup::base"})
+        trusted.assert_not_called()
+        assert(isinstance(spec, TaskSpec))
+
+    def test_merging_specs_is_trusted(self, mocker):
+        factory  = TaskFactory(validate=False)
+        bot      = factory.build({"name": "agroup::base", "a": 0})
+        top      = factory.build({"name": "agroup::top", "b": 0})
+        trusted  = mocker.spy(TaskSpec, "trusted")
+        result   = factory.merge(bot=bot, top=top)
+        trusted.assert_called_once()
+        assert(result.extra.a == 0)
+        assert(result.extra.b == 0)
+
 class TestTaskFactory_Make:
 
     @pytest.fixture(scope="function")
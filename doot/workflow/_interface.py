@@ -314,6 +314,8 @@ class RelationSpec_i(Protocol):
 
     def forward_dir_p(self) -> bool: ...
 
+    def constraint_key(self, control:Task_i|TaskSpec_i) -> tuple[tuple[str, ...], tuple]: ...
+
     def accepts(self, control:Task_i|TaskSpec_i, target:Task_i|TaskSpec_i) -> bool: ...
 
 @runtime_checkable
@@ -397,6 +399,8 @@ class TaskFactory_p(Protocol):
 
     def build(self, data:ChainGuard|dict|TaskName_p|str) -> TaskSpec_i: ...
 
+    def build_trusted(self, data:dict) -> TaskSpec_i: ...
+
     def instantiate(self, obj:TaskSpec_i, *, extra:Maybe[Mapping|bool]=None) -> TaskSpec_i: ...
 
     def merge(self, *, bot:dict|TaskSpec_i, top:dict|TaskSpec_i, suffix:Maybe[str|Literal[False]]=None) -> TaskSpec_i: ...
@@ -12,6 +12,8 @@ from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
 from dataclasses import fields
 import warnings
 import os
+import asyncio
+import inspect
 
 logging = logmod.root
 
@@ -22,6 +24,7 @@ import doot
 from doot.workflow.structs.action_spec import ActionSpec
 from doot.workflow.task import DootTask
 from doot.workflow.actions._action import DootBaseAction
+from doot.workflow.actions.control_flow.control_flow import WaitAction
 
 from jgdv.logging import LogLevel_e
 
@@ -53,3 +56,15 @@ class TestBaseAction:
     @pytest.mark.skip
     def test_todo(self):
         pass
+
+class TestWaitAction:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_returns_awaitable(self):
+        action = WaitAction()
+        spec   = ActionSpec.build({"do":"doot.workflow.actions.control_flow.control_flow:WaitAction", "count":0.01})
+        result = action(spec, {})
+        assert(inspect.isawaitable(result))
+        assert(asyncio.run(result) is None)
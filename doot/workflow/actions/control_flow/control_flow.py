@@ -8,6 +8,7 @@ from __future__ import annotations
 
 # ##-- stdlib imports
 # import abc
+import asyncio
 import datetime
 # import enum
 import functools as ftz
@@ -18,7 +19,6 @@ import re
 import shutil
 import time
 import types
-from time import sleep
 from os import environ
 
 # ##-- end stdlib imports
@@ -210,11 +210,15 @@ class AssertInstalled(DootBaseAction):
         return self.ActRE.FAIL
 
 class WaitAction(DootBaseAction):
-    """ An action that waits for some amount of time """
+    """ An action that waits for some amount of time.
+
+    Returns an awaitable, so the async runner waits without blocking other tasks,
+    and other runners only block the thread running this task.
+    """
 
     @DKeyed.types("count")
     def __call__(self, spec, state, count):
-        sleep(count)
+        return asyncio.sleep(count)
 
 class TriggerActionGroup(DootBaseAction):
     """ Trigger a non-standard action group """
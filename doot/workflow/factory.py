@@ -92,6 +92,8 @@ logging = logmod.getLogger(__name__)
 DEFAULT_ALIAS     : Final[str]             = doot.constants.entrypoints.DEFAULT_TASK_CTOR_ALIAS
 DEFAULT_BLOCKING  : Final[tuple[str, ...]] = ("required_for", "on_fail")
 DEFAULT_RELATION   : Final[RelationMeta_e] = RelationMeta_e.default()
+VALIDATE_SPECS     : Final[bool]           = doot.config.on_fail(False, bool).settings.commands.run.validate_specs() # type: ignore[attr-defined]  # noqa: FBT003
+OVERLAY_BLOCKED    : Final[frozenset[str]] = frozenset(["disabled", API.GROUP_K])
 ##--| Utils
 
 ##--|
@@ -113,8 +115,14 @@ class TaskFactory:
     spec_ctor : type[TaskSpec_i]
     task_ctor : type[Task_p]
     job_ctor  : type[Job_p]
+    validate  : bool
 
-    def __init__(self, *, spec_ctor:Maybe[type]=None, task_ctor:Maybe[type]=None, job_ctor:Maybe[type]=None):
+    def __init__(self, *, spec_ctor:Maybe[type]=None, task_ctor:Maybe[type]=None, job_ctor:Maybe[type]=None, validate:Maybe[bool]=None):
+        match validate:
+            case None:
+                self.validate = VALIDATE_SPECS
+            case bool() as x:
+                self.validate = x
         x : type[Any]
         match spec_ctor:
             case None:
@@ -166,6 +174,21 @@ class TaskFactory:
 
         return result
 
+    def build_trusted(self, data:dict) -> TaskSpec_i:
+        """ Build a spec from internally produced data, skipping pydantic validation.
+        Everything is validated if the factory was created with validate=True,
+        or settings.commands.run.validate_specs is set.
+        """
+        match data:
+            case _ if self.validate:
+                return self.build(data)
+            case dict() if "source" in data:
+                raise ValueError("source is deprecated, use 'sources'", data)
+            case dict() if hasattr(self.spec_ctor, "trusted"):
+                return self.spec_ctor.trusted(data) # type: ignore[attr-defined]
+            case _:
+                return self.build(data)
+
     def delay(self, *, base:TaskName_p, target:TaskName_p, inject:Maybe[InjectSpec_i]=None, applied:Maybe[dict]=None, overrides:dict) -> DelayedSpec:
         """
         Build data structure that the registry will process into a full spec
@@ -182,17 +205,19 @@ class TaskFactory:
     def instantiate(self, obj:TaskSpec_i, *, suffix:Maybe[bool|str]=None, extra:Maybe[Mapping]=None) -> TaskSpec_i:
         """
         Return this spec, copied with a uniq name
+
+        The copy shares the spec's already validated action groups,
+        and plain extra values are overlaid without re-validating.
+        Extra values for fields of the spec go through a full merge.
         """
         result    : TaskSpec_i
-        instance  : TaskSpec_i
-        # TODO use model_copy(update={...})
-        instance      = obj.model_copy()
-        instance.generated_names.clear()
         match extra:
             case None:
-                result = instance
+                result = self._overlay(obj)
+            case dict() if self._can_overlay(obj, extra):
+                result = self._overlay(obj, extra=extra)
             case dict():
-                result = self.merge(bot=instance, top=extra)
+                result = self.merge(bot=self._overlay(obj), top=extra)
             case x:
                 raise TypeError(type(x))
 
@@ -222,6 +247,7 @@ class TaskFactory:
             case TaskSpec_i():
                 top_data = dict(top)
         ##--|
+        trusted         = isinstance(top, TaskSpec_i) and isinstance(bot, TaskSpec_i)
         result          = self._specialize_merge(bot=bot_data, top=top_data)
         match name:
             case TaskName_p():
@@ -230,6 +256,8 @@ class TaskFactory:
                 base_name       = top_data.get('name', None) or bot_data['name']
                 result['name']  = self._prep_name(base_name, suffix=suffix)
         ##--|
+        if trusted:
+            return self.build_trusted(result)
         return self.build(result)
 
     ##--| Task construction
@@ -273,9 +301,14 @@ class TaskFactory:
     def action_group_elements(self, obj:TaskSpec_i) -> Iterable[ActionSpec_i|RelationSpec_i]:
         """ Get the elements of: depends_on, setup, actions, and require_for.
         """
-        groups : Iterable[Iterable] = [obj.depends_on, obj.setup, obj.actions, obj.required_for]
-        for group in groups:
-            yield from group
+        groups : Iterable[Iterable]
+        match obj:
+            case TaskSpec(): # memoized on the spec
+                yield from obj.action_group_elements()
+            case _:
+                groups = [obj.depends_on, obj.setup, obj.actions, obj.required_for]
+                for group in groups:
+                    yield from group
 
     def _specialize_merge(self, *, bot:dict, top:dict) -> dict:
         """
@@ -319,6 +352,41 @@ class TaskFactory:
 
         return specialized
 
+    def _can_overlay(self, obj:TaskSpec_i, extra:Mapping) -> bool:
+        """ Whether extra values can be overlaid onto a copy of a spec, without a merge.
+        ie: none of them are fields of the spec, or change its metadata
+        """
+        fields = type(obj).model_fields # type: ignore[attr-defined]
+        for key in extra:
+            match key.replace(API.DASH_S, API.USCORE_S):
+                case str() as x if x in fields or x in OVERLAY_BLOCKED:
+                    return False
+                case _:
+                    pass
+        else:
+            return True
+
+    def _overlay(self, obj:TaskSpec_i, *, extra:Maybe[Mapping]=None) -> TaskSpec_i:
+        """ Copy a spec, without validation, overlaying extra values.
+
+        The copy shares the spec's action group lists,
+        but has its own metadata and generated names.
+        With extra values, the spec's name is added to the copy's sources, as in a merge
+        """
+        update : dict = {"generated_names": set(), API.META_K: set(obj.meta)}
+        match extra:
+            case None:
+                pass
+            case _:
+                update[API.META_K].difference_update({TaskMeta_e.INTERNAL})
+                if not bool(update[API.META_K]) and (default:=TaskMeta_e.default()):
+                    update[API.META_K].add(default)
+                if obj.name not in obj.sources:
+                    update['sources'] = [*obj.sources, obj.name]
+                update.update({k.replace(API.DASH_S, API.USCORE_S) : v for k,v in extra.items()})
+
+        return obj.model_copy(update=update) # type: ignore[attr-defined]
+
     def _prep_name(self, base:TaskName_p, *, suffix:Maybe[int|str|Literal[False]]=None) -> TaskName_p:
         result : TaskName_p
         ##--|
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, PLR0133
+from __future__ import annotations
+
+import logging as logmod
+import pathlib as pl
+import warnings
+
+import pytest
+
+logging = logmod.root
+
+import doot
+from ..task_name import TaskName
+from ..artifact import TaskArtifact
+from ..parse_cache import parse_cache_info, parse_cache_clear
+
+class TestParseCache:
+
+    def test_sanity(self):
+        assert(True is not False)
+
+    def test_repeated_name_parses_once(self):
+        parse_cache_clear()
+        first = TaskName("cached::a.task")
+        for _ in range(10):
+            assert(TaskName("cached::a.task") is first)
+        else:
+            info = parse_cache_info()
+            assert(info.misses == 1)
+            assert(info.hits == 10)
+
+    def test_generated_uuids_arent_cached(self):
+        parse_cache_clear()
+        first   = TaskName("cached::a.task[<uuid>]")
+        second  = TaskName("cached::a.task[<uuid>]")
+        assert(first.uuid() != second.uuid())
+        assert(parse_cache_info().currsize == 0)
+
+    def test_names_with_args_arent_cached(self):
+        base = TaskName("cached::a.task").to_uniq()
+        parse_cache_clear()
+        copied = TaskName(base)
+        assert(copied.uuid() == base.uuid())
+        assert(parse_cache_info().currsize == 0)
+
+    def test_artifacts_are_copied(self):
+        parse_cache_clear()
+        first   = TaskArtifact("file::>cached/a.txt")
+        second  = TaskArtifact("file::>cached/a.txt")
+        assert(first is not second)
+        assert(first == second)
+        first.priority = 1
+        assert(second.priority != 1)
+        assert(parse_cache_info().hits == 1)
+
+    def test_paths_arent_cached(self):
+        parse_cache_clear()
+        TaskArtifact(pl.Path("cached/a.txt"))
+        assert(parse_cache_info().currsize == 0)
+
+    def test_bounded(self):
+        parse_cache_clear()
+        info = parse_cache_info()
+        for i in range(info.maxsize + 10):
+            TaskName(f"cached::bounded.{i}")
+        else:
+            assert(parse_cache_info().currsize == info.maxsize)
@@ -5,11 +5,13 @@
 # ruff: noqa: ANN202, PLR0133
 from __future__ import annotations
 
+import gc
 import logging as logmod
 import pathlib as pl
 from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
                     Mapping, Match, MutableMapping, Sequence, Tuple, TypeAlias,
                     TypeVar, cast)
+import pickle
 import warnings
 
 from uuid import UUID
@@ -17,7 +19,8 @@ import pytest
 
 import doot
 
-from ..task_name import TaskName
+from ..task_name import TaskName, INTERNED
+from ..parse_cache import parse_cache_clear
 from ...task import DootTask
 
 logging = logmod.root
@@ -107,7 +110,7 @@ class TestTaskName_UUID:
         obj = TaskName("basic::a.b.c")
         inst1 = obj.to_uniq()
         inst2 = TaskName(inst1)
-        assert(inst1 is not inst2)
+        assert(inst1 is inst2) # interned
         assert(inst1.uuid() == inst2.uuid())
         assert(inst1 == inst2)
 
@@ -149,7 +152,7 @@ class TestTaskName_UUID:
         chop  = head.pop_generated()
         assert(base is not head)
         assert(head is not chop)
-        assert(base is not chop)
+        assert(base is chop) # interned
         assert(head.is_head())
         assert(chop.uuid() == base.uuid())
         assert(chop == base)
@@ -166,7 +169,7 @@ class TestTaskName_UUID:
         chop     = cleanup.pop_generated()
         assert(base is not cleanup)
         assert(cleanup is not chop)
-        assert(base is not chop)
+        assert(base is chop) # interned
         assert(cleanup.is_cleanup())
         assert(chop.uuid() == base.uuid())
         assert(chop == base)
@@ -265,3 +268,45 @@ class TestTaskName_StructInteraction:
         sub    = second.push("blah")
         the_set = {first, second}
         assert(sub.pop(top=True) in the_set)
+
+class TestTaskName_Interning:
+
+    def test_sanity(self):
+        assert(True is not False)
+
+    def test_equal_names_are_identical(self):
+        first   = TaskName("agroup::interned.task")
+        second  = TaskName("agroup::interned.task")
+        assert(first is second)
+        assert(first.serial() is not None)
+        assert(first.serial() == second.serial())
+
+    def test_different_names_differ(self):
+        first   = TaskName("agroup::interned.task")
+        second  = TaskName("agroup::interned.other")
+        assert(first is not second)
+        assert(first.serial() != second.serial())
+
+    def test_hash_is_cached(self):
+        name = TaskName("agroup::interned.task").to_uniq()
+        assert(hash(name) == hash(str(name)))
+        assert(hash(name) == name._hash)
+
+    def test_derived_names_are_memoized(self):
+        base  = TaskName("agroup::interned.task").to_uniq()
+        assert(base.de_uniq() is base.de_uniq())
+        assert(base.with_head() is base.with_head())
+        assert(base.with_cleanup() is base.with_cleanup())
+        assert(base.with_head().pop_generated() is base)
+        assert(base[0,:] == "agroup")
+        assert(("getitem", (0, slice(None))) in base._derived)
+
+    def test_pickle_reinterns(self):
+        name = TaskName("agroup::interned.task").to_uniq()
+        assert(pickle.loads(pickle.dumps(name)) is name)
+
+    def test_unused_names_are_dropped(self):
+        key = str(TaskName("agroup::interned.temporary"))
+        parse_cache_clear()
+        gc.collect()
+        assert((TaskName, key) not in INTERNED._names)
@@ -180,3 +180,41 @@ class TestTaskSpec_Validation:
                                })
         assert(len(spec.depends_on) == 1)
         assert(spec.depends_on[0].target == "simple::task..$cleanup$")
+
+class TestTaskSpec_Derived:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_extra_is_memoized(self):
+        spec = factory.build({"name":"simple::test", "a": 2})
+        assert(spec.extra is spec.extra)
+        assert(spec.extra.a == 2)
+
+    def test_extra_cleared_on_assignment(self):
+        spec  = factory.build({"name":"simple::test", "a": 2})
+        first = spec.extra
+        spec.a = 5
+        assert(spec.extra is not first)
+        assert(spec.extra.a == 5)
+
+    def test_hash_follows_name(self):
+        spec      = factory.build({"name":"simple::test"})
+        orig      = hash(spec)
+        spec.name = TaskName("simple::other")
+        assert(hash(spec) != orig)
+        assert(hash(spec) == hash("simple::other"))
+
+    def test_action_group_elements_cleared_on_assignment(self):
+        spec = factory.build({"name":"simple::test", "depends_on": ["simple::other"]})
+        assert(len(list(spec.action_group_elements())) == 1)
+        spec.depends_on = []
+        assert(not bool(list(spec.action_group_elements())))
+
+    def test_copies_dont_share_derived(self):
+        spec  = factory.build({"name":"simple::test", "a": 2})
+        _     = spec.extra
+        inst  = factory.instantiate(spec, extra={"a": 3})
+        assert(inst.extra.a == 3)
+        assert(spec.extra.a == 2)
+        assert(hash(inst) != hash(spec))
@@ -33,6 +33,7 @@ import doot
 import doot.errors
 from .. import _interface as API  # noqa: N812
 from .._interface import ArtifactStatus_e
+from .parse_cache import CachedStrangMeta
 
 # ##-- end 1st party imports
 
@@ -64,7 +65,7 @@ if typing.TYPE_CHECKING:
 logging = logmod.getLogger(__name__)
 ##-- end logging
 
-class TaskArtifact(Location):
+class TaskArtifact(Location, metaclass=CachedStrangMeta):
     """
     A Location, but specialized to represent artifacts/files
       An concrete or abstract artifact a task can produce or consume.
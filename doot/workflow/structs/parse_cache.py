@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+A bounded cache of parsed Strangs, keyed on their class and raw string.
+
+Building a TaskName or TaskArtifact from a string runs the Strang pre-processing,
+section slicing, and word meta data, every time.
+Specs mention the same few names over and over, so a metaclass
+returns the previous result for a string it has seen before.
+
+Only plain strings, with no extra args, are cached.
+Strings which generate a new uuid ('[<uuid>]') are never cached.
+
+Classes which are immutable once built (eg: interned TaskNames) are shared,
+others (eg: TaskArtifacts, which have a priority) get a shallow copy.
+
+"""
+# ruff: noqa:
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import copy
+import datetime
+import enum
+import functools as ftz
+import itertools as itz
+import logging as logmod
+import pathlib as pl
+import re
+import time
+import types
+from uuid import UUID, uuid1
+
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+from jgdv.structs.strang._meta import StrangMeta
+
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+import doot
+import doot.errors
+
+# ##-- end 1st party imports
+
+# # End of Imports.
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from jgdv.structs.strang import Strang_p
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging    = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+PARSE_CACHE_SIZE  : Final[int]  = 4096
+GEN_UUID          : Final[str]  = "<uuid>"
+SHARED_K          : Final[str]  = "_parse_shared"
+##--|
+
+@ftz.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(cls:type, text:str) -> Strang_p:
+    return StrangMeta.__call__(cls, text)
+
+def parse_cache_info() -> ftz._CacheInfo:
+    """ The hits, misses, maxsize and current size of the parse cache """
+    return _parse.cache_info()
+
+def parse_cache_clear() -> None:
+    _parse.cache_clear()
+
+class CachedStrangMeta(StrangMeta):
+    """ A StrangMeta which caches strangs built from plain strings.
+
+    Set the class attribute '_parse_shared' to True if built objects can be shared.
+    """
+
+    @override
+    def __call__[T:Strang_p](cls:type[T], text:str|pl.Path, *args:Any, **kwargs:Any) -> Strang_p:  # noqa: ANN401, N805
+        match text:
+            case str() if type(text) is not str or args or kwargs or GEN_UUID in text:
+                pass
+            case str():
+                result = _parse(cls, text)
+                if getattr(cls, SHARED_K, False):
+                    return result
+                return copy.copy(result)
+            case _:
+                pass
+
+        return super().__call__(text, *args, **kwargs)
@@ -241,6 +241,20 @@ class RelationSpec(BaseModel, Buildable_p, arbitrary_types_allowed=True, metacla
         """ is this relation's direction obj -> target? """
         return self.relation is RelationMeta_e.blocks
 
+    def constraint_key(self, control:Task_i|TaskSpec_i) -> tuple[tuple[str, ...], tuple]:
+        """ The target keys this relation constrains for a control, and the values they must have.
+
+        Constraints the control has no value for are skipped, as in self.accepts.
+        So an instance can only be accepted if its values for the keys equal the values.
+        """
+        control_vals  = self._values_of(control)
+        pairs         = [(targ_k, control_vals[source_k]) for targ_k, source_k in self.constraints.items() if source_k in control_vals]
+        return tuple(x for x,_ in pairs), tuple(y for _,y in pairs)
+
+    @staticmethod
+    def _values_of(obj:Task_i|TaskSpec_i) -> Mapping:
+        return obj.internal_state if isinstance(obj, Task_p) else obj.extra # type: ignore[union-attr]
+
     def accepts(self, control:Task_i|TaskSpec_i, target:Task_i|TaskSpec_i) -> bool:
         """ Test if this pair of Tasks satisfies the relation """
         uuids       = [target.name.uuid(), control.name.uuid()]
@@ -249,8 +263,8 @@ class RelationSpec(BaseModel, Buildable_p, arbitrary_types_allowed=True, metacla
         if (None in uuids or not name_match):
             return False
 
-        control_vals = control.internal_state if isinstance(control, Task_p) else control.extra # type: ignore[union-attr]
-        target_vals  = target.internal_state  if isinstance(target, Task_p) else target.extra # type: ignore[union-attr]
+        control_vals = self._values_of(control)
+        target_vals  = self._values_of(target)
 
         # Check constraints match
         for targ_k,source_k in self.constraints.items():
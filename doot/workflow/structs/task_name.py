@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
 """
+TaskNames, interned so equal names share one canonical object.
+
+The canonical object caches its hash, has a small integer id,
+and memoizes the names derived from it (eg: de_uniq, with_head, slices).
+So the tracker's dicts, keyed by names, compare by identity and don't rebuild strings to hash.
 
 """
 
@@ -37,6 +42,7 @@ import doot.errors
 # ##-- end 1st party imports
 
 from .. import _interface as API # noqa: N812
+from .parse_cache import CachedStrangMeta
 
 # ##-- types
 # isort: off
@@ -69,8 +75,9 @@ if TYPE_CHECKING:
 ##-- logging
 logging = logmod.getLogger(__name__)
 ##-- end logging
-DEFAULT_SEP   : Final[str] = doot.constants.patterns.TASK_SEP # type: ignore[attr-defined]
-TASKS_PREFIX  : Final[str] = "tasks."
+DEFAULT_SEP   : Final[str]             = doot.constants.patterns.TASK_SEP # type: ignore[attr-defined]
+TASKS_PREFIX  : Final[str]             = "tasks."
+CACHE_SLOTS   : Final[tuple[str, ...]] = ("_hash", "_serial", "_derived")
 
 ##--|
 
@@ -125,6 +132,50 @@ TASKSECTIONS : Final[StrangAPI.Sections_d] = StrangAPI.Sections_d(
 )
 ##--|
 
+class _InternTable:
+    """ The canonical TaskName of each full name.
+    Held weakly, so names no longer used anywhere are dropped.
+    Serials are only unique within a process.
+    """
+
+    _names   : weakref.WeakValueDictionary[tuple[type, str], TaskName]
+    _serial  : Iterator[int]
+
+    def __init__(self) -> None:
+        self._names   = weakref.WeakValueDictionary()
+        self._serial  = itz.count()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern[T:TaskName](self, name:T) -> T:
+        """ Get the canonical object for a name, making this name canonical if it is new """
+        full  = str(name)
+        key   = (type(name), full)
+        match self._names.get(key, None):
+            case None:
+                pass
+            case existing:
+                return cast("T", existing)
+
+        name._hash     = str.__hash__(full)
+        name._serial   = next(self._serial)
+        name._derived  = {}
+        self._names[key] = name
+        return name
+
+INTERNED : Final[_InternTable] = _InternTable()
+
+def _unpickle[T:TaskName](cls:type[T], text:str, state:dict) -> T:
+    """ Rebuild a pickled TaskName, and intern it in this process """
+    obj = cls.__new__(cls, text)
+    for key, val in state.items():
+        setattr(obj, key, val)
+    else:
+        return INTERNED.intern(obj)
+
+##--|
+
 class TaskNameProcessor[T:API.TaskName_p](StrangBasicProcessor):
 
     @override
@@ -142,6 +193,12 @@ class TaskNameProcessor[T:API.TaskName_p](StrangBasicProcessor):
 
         return super().pre_process(cls, cleaned, *args, strict=strict, **kwargs)
 
+    @override
+    def post_process(self, obj:T, data:PostInstanceData) -> Maybe[T]:
+        """ Once fully built, swap the name for its canonical object """
+        obj = super().post_process(obj, data) or obj
+        return INTERNED.intern(obj)
+
     @override
     def _implicit_mark(self, val:str, *, sec:StrangAPI.Sec_d, data:dict, index:int, maxcount:int) -> Maybe[StrangAPI.StrangMarkAbstract_e]:
         """ Builds certain marks that are not in the form $mark$.
@@ -165,14 +222,83 @@ class TaskNameProcessor[T:API.TaskName_p](StrangBasicProcessor):
         return marks(val)
 
 @Proto(API.TaskName_p, StrangAPI.Strang_p)
-class TaskName(Strang):
+class TaskName(Strang, metaclass=CachedStrangMeta):
     """
       A Task Name.
+
+    Constructing a name returns the canonical object for it,
+    see _InternTable.
     """
-    __slots__              = ()
-    Marks      : ClassVar  = TaskNameBodyMarks_e
-    _processor : ClassVar  = TaskNameProcessor()
-    _sections  : ClassVar  = TASKSECTIONS
+    __slots__                  = ("__weakref__", *CACHE_SLOTS)
+    _parse_shared  : ClassVar  = True
+    Marks          : ClassVar  = TaskNameBodyMarks_e
+    _processor     : ClassVar  = TaskNameProcessor()
+    _sections      : ClassVar  = TASKSECTIONS
+
+    _hash      : int
+    _serial    : int
+    _derived   : dict[Hashable, Any]
+
+    ##--| dunders
+
+    @override
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            # Not interned yet
+            return super().__hash__()
+
+    @override
+    def __eq__(self, other:object) -> bool:
+        return other is self or super().__eq__(other)
+
+    @override
+    def __ne__(self, other:object) -> bool:
+        return not self == other
+
+    @override
+    def __getitem__(self, args:StrangAPI.ItemIndex) -> str: # type: ignore[override]
+        try:
+            return self._memo(("getitem", args), ftz.partial(super().__getitem__, args))
+        except TypeError:
+            # Unhashable args
+            return super().__getitem__(args)
+
+    @override
+    def __reduce__(self) -> tuple:
+        state = {x:getattr(self, x) for x in ("data", "meta") if hasattr(self, x)}
+        return _unpickle, (type(self), str.__str__(self), state)
+
+    ##--| interning
+
+    def serial(self) -> Maybe[int]:
+        """ The small integer id of an interned name """
+        return getattr(self, "_serial", None)
+
+    def _memo(self, key:Hashable, fn:Callable[[], Any]) -> Any:  # noqa: ANN401
+        """ Get a derived value, computing it once per interned name """
+        try:
+            derived = self._derived
+        except AttributeError:
+            return fn()
+
+        match derived.get(key, derived):
+            case x if x is derived:
+                result = derived[key] = fn()
+                return result
+            case x:
+                return x
+
+    ##--| derived names
+
+    @override
+    def de_uniq(self) -> Self:
+        return self._memo("de_uniq", super().de_uniq)
+
+    @override
+    def pop(self, *, top:bool=True) -> Self:
+        return self._memo(("pop", top), ftz.partial(super().pop, top=top))
 
     def with_cleanup(self) -> Self:
         """
@@ -183,7 +309,7 @@ class TaskName(Strang):
         # if not self.uuid():
         #     raise ValueError("adding $cleanup$ to a task name requires a uuid in the base", self[:])
 
-        return self.push(TaskNameBodyMarks_e.cleanup, uuid=self.uuid())
+        return self._memo("cleanup", lambda: self.push(TaskNameBodyMarks_e.cleanup, uuid=self.uuid()))
 
     def with_head(self) -> Self:
         """ generate a $head$ task name, carrying the uuid along with it """
@@ -192,7 +318,7 @@ class TaskName(Strang):
         # if not self.uuid():
         #     raise ValueError("Adding $head$ to a task name requires a uuid in the base", self[:])
 
-        return self.push(TaskNameBodyMarks_e.head, uuid=self.uuid())
+        return self._memo("head", lambda: self.push(TaskNameBodyMarks_e.head, uuid=self.uuid()))
 
     def is_cleanup(self) -> bool:
         return TaskNameBodyMarks_e.cleanup in self
@@ -205,5 +331,8 @@ class TaskName(Strang):
             return self
 
         assert(self.uuid())
+        return self._memo("pop_generated", self._pop_generated)
+
+    def _pop_generated(self) -> Self:
         base = self.pop(top=False)
         return type(self)(f"{base}[<uuid>]", uuid=self.uuid())
@@ -62,7 +62,7 @@ from typing import Protocol, runtime_checkable
 # Typing Decorators:
 from typing import no_type_check, final, overload
 from dataclasses import _MISSING_TYPE, InitVar, dataclass, field, fields
-from pydantic import (BaseModel, BeforeValidator, Field, ValidationError,
+from pydantic import (BaseModel, BeforeValidator, Field, PrivateAttr, TypeAdapter, ValidationError,
                       ValidationInfo, ValidatorFunctionWrapHandler, ConfigDict,
                       WrapValidator, field_validator, model_validator)
 # need to be outside of TYPE_CHECKING for pydantic
@@ -90,6 +90,10 @@ logging = logmod.getLogger(__name__)
 DEFAULT_ALIAS     : Final[str]             = doot.constants.entrypoints.DEFAULT_TASK_CTOR_ALIAS
 DEFAULT_BLOCKING  : Final[tuple[str, ...]] = tuple(["required_for", "on_fail"])
 DEFAULT_RELATION   : Final[RelationMeta_e] = RelationMeta_e.default()
+HASH_K            : Final[str]             = "hash"
+EXTRA_K           : Final[str]             = "extra"
+ELEMENTS_K        : Final[str]             = "elements"
+ACTION_GROUPS     : Final[frozenset[str]]  = frozenset(["actions", "required_for", "depends_on", "setup", "cleanup", "on_fail"])
 ##--| Utils
 
 def _action_group_sort_key(val:ActionSpec_i|RelationSpec_i) -> Any:
@@ -295,6 +299,8 @@ class TaskSpec(BaseModel, arbitrary_types_allowed=True, extra="allow"): # type:
     # task specific estate
     ##--|
     _transform  : Maybe[Literal[False]|tuple[RelationSpec, RelationSpec]]  = None
+    # memoized views of fields, cleared when a field is assigned
+    _derived    : dict[str, Any]                                           = PrivateAttr(default_factory=dict)
 
    ##--| validators
 
@@ -433,15 +439,72 @@ class TaskSpec(BaseModel, arbitrary_types_allowed=True, extra="allow"): # type:
 
         return self
 
+    ##--| constructors
+    @classmethod
+    def trusted(cls, data:Mapping) -> Self:
+        """ Build a spec from internally produced data, without pydantic validation.
+
+        The field validators' conversions are applied directly,
+        action groups only build the elements which aren't already specs,
+        other fields are coerced to their type as pydantic would,
+        and the metadata invariants are applied as in validation.
+        """
+        cleaned : dict = cls._convert_toml_keys(dict(data))
+        for key, val in cleaned.items():
+            match key:
+                case API.NAME_K:
+                    cleaned[key] = cls._validate_name(val)
+                case API.META_K:
+                    cleaned[key] = cls._validate_meta(val)
+                case "ctor":
+                    cleaned[key] = cls._validate_ctor(val)
+                case "queue_behaviour":
+                    cleaned[key] = cls._validate_queue_behaviour(val)
+                case "sources":
+                    cleaned[key] = cls._validate_sources(val)
+                case x if x in ACTION_GROUPS:
+                    relation     = RelationMeta_e.blocks if x in cls._blocking_groups else RelationMeta_e.needs
+                    cleaned[key] = sorted(_raw_data_to_specs(val or [], relation=relation), key=_action_group_sort_key)
+                case x if x in cls.model_fields:
+                    cleaned[key] = cls._field_adapter(x).validate_python(val)
+                case _:
+                    pass
+        else:
+            return cls.model_construct(**cleaned)._validate_metadata()
+
+    @classmethod
+    @ftz.cache
+    def _field_adapter(cls, key:str) -> TypeAdapter:
+        """ A validator for a single field's type, for trusted construction """
+        return TypeAdapter(cls.model_fields[key].annotation, config=ConfigDict(arbitrary_types_allowed=True))
+
     ##--| dunders
     @override
     def __hash__(self) -> int:
-        return hash(str(self.name))
+        return self._memo(HASH_K, lambda: hash(str(self.name)))
+
+    @override
+    def __setattr__(self, name:str, value:Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith(API.USCORE_S):
+            self._clear_derived()
+
+    @override
+    def __getstate__(self) -> dict[Any, Any]:
+        """ Memoized views aren't pickled """
+        state = super().__getstate__()
+        match state.get("__pydantic_private__", None):
+            case dict() as private:
+                state["__pydantic_private__"] = {**private, "_derived": {}}
+            case _:
+                pass
+
+        return state
 
     ##--| properties
     @property
     def extra(self) -> ChainGuard:
-        return ChainGuard(self.model_extra)
+        return self._memo(EXTRA_K, lambda: ChainGuard(self.model_extra))
 
     @property
     def action_groups(self) -> list[list]:
@@ -464,10 +527,29 @@ class TaskSpec(BaseModel, arbitrary_types_allowed=True, extra="allow"): # type:
         """ Get the elements of: depends_on, setup, actions, and require_for.
           *never* cleanup, which generates its own task
         """
-        queue = [self.depends_on, self.setup, self.actions, self.required_for]
+        elements = self._memo(ELEMENTS_K, lambda: tuple(itz.chain(self.depends_on, self.setup, self.actions, self.required_for)))
+        yield from elements
 
-        for group in queue:
-            yield from group
+    @override
+    def model_copy(self, *, update:Maybe[Mapping[str, Any]]=None, deep:bool=False) -> Self:
+        """ Copies don't share the memoized views of the original """
+        result = super().model_copy(update=update, deep=deep)
+        result._derived = {}
+        return result
+
+    def _memo[T](self, key:str, fn:Callable[[], T]) -> T:
+        """ Get a memoized view of the spec, computing it if necessary """
+        cache = self._derived
+        if key not in cache:
+            cache[key] = fn()
+        return cache[key]
+
+    def _clear_derived(self) -> None:
+        match getattr(self, "__pydantic_private__", None):
+            case {"_derived": dict() as cache}:
+                cache.clear()
+            case _:
+                pass
 
     def param_specs(self) -> list:
         result = []